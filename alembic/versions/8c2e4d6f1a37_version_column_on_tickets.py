@@ -0,0 +1,27 @@
+"""version column on tickets
+
+Revision ID: 8c2e4d6f1a37
+Revises: 5b1f3c7a9e20
+Create Date: 2026-10-19 10:03:17.220941
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8c2e4d6f1a37"
+down_revision: Union[str, None] = "5b1f3c7a9e20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("tickets", sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column("tickets", "version")
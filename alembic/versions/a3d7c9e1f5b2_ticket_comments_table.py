@@ -0,0 +1,69 @@
+"""ticket comments table
+
+Revision ID: a3d7c9e1f5b2
+Revises: f8c3a9d2e6b1
+Create Date: 2026-10-19 18:04:51.273916
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3d7c9e1f5b2"
+down_revision: Union[str, None] = "f8c3a9d2e6b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SNIPPET_LENGTH = 120
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ticket_comments",
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuid_generate_v7()"), nullable=False),
+        sa.Column("ticket_id", sa.UUID(), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("author", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_ticket_comments_ticket_id_created_at", "ticket_comments", ["ticket_id", "created_at"], unique=False)
+    op.add_column("tickets", sa.Column("comment_count", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("tickets_archive", sa.Column("comment_count", sa.Integer(), server_default="0", nullable=False))
+
+    for table in ("tickets", "tickets_archive"):
+        op.execute(
+            f"""
+            INSERT INTO ticket_comments (ticket_id, body, author, created_at)
+            SELECT id, comment, comment_user, coalesce(updated_at, created_at, now()) FROM {table} WHERE comment IS NOT NULL
+            """
+        )
+        op.execute(
+            f"""
+            UPDATE {table} SET
+                comment_count = 1,
+                comment = CASE WHEN length(comment) > {SNIPPET_LENGTH} THEN left(comment, {SNIPPET_LENGTH - 3}) || '...' ELSE comment END
+            WHERE comment IS NOT NULL
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in ("tickets", "tickets_archive"):
+        op.execute(
+            f"""
+            UPDATE {table} t SET comment = c.body, comment_user = c.author
+            FROM (
+                SELECT DISTINCT ON (ticket_id) ticket_id, body, author FROM ticket_comments ORDER BY ticket_id, created_at DESC, id DESC
+            ) c
+            WHERE c.ticket_id = t.id
+            """
+        )
+    op.drop_column("tickets_archive", "comment_count")
+    op.drop_column("tickets", "comment_count")
+    op.drop_index("ix_ticket_comments_ticket_id_created_at", table_name="ticket_comments")
+    op.drop_table("ticket_comments")
@@ -0,0 +1,39 @@
+"""token revocations table
+
+Revision ID: a6e4d2c8f0b3
+Revises: f2c9a6d8b1e4
+Create Date: 2026-10-19 14:05:12.730194
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6e4d2c8f0b3"
+down_revision: Union[str, None] = "f2c9a6d8b1e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "token_revocations",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column("jti", sa.String(), nullable=True),
+        sa.Column("user_id", sa.UUID(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_token_revocations_expires_at"), "token_revocations", ["expires_at"], unique=False)
+    op.create_index("ix_users_inactive", "users", ["id"], unique=False, postgresql_where=sa.text("active IS false"))
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_inactive", table_name="users", postgresql_where=sa.text("active IS false"))
+    op.drop_index(op.f("ix_token_revocations_expires_at"), table_name="token_revocations")
+    op.drop_table("token_revocations")
@@ -0,0 +1,33 @@
+"""user search indexes
+
+Revision ID: b7f5e3a1d9c2
+Revises: a6e4d2c8f0b3
+Create Date: 2026-10-19 14:52:48.319025
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7f5e3a1d9c2"
+down_revision: Union[str, None] = "a6e4d2c8f0b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_users_username_id", "users", ["username", "id"], unique=False)
+    op.create_index("ix_users_username_prefix", "users", [sa.text("lower(username) text_pattern_ops")], unique=False)
+    op.create_index("ix_users_name_prefix", "users", [sa.text("lower(name) text_pattern_ops")], unique=False)
+    op.create_index("ix_users_email_prefix", "users", [sa.text("lower(email) text_pattern_ops")], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_email_prefix", table_name="users")
+    op.drop_index("ix_users_name_prefix", table_name="users")
+    op.drop_index("ix_users_username_prefix", table_name="users")
+    op.drop_index("ix_users_username_id", table_name="users")
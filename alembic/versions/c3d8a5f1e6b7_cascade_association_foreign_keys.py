@@ -0,0 +1,38 @@
+"""cascade association foreign keys
+
+Revision ID: c3d8a5f1e6b7
+Revises: b7f5e3a1d9c2
+Create Date: 2026-10-19 15:20:37.604118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d8a5f1e6b7"
+down_revision: Union[str, None] = "b7f5e3a1d9c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FOREIGN_KEYS = [
+    ("subcategories_category_id_fkey", "subcategories", "categories", "category_id"),
+    ("ticket_categories_category_id_fkey", "ticket_categories", "categories", "category_id"),
+    ("ticket_categories_ticket_id_fkey", "ticket_categories", "tickets", "ticket_id"),
+    ("ticket_subcategories_subcategory_id_fkey", "ticket_subcategories", "subcategories", "subcategory_id"),
+    ("ticket_subcategories_ticket_id_fkey", "ticket_subcategories", "tickets", "ticket_id"),
+]
+
+
+def upgrade() -> None:
+    for name, source, referent, column in FOREIGN_KEYS:
+        op.drop_constraint(name, source, type_="foreignkey")
+        op.create_foreign_key(name, source, referent, [column], ["id"], ondelete="CASCADE")
+
+
+def downgrade() -> None:
+    for name, source, referent, column in FOREIGN_KEYS:
+        op.drop_constraint(name, source, type_="foreignkey")
+        op.create_foreign_key(name, source, referent, [column], ["id"])
@@ -0,0 +1,40 @@
+"""ticket events outbox
+
+Revision ID: d41a7b9c3e58
+Revises: 8c2e4d6f1a37
+Create Date: 2026-10-19 11:26:05.914330
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d41a7b9c3e58"
+down_revision: Union[str, None] = "8c2e4d6f1a37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ticket_events",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column("txid", sa.BigInteger(), server_default=sa.text("pg_current_xact_id()::text::bigint"), nullable=False),
+        sa.Column("ticket_id", sa.UUID(), nullable=False),
+        sa.Column("event_type", sa.String(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=True),
+        sa.Column("data", postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'{}'::jsonb"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_ticket_events_txid_id", "ticket_events", ["txid", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ticket_events_txid_id", table_name="ticket_events")
+    op.drop_table("ticket_events")
@@ -0,0 +1,81 @@
+"""uuid7 ticket keys
+
+Revision ID: d9a4c7e2b5f8
+Revises: c3d8a5f1e6b7
+Create Date: 2026-10-19 15:48:12.275903
+
+Adds a ``uuid_generate_v7()`` function and makes it the default of ``tickets.id``. Existing tickets keep
+their random keys unless the migration runs with ``alembic -x rekey_tickets=true upgrade head``, which
+assigns each ticket a UUIDv7 derived from its ``created_at`` and rewrites the association, outbox and
+idempotency rows that refer to it. Re-keying changes public ticket ids, so run it in a maintenance window.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d9a4c7e2b5f8"
+down_revision: Union[str, None] = "c3d8a5f1e6b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TICKET_FOREIGN_KEYS = [
+    ("ticket_categories_ticket_id_fkey", "ticket_categories"),
+    ("ticket_subcategories_ticket_id_fkey", "ticket_subcategories"),
+]
+
+
+def rekey_tickets() -> None:
+    """Replace the keys of existing tickets with UUIDv7 values ordered by creation time."""
+    op.execute(
+        "CREATE TEMPORARY TABLE ticket_rekey ON COMMIT DROP AS "
+        "SELECT id AS old_id, uuid_generate_v7(coalesce(created_at, now())) AS new_id FROM tickets"
+    )
+    op.execute("CREATE UNIQUE INDEX ON ticket_rekey (old_id)")
+    for name, source in TICKET_FOREIGN_KEYS:
+        op.drop_constraint(name, source, type_="foreignkey")
+
+    op.execute("UPDATE tickets t SET id = r.new_id FROM ticket_rekey r WHERE t.id = r.old_id")
+    for table in ("ticket_categories", "ticket_subcategories", "ticket_events"):
+        op.execute(f"UPDATE {table} a SET ticket_id = r.new_id FROM ticket_rekey r WHERE a.ticket_id = r.old_id")
+    op.execute(
+        "UPDATE idempotency_keys k SET response = jsonb_set(k.response, '{id}', to_jsonb(r.new_id::text)) "
+        "FROM ticket_rekey r WHERE k.scope = 'tickets' AND k.response->>'id' = r.old_id::text"
+    )
+
+    for name, source in TICKET_FOREIGN_KEYS:
+        op.create_foreign_key(name, source, "tickets", ["ticket_id"], ["id"], ondelete="CASCADE")
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7(ts timestamptz DEFAULT clock_timestamp()) RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(int8send(floor(extract(epoch FROM ts) * 1000)::bigint) FROM 3) FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+    op.execute("ALTER TABLE tickets ALTER COLUMN id SET DEFAULT uuid_generate_v7()")
+
+    if context.get_x_argument(as_dictionary=True).get("rekey_tickets", "").lower() in ("1", "true", "yes"):
+        rekey_tickets()
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE tickets ALTER COLUMN id DROP DEFAULT")
+    op.execute("DROP FUNCTION uuid_generate_v7(timestamptz)")
@@ -0,0 +1,47 @@
+"""tickets archive table
+
+Revision ID: e5b2f8c1a7d3
+Revises: d9a4c7e2b5f8
+Create Date: 2026-10-19 16:34:51.068217
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b2f8c1a7d3"
+down_revision: Union[str, None] = "d9a4c7e2b5f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tickets_archive",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("severity_id", sa.UUID(), nullable=False),
+        sa.Column("status", postgresql.ENUM(name="ticketstatus", create_type=False), nullable=False),
+        sa.Column("comment", sa.Text(), nullable=True),
+        sa.Column("comment_user", sa.String(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("category_ids", postgresql.ARRAY(sa.UUID()), server_default="{}", nullable=False),
+        sa.Column("subcategory_ids", postgresql.ARRAY(sa.UUID()), server_default="{}", nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["severity_id"], ["severity.id"]),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.execute("CREATE TABLE tickets_archive_default PARTITION OF tickets_archive DEFAULT")
+
+
+def downgrade() -> None:
+    op.drop_table("tickets_archive")
@@ -0,0 +1,34 @@
+"""backfill ticket events
+
+Revision ID: e7b3f1a2c4d9
+Revises: d41a7b9c3e58
+Create Date: 2026-10-19 12:41:52.107316
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b3f1a2c4d9"
+down_revision: Union[str, None] = "d41a7b9c3e58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        INSERT INTO ticket_events (ticket_id, event_type, version)
+        SELECT t.id, 'created', t.version
+        FROM tickets t
+        WHERE NOT EXISTS (SELECT 1 FROM ticket_events e WHERE e.ticket_id = t.id)
+        ORDER BY t.created_at
+        """
+    )
+
+
+def downgrade() -> None:
+    pass
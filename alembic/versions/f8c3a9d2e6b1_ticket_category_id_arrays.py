@@ -0,0 +1,45 @@
+"""ticket category id arrays
+
+Revision ID: f8c3a9d2e6b1
+Revises: e5b2f8c1a7d3
+Create Date: 2026-10-19 17:12:26.481539
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f8c3a9d2e6b1"
+down_revision: Union[str, None] = "e5b2f8c1a7d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("tickets", sa.Column("category_ids", postgresql.ARRAY(sa.UUID()), server_default="{}", nullable=False))
+    op.add_column("tickets", sa.Column("subcategory_ids", postgresql.ARRAY(sa.UUID()), server_default="{}", nullable=False))
+    op.execute(
+        """
+        UPDATE tickets t SET
+            category_ids = ARRAY(SELECT tc.category_id FROM ticket_categories tc WHERE tc.ticket_id = t.id),
+            subcategory_ids = ARRAY(SELECT ts.subcategory_id FROM ticket_subcategories ts WHERE ts.ticket_id = t.id)
+        """
+    )
+    op.create_index("ix_tickets_category_ids", "tickets", ["category_ids"], unique=False, postgresql_using="gin")
+    op.create_index("ix_tickets_subcategory_ids", "tickets", ["subcategory_ids"], unique=False, postgresql_using="gin")
+    op.create_index("ix_tickets_archive_category_ids", "tickets_archive", ["category_ids"], unique=False, postgresql_using="gin")
+    op.create_index("ix_tickets_archive_subcategory_ids", "tickets_archive", ["subcategory_ids"], unique=False, postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tickets_archive_subcategory_ids", table_name="tickets_archive")
+    op.drop_index("ix_tickets_archive_category_ids", table_name="tickets_archive")
+    op.drop_index("ix_tickets_subcategory_ids", table_name="tickets")
+    op.drop_index("ix_tickets_category_ids", table_name="tickets")
+    op.drop_column("tickets", "subcategory_ids")
+    op.drop_column("tickets", "category_ids")
@@ -9,6 +9,7 @@ from app.api.v1.routers.tickets import router as ticket_router
 from app.api.v1.routers.severities import router as severity_router
 from app.api.v1.routers.categories import router as category_router
 from app.api.v1.routers.subcategories import router as subcategory_router
+from app.api.v1.routers.debug import router as debug_router
 
 router = APIRouter(prefix="/api/v1")
 
@@ -19,3 +20,4 @@ router.include_router(ticket_router)
 router.include_router(severity_router)
 router.include_router(category_router)
 router.include_router(subcategory_router)
+router.include_router(debug_router)
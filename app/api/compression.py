@@ -0,0 +1,167 @@
+"""Negotiated gzip/brotli compression of API responses."""
+
+import os
+from typing import Optional
+from fastapi import Request, Response, status
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.compression.encodings import IDENTITY, StreamCompressor, compress, negotiate_encoding
+from app.infrastructure.cache import ReferenceDocument
+
+COMPRESSION_MINIMUM_SIZE = int(os.environ.get("COMPRESSION_MINIMUM_SIZE", "1024"))
+COMPRESSIBLE_TYPES = ("application/json", "application/javascript", "application/xml", "text/")
+UNCOMPRESSED_TYPES = ("text/event-stream",)
+
+
+def _add_vary(headers: MutableHeaders):
+    vary = headers.get("vary")
+    if not vary:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+def _weaken_etag(headers: MutableHeaders):
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with the best coding the client accepts, brotli or gzip.
+
+    Complete bodies smaller than ``minimum_size`` are sent as they are. Streamed bodies are compressed
+    chunk by chunk and flushed after each one, so clients receive every chunk without delay. Responses that
+    already carry a Content-Encoding (such as the precompressed reference lists), event streams and
+    non-textual content types are passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MINIMUM_SIZE):
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            minimum_size (int): The smallest complete body, in bytes, worth compressing.
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Compress the response of an HTTP request if the client accepts a supported coding."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding == IDENTITY:
+            await self.app(scope, receive, send)
+            return
+
+        await CompressionResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class CompressionResponder:
+    """
+    Compress the response of a single request.
+    """
+
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int):
+        """
+        Initialize the responder.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            encoding (str): The negotiated coding, "br" or "gzip".
+            minimum_size (int): The smallest complete body, in bytes, worth compressing.
+        """
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Optional[Send] = None
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[StreamCompressor] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Run the application, intercepting its response messages."""
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    def _compressible(self, headers: MutableHeaders) -> bool:
+        content_type = headers.get("content-type", "").lower()
+        return (
+            "content-encoding" not in headers
+            and content_type.startswith(COMPRESSIBLE_TYPES)
+            and not content_type.startswith(UNCOMPRESSED_TYPES)
+            and self.start_message["status"] not in (status.HTTP_204_NO_CONTENT, status.HTTP_304_NOT_MODIFIED)
+        )
+
+    async def send_with_compression(self, message: Message):
+        """
+        Forward a response message, compressing the body if the response qualifies.
+
+        Args:
+            message (Message): The ASGI message sent by the application.
+        """
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is not None:
+            chunk = self.compressor.compress(body)
+            if not more_body:
+                chunk += self.compressor.finish()
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        if not self._compressible(headers) or (not more_body and len(body) < self.minimum_size):
+            self.passthrough = True
+            await self.send(self.start_message)
+            await self.send(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        _add_vary(headers)
+        _weaken_etag(headers)
+        if more_body:
+            del headers["Content-Length"]
+            self.compressor = StreamCompressor(self.encoding)
+            body = self.compressor.compress(body)
+        else:
+            body = compress(body, self.encoding)
+            headers["Content-Length"] = str(len(body))
+        await self.send(self.start_message)
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+
+def reference_response(request: Request, document: ReferenceDocument) -> Response:
+    """
+    Build the response for a cached reference list in the coding the client accepts.
+
+    The body was compressed when the document was cached, so no compression happens per request, and a
+    request whose If-None-Match matches the document gets an empty 304.
+
+    Args:
+        request (Request): The incoming request.
+        document (ReferenceDocument): The cached document.
+
+    Returns:
+        Response: The JSON response.
+    """
+    headers = {"ETag": document.etag, "Vary": "Accept-Encoding"}
+    if request.headers.get("if-none-match") == document.etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if encoding != IDENTITY:
+        headers["Content-Encoding"] = encoding
+    return Response(content=document.bodies[encoding], media_type="application/json", headers=headers)
@@ -0,0 +1,70 @@
+"""Request spans: the root of every trace, continuing a W3C ``traceparent`` sent by the client or a proxy."""
+
+import re
+from typing import Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core import request_id_var, tracer
+
+TRACEPARENT_HEADER = "traceparent"
+VALID_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+def parse_traceparent(value: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Read the trace and parent span IDs from a ``traceparent`` header.
+
+    Args:
+        value (Optional[str]): The header value, or None if it was not sent.
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: The trace ID and the parent span ID, or Nones if the header is
+        missing, malformed or carries the all-zero IDs.
+    """
+    match = VALID_TRACEPARENT.match((value or "").strip().lower())
+    if not match or set(match.group(1)) == {"0"} or set(match.group(2)) == {"0"}:
+        return None, None
+    return match.group(1), match.group(2)
+
+
+class TracingMiddleware:
+    """
+    Run every request within a root span named after its route, e.g. ``GET /api/v1/tickets/{ticket_id}``.
+
+    The span records the route, status code and request ID, and its ``traceparent`` is returned in the
+    response so the trace can be looked up on the debug endpoint.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Run the request within its span."""
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        trace_id, parent_span_id = parse_traceparent(Headers(scope=scope).get(TRACEPARENT_HEADER))
+        attributes = {"http.method": scope["method"], "http.target": scope["path"], "request_id": request_id_var.get()}
+
+        with tracer.start_as_current_span(f"{scope['method']} {scope['path']}", attributes, trace_id=trace_id, parent_span_id=parent_span_id) as span:
+
+            async def send_with_traceparent(message: Message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    MutableHeaders(scope=message)[TRACEPARENT_HEADER] = f"00-{span.trace_id}-{span.span_id}-01"
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_traceparent)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    span.name = f"{scope['method']} {route.path}"
+                    span.set_attribute("http.route", route.path)
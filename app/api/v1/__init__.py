@@ -13,4 +13,6 @@ from .controllers import (
     get_category_controller,
     SubcategoryController,
     get_subcategory_controller,
+    RefreshTokenController,
+    get_refresh_token_controller,
 )
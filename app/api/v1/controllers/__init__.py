@@ -2,6 +2,8 @@
 This module provides controllers for managing users, tickets. severity, categories and subcategories.
 """
 
+from .idempotency_controller import IdempotencyController
+from .refresh_token_controller import RefreshTokenController, get_refresh_token_controller
 from .users_controller import UserController, get_user_controller
 from .ticket_controller import TicketController, get_ticket_controller
 from .severity_controller import SeverityController, get_severity_controller
@@ -1,16 +1,144 @@
 """Controllers for managing category operations in the database related to Ticket API endpoints."""
 
-from typing import List
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 import logging
-from pydantic import UUID4
-from sqlalchemy.orm import Session
+import os
+import threading
+import time
+from pydantic import UUID4, TypeAdapter
+from sqlalchemy import func, literal, select, text, union_all
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException, status, Depends
-from app.infrastructure import get_db, Category
-from app.schemas import CategoryUpdate as SchemaCategoryUpdate, CategoryShow as SchemaCategoryShow, Category as SchemaCategory
+from app.core import TicketStatus
+from app.infrastructure import get_db, Category, Subcategory, Ticket, TicketCategory, TicketSubcategory
+from app.infrastructure.cache import ReferenceDocument, reference_document_cache, ticket_document_cache
+from app.infrastructure.events import TICKET_EVENTS_CHANNEL, NotificationListener, notification_listener
+from app.schemas import (
+    CategoryUpdate as SchemaCategoryUpdate,
+    CategoryShow as SchemaCategoryShow,
+    Category as SchemaCategory,
+    CategoryTree as SchemaCategoryTree,
+    SubcategoryNode as SchemaSubcategoryNode,
+)
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
+
+TICKET_COUNTS_CACHE_SECONDS = float(os.environ.get("TICKET_COUNTS_CACHE_SECONDS", "30"))
+CATEGORY_INCLUDES = {"subcategories", "counts"}
+CATEGORY_TREE = TypeAdapter(List[SchemaCategoryTree])
+
+TicketCounts = Dict[Tuple[str, UUID4], Tuple[int, int]]
+
+REMOVE_FROM_TICKETS_SQL = text(
+    """
+    WITH updated AS (
+        UPDATE tickets SET
+            category_ids = ARRAY(
+                SELECT c FROM unnest(category_ids) WITH ORDINALITY AS a(c, n) WHERE c <> ALL(CAST(:category_ids AS uuid[])) ORDER BY n
+            ),
+            subcategory_ids = ARRAY(
+                SELECT s FROM unnest(subcategory_ids) WITH ORDINALITY AS a(s, n) WHERE s <> ALL(CAST(:subcategory_ids AS uuid[])) ORDER BY n
+            ),
+            version = version + 1,
+            updated_at = now()
+        WHERE category_ids && CAST(:category_ids AS uuid[]) OR subcategory_ids && CAST(:subcategory_ids AS uuid[])
+        RETURNING id, version, category_ids, subcategory_ids
+    )
+    INSERT INTO ticket_events (ticket_id, event_type, version, data)
+    SELECT id, 'updated', version, jsonb_build_object('category_ids', category_ids, 'subcategory_ids', subcategory_ids) FROM updated
+    RETURNING id, ticket_id
+    """
+)
+
+
+class TicketCountsCache:
+    """
+    Process-wide cache of the per-category and per-subcategory ticket counts.
+
+    Every ticket change records an event and notifies the ticket events channel in its transaction; each process
+    drops its counts when the notification arrives, and when the listener reconnects. Changes made by this process
+    also invalidate the counts right after commit. ``TICKET_COUNTS_CACHE_SECONDS`` still bounds how long counts are
+    reused, should a notification be lost.
+    """
+
+    def __init__(self, ttl: float, listener: NotificationListener):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl (float): The number of seconds the counts are reused for.
+            listener (NotificationListener): The listener providing the ticket event notifications.
+        """
+        self.ttl = ttl
+        self.listener = listener
+        self._lock = threading.Lock()
+        self._counts: Optional[TicketCounts] = None
+        self._expires_at = 0.0
+        self._sequence = 0
+        self._started = False
+
+    def get(self, db: Session) -> TicketCounts:
+        """
+        Get the ticket counts, querying them if the cached ones expired.
+
+        Counts queried while an invalidation arrived are returned but not stored.
+
+        Args:
+            db (Session): The database session.
+
+        Returns:
+            TicketCounts: The (open, total) ticket counts keyed by ("category" | "subcategory", node ID).
+        """
+        if not self._started:
+            self._start()
+        with self._lock:
+            if self._counts is not None and time.monotonic() < self._expires_at:
+                return self._counts
+            token = self._sequence
+
+        open_tickets = Ticket.status != TicketStatus.RESOLVIDO
+        category_counts = (
+            select(
+                literal("category").label("kind"),
+                TicketCategory.category_id.label("node_id"),
+                func.count().label("total"),
+                func.count().filter(open_tickets).label("open"),
+            )
+            .join(Ticket, Ticket.id == TicketCategory.ticket_id)
+            .group_by(TicketCategory.category_id)
+        )
+        subcategory_counts = (
+            select(literal("subcategory"), TicketSubcategory.subcategory_id, func.count(), func.count().filter(open_tickets))
+            .join(Ticket, Ticket.id == TicketSubcategory.ticket_id)
+            .group_by(TicketSubcategory.subcategory_id)
+        )
+        counts = {(row.kind, row.node_id): (row.open, row.total) for row in db.execute(union_all(category_counts, subcategory_counts))}
+
+        with self._lock:
+            if self._sequence == token:
+                self._counts = counts
+                self._expires_at = time.monotonic() + self.ttl
+        return counts
+
+    def invalidate(self):
+        """Drop the cached counts so the next request queries them again."""
+        with self._lock:
+            self._sequence += 1
+            self._counts = None
+
+    def _start(self):
+        with self._lock:
+            start = not self._started
+            self._started = True
+        if start:
+            self.listener.subscribe(TICKET_EVENTS_CHANNEL, self._on_notification)
+
+    def _on_notification(self, _payload: Optional[str]):
+        self.invalidate()
+
+
+ticket_counts_cache = TicketCountsCache(TICKET_COUNTS_CACHE_SECONDS, notification_listener)
 
 
 class CategoryController:
@@ -27,20 +155,73 @@ class CategoryController:
         """
         self.db = db
 
-    def get_all(self) -> List[SchemaCategoryShow]:
+    def get_all(self, include: Optional[Set[str]] = None) -> List[SchemaCategoryTree]:
         """
-        Get all categories.
+        Get all categories, as a tree with their subcategories and ticket counts if requested.
+
+        Subcategories are loaded with a single extra query, and the ticket counts of every node come from
+        one cached aggregate query.
+
+        Args:
+            include (Optional[Set[str]]): What to embed: "subcategories" and/or "counts". Defaults to subcategories only.
 
         Returns:
-            List[SchemaCategoryShow]: A list of category objects.
+            List[SchemaCategoryTree]: A list of category objects.
 
         Raises:
-            HTTPException: Raised if no categories are found.
+            HTTPException: Raised if an include is unknown or no categories are found.
         """
-        categories = self.db.query(Category).all()
+        include = {"subcategories"} if include is None else include
+        unknown = include - CATEGORY_INCLUDES
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown include '{', '.join(sorted(unknown))}'. Expected any of: {', '.join(sorted(CATEGORY_INCLUDES))}.",
+            )
+
+        query = self.db.query(Category).order_by(Category.name)
+        if "subcategories" in include:
+            query = query.options(selectinload(Category.subcategories))
+        categories = query.all()
         if not categories:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No categories found")
-        return categories
+
+        counts = ticket_counts_cache.get(self.db) if "counts" in include else None
+        tree = []
+        for category in categories:
+            node = SchemaCategoryTree(id=category.id, name=category.name)
+            if "subcategories" in include:
+                node.subcategories = [self._subcategory_node(subcategory, counts) for subcategory in category.subcategories]
+            if counts is not None:
+                node.open_tickets, node.total_tickets = counts.get(("category", category.id), (0, 0))
+            tree.append(node)
+        return tree
+
+    def get_all_document(self, include: Optional[Set[str]] = None) -> ReferenceDocument:
+        """
+        Get all categories as cached, precompressed JSON. Ticket counts change too often to be cached this way,
+        so ``include`` must not contain "counts".
+
+        Args:
+            include (Optional[Set[str]]): What to embed: "subcategories" or nothing. Defaults to subcategories.
+
+        Returns:
+            ReferenceDocument: The rendered list of category objects, without null fields.
+
+        Raises:
+            HTTPException: Raised if an include is unknown or no categories are found.
+        """
+        include = {"subcategories"} if include is None else include
+        return reference_document_cache.get_or_render(
+            "categories?include=" + ",".join(sorted(include)), lambda: CATEGORY_TREE.dump_json(self.get_all(include), exclude_none=True)
+        )
+
+    @staticmethod
+    def _subcategory_node(subcategory, counts: Optional[TicketCounts]) -> SchemaSubcategoryNode:
+        node = SchemaSubcategoryNode.model_validate(subcategory)
+        if counts is not None:
+            node.open_tickets, node.total_tickets = counts.get(("subcategory", subcategory.id), (0, 0))
+        return node
 
     def create(self, request: SchemaCategory) -> SchemaCategoryShow:
         """
@@ -71,7 +252,9 @@ class CategoryController:
             new_category = Category(name=request.name)
 
             self.db.add(new_category)
+            reference_document_cache.notify(self.db)
             self.db.commit()
+            reference_document_cache.invalidate()
             self.db.refresh(new_category)
 
             return new_category
@@ -133,10 +316,18 @@ class CategoryController:
                         detail=f"A category with name '{request.name}' already exists.",
                     )
 
+            ticket_ids = []
+            if request.name and request.name != category.name:
+                ticket_ids = self.db.scalars(select(Ticket.id).where(Ticket.category_ids.contains([category_id]))).all()
+                ticket_document_cache.notify(self.db, ticket_ids)
+
             for key, value in request.model_dump(exclude_unset=True).items():
                 setattr(category, key, value)
 
+            reference_document_cache.notify(self.db)
             self.db.commit()
+            reference_document_cache.invalidate()
+            ticket_document_cache.invalidate(ticket_ids)
             self.db.refresh(category)
             return category
         except SQLAlchemyError as e:
@@ -150,6 +341,10 @@ class CategoryController:
         """
         Delete a category by category UUID.
 
+        Its subcategories and ticket associations are removed by the database through ON DELETE CASCADE, and
+        their IDs are removed from the ``category_ids``/``subcategory_ids`` arrays of the tickets, which records
+        an update of each of them.
+
         Args:
             category_id (UUID4): The ID of the category to be deleted.
 
@@ -160,12 +355,17 @@ class CategoryController:
             HTTPException: Raised if the category with the provided ID is not found.
         """
         try:
-            category = self.db.query(Category).filter(Category.id == category_id).first()
-            if not category:
+            subcategory_ids = self.db.scalars(select(Subcategory.id).where(Subcategory.category_id == category_id)).all()
+            ticket_ids = remove_from_tickets(self.db, [category_id], subcategory_ids)
+
+            deleted = self.db.query(Category).filter(Category.id == category_id).delete(synchronize_session=False)
+            if not deleted:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Category {category_id} not found")
 
-            self.db.delete(category)
+            reference_document_cache.notify(self.db)
             self.db.commit()
+            reference_document_cache.invalidate()
+            ticket_document_cache.invalidate(ticket_ids)
             return f"Category {category_id} deleted."
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -175,6 +375,35 @@ class CategoryController:
             ) from e
 
 
+def remove_from_tickets(db: Session, category_ids: Sequence[UUID4], subcategory_ids: Sequence[UUID4]) -> List[UUID4]:
+    """
+    Remove categories and subcategories from the tickets that have them, as an update of each ticket.
+
+    One statement rewrites the ``category_ids``/``subcategory_ids`` arrays, bumps the version of the tickets
+    and records their "updated" events; listeners and the document caches are notified on commit.
+
+    Args:
+        db (Session): The database session.
+        category_ids (Sequence[UUID4]): The categories to remove.
+        subcategory_ids (Sequence[UUID4]): The subcategories to remove.
+
+    Returns:
+        List[UUID4]: The IDs of the updated tickets.
+    """
+    rows = db.execute(
+        REMOVE_FROM_TICKETS_SQL,
+        {
+            "category_ids": [str(category_id) for category_id in category_ids],
+            "subcategory_ids": [str(subcategory_id) for subcategory_id in subcategory_ids],
+        },
+    ).all()
+    ticket_ids = [row.ticket_id for row in rows]
+    if rows:
+        db.execute(select(func.pg_notify(TICKET_EVENTS_CHANNEL, str(max(row.id for row in rows)))))
+        ticket_document_cache.notify(db, ticket_ids)
+    return ticket_ids
+
+
 def get_category_controller(db: Session = Depends(get_db)):
     """
     Dependency to get an instance of CategoryController.
@@ -0,0 +1,122 @@
+"""Controllers for storing and replaying responses of requests sent with an Idempotency-Key header."""
+
+import hashlib
+import hmac
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from app.core.auth.jwt_token import SECRET_KEY
+from app.infrastructure import IdempotencyKey
+
+IDEMPOTENCY_KEY_TTL_HOURS = int(os.environ.get("IDEMPOTENCY_KEY_TTL_HOURS", "24"))
+
+
+class IdempotencyController:
+    """
+    A controller class for idempotent request handling.
+
+    The stored response is written in the same transaction as the resource it describes, so a retry either
+    finds the committed response or races on the primary key and never produces a second resource. Keys are
+    scoped to the caller that sent them, so a caller can never replay another caller's response.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize the IdempotencyController with a database session.
+
+        Args:
+            db (Session): The database session.
+        """
+        self.db = db
+
+    @staticmethod
+    def fingerprint(request: BaseModel) -> str:
+        """
+        Compute a stable fingerprint of a request payload.
+
+        The payload may hold secrets such as a new user's password, so the digest is keyed with the app
+        secret: it cannot be reversed with a dictionary attack by someone who can only read the table.
+
+        Args:
+            request (BaseModel): The request body.
+
+        Returns:
+            str: The hex HMAC-SHA-256 digest of the serialized payload.
+        """
+        return hmac.new(SECRET_KEY.encode(), request.model_dump_json().encode(), hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def scope(resource: str, owner: str) -> str:
+        """
+        Build the scope of the keys a caller sends for a resource.
+
+        Args:
+            resource (str): The resource the keys create, e.g. "tickets".
+            owner (str): The ID of the caller sending the keys.
+
+        Returns:
+            str: The scope.
+        """
+        return f"{resource}:{owner}"
+
+    def replay(self, scope: str, key: str, request: BaseModel) -> Optional[dict]:
+        """
+        Look up the stored response for an idempotency key.
+
+        Args:
+            scope (str): The resource and caller the key belongs to, see ``scope``.
+            key (str): The client-supplied idempotency key.
+            request (BaseModel): The current request body.
+
+        Returns:
+            Optional[dict]: The stored response body, or None if the key is unused or expired.
+
+        Raises:
+            HTTPException: Raised if the key was already used with a different payload.
+        """
+        record = self.db.get(IdempotencyKey, (scope, key))
+        if not record or record.expires_at <= datetime.now(timezone.utc):
+            return None
+
+        if record.request_hash != self.fingerprint(request):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used with a different request payload.",
+            )
+        return record.response
+
+    def remember(self, scope: str, key: str, request: BaseModel, response: dict):
+        """
+        Stage the response of a request so retries can replay it.
+
+        The record is only added to the session; it is committed together with the caller's transaction.
+
+        Args:
+            scope (str): The resource and caller the key belongs to, see ``scope``.
+            key (str): The client-supplied idempotency key.
+            request (BaseModel): The request body.
+            response (dict): The JSON-serializable response body.
+        """
+        self.db.merge(
+            IdempotencyKey(
+                scope=scope,
+                key=key,
+                request_hash=self.fingerprint(request),
+                response=response,
+                expires_at=datetime.now(timezone.utc) + timedelta(hours=IDEMPOTENCY_KEY_TTL_HOURS),
+            )
+        )
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired idempotency keys, run by the ``purge_expired`` maintenance script.
+
+        Returns:
+            int: The number of deleted keys.
+        """
+        deleted = self.db.query(IdempotencyKey).filter(IdempotencyKey.expires_at <= datetime.now(timezone.utc)).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
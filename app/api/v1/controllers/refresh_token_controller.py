@@ -0,0 +1,181 @@
+"""Controllers for issuing, rotating and revoking refresh tokens."""
+
+import hashlib
+import logging
+import os
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status, Depends
+from app.infrastructure import get_db, RefreshToken, TokenRevocation, User
+from app.infrastructure.events import revocation_set
+from app.schemas import TokenData as SchemaTokenData
+
+logger = logging.getLogger(__name__)
+
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.environ.get("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+
+
+class RefreshTokenController:
+    """
+    A controller class for the rotating refresh token flow.
+
+    Refreshing an access token costs one indexed lookup of the token digest instead of a password hash
+    verification. Each refresh token can be used once; reusing a rotated token revokes its whole family.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize the RefreshTokenController with a database session.
+
+        Args:
+            db (Session): The database session.
+        """
+        self.db = db
+
+    @staticmethod
+    def digest(token: str) -> str:
+        """
+        Compute the stored digest of a refresh token.
+
+        The tokens are random 256-bit values, so a fast unsalted hash is enough to keep them unusable
+        if the table leaks.
+
+        Args:
+            token (str): The opaque refresh token.
+
+        Returns:
+            str: The hex SHA-256 digest of the token.
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def issue(self, user: User, family_id: Optional[uuid.UUID] = None) -> str:
+        """
+        Stage a new refresh token for a user.
+
+        The token is only added to the session; it is committed together with the caller's transaction.
+
+        Args:
+            user (User): The user the token is issued to.
+            family_id (Optional[uuid.UUID]): The family of the rotated token, or None to start a new one at login.
+
+        Returns:
+            str: The opaque refresh token, returned to the client and never stored.
+        """
+        token = secrets.token_urlsafe(32)
+        self.db.add(
+            RefreshToken(
+                token_hash=self.digest(token),
+                family_id=family_id or uuid.uuid4(),
+                user_id=user.id,
+                expires_at=datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+            )
+        )
+        return token
+
+    def rotate(self, token: str) -> Tuple[User, str]:
+        """
+        Exchange a refresh token for a new one.
+
+        Args:
+            token (str): The refresh token presented by the client.
+
+        Returns:
+            Tuple[User, str]: The token's user and the new refresh token.
+
+        Raises:
+            HTTPException: Raised if the token is unknown, expired, already used or its user is inactive.
+        """
+        record = self.db.query(RefreshToken).filter(RefreshToken.token_hash == self.digest(token)).with_for_update().first()
+        if not record:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+
+        now = datetime.now(timezone.utc)
+        if record.revoked_at is not None:
+            logger.warning("Refresh token reuse detected for user %s, revoking token family %s", record.user_id, record.family_id)
+            self.revoke_family(record.family_id)
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+
+        if record.expires_at <= now:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token expired")
+
+        user = self.db.get(User, record.user_id)
+        if not user or not user.active:
+            self.revoke_family(record.family_id)
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive user")
+
+        record.revoked_at = now
+        new_token = self.issue(user, record.family_id)
+        self.db.commit()
+        return user, new_token
+
+    def revoke_family(self, family_id: uuid.UUID) -> int:
+        """
+        Revoke every unused token of a family.
+
+        Args:
+            family_id (uuid.UUID): The token family to revoke.
+
+        Returns:
+            int: The number of revoked tokens.
+        """
+        revoked = (
+            self.db.query(RefreshToken)
+            .filter(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .update({RefreshToken.revoked_at: datetime.now(timezone.utc)}, synchronize_session=False)
+        )
+        self.db.commit()
+        return revoked
+
+    def logout(self, current_user: SchemaTokenData, refresh_token: Optional[str] = None):
+        """
+        Revoke the current access token and, if given, the family of a refresh token of the same user.
+
+        Args:
+            current_user (SchemaTokenData): The data of the access token used for the request.
+            refresh_token (Optional[str]): The refresh token the client holds.
+        """
+        revocation = None
+        if current_user.jti and current_user.expires_at:
+            revocation = {"jti": current_user.jti, "expires_at": current_user.expires_at.isoformat()}
+            self.db.add(TokenRevocation(jti=current_user.jti, user_id=current_user.id, expires_at=current_user.expires_at))
+            revocation_set.notify(self.db, revocation)
+
+        if refresh_token:
+            record = self.db.query(RefreshToken).filter(RefreshToken.token_hash == self.digest(refresh_token)).first()
+            if record and record.user_id == current_user.id:
+                self.db.query(RefreshToken).filter(RefreshToken.family_id == record.family_id, RefreshToken.revoked_at.is_(None)).update(
+                    {RefreshToken.revoked_at: datetime.now(timezone.utc)}, synchronize_session=False
+                )
+
+        self.db.commit()
+        if revocation:
+            revocation_set.apply(revocation)
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired refresh tokens; run by ``app.scripts.maintenance.purge_expired``.
+
+        Rotated tokens are kept until they expire so that their reuse still revokes their family.
+
+        Returns:
+            int: The number of deleted tokens.
+        """
+        deleted = self.db.query(RefreshToken).filter(RefreshToken.expires_at <= datetime.now(timezone.utc)).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
+
+
+def get_refresh_token_controller(db: Session = Depends(get_db)):
+    """
+    Dependency to get an instance of RefreshTokenController.
+
+    Args:
+        db (Session): The database session.
+
+    Returns:
+        RefreshTokenController: An instance of RefreshTokenController.
+    """
+    return RefreshTokenController(db=db)
@@ -2,15 +2,18 @@
 
 from typing import List
 import logging
-from pydantic import UUID4
+from pydantic import UUID4, TypeAdapter
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException, status, Depends
-from app.infrastructure import get_db, Severity
+from app.infrastructure import get_db, Severity, Ticket
+from app.infrastructure.cache import ReferenceDocument, reference_document_cache, ticket_document_cache
 from app.schemas import SeverityUpdate as SchemaSeverityUpdate, SeverityShow as SchemaSeverityShow, Severity as SchemaSeverity
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
+
+SEVERITY_LIST = TypeAdapter(List[SchemaSeverityShow])
 
 
 class SeverityController:
@@ -42,6 +45,18 @@ class SeverityController:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No severity levels found")
         return severities
 
+    def get_all_document(self) -> ReferenceDocument:
+        """
+        Get all severity levels as cached, precompressed JSON.
+
+        Returns:
+            ReferenceDocument: The rendered list of severity objects.
+
+        Raises:
+            HTTPException: Raised if no severity levels are found.
+        """
+        return reference_document_cache.get_or_render("severities", lambda: SEVERITY_LIST.dump_json(SEVERITY_LIST.validate_python(self.get_all())))
+
     def create(self, request: SchemaSeverity) -> SchemaSeverityShow:
         """
         Create a new severity level.
@@ -72,7 +87,9 @@ class SeverityController:
             new_severity = Severity(level=request.level, description=request.description)
 
             self.db.add(new_severity)
+            reference_document_cache.notify(self.db)
             self.db.commit()
+            reference_document_cache.invalidate()
             self.db.refresh(new_severity)
 
             return new_severity
@@ -134,10 +151,19 @@ class SeverityController:
                         detail=f"A severity with level '{request.level}' already exists.",
                     )
 
-            for key, value in request.dict(exclude_unset=True).items():
+            changes = request.dict(exclude_unset=True)
+            ticket_ids = []
+            if any(getattr(severity, key) != value for key, value in changes.items()):
+                ticket_ids = self.db.scalars(select(Ticket.id).where(Ticket.severity_id == severity_id)).all()
+                ticket_document_cache.notify(self.db, ticket_ids)
+
+            for key, value in changes.items():
                 setattr(severity, key, value)
 
+            reference_document_cache.notify(self.db)
             self.db.commit()
+            reference_document_cache.invalidate()
+            ticket_document_cache.invalidate(ticket_ids)
             self.db.refresh(severity)
             return severity
         except SQLAlchemyError as e:
@@ -166,7 +192,9 @@ class SeverityController:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Severity {severity_id} not found")
 
             self.db.delete(severity)
+            reference_document_cache.notify(self.db)
             self.db.commit()
+            reference_document_cache.invalidate()
             return f"Severity {severity_id} deleted."
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -2,15 +2,19 @@
 
 from typing import List
 import logging
-from pydantic import UUID4
+from pydantic import UUID4, TypeAdapter
 from fastapi import HTTPException, status, Depends
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from app.schemas import Subcategory as SchemaSubcategory, SubcategoryUpdate as SchemaSubcategoryUpdate, SubcategoryShow as SchemaSubcategoryShow
-from app.infrastructure import Subcategory, get_db
+from app.infrastructure import Subcategory, Ticket, get_db
+from app.infrastructure.cache import ReferenceDocument, reference_document_cache, ticket_document_cache
+from .category_controller import remove_from_tickets
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
+
+SUBCATEGORY_LIST = TypeAdapter(List[SchemaSubcategoryShow])
 
 
 class SubcategoryController:
@@ -36,6 +40,17 @@ class SubcategoryController:
         """
         return self.db.query(Subcategory).all()
 
+    def get_all_document(self) -> ReferenceDocument:
+        """
+        Retrieve all subcategories as cached, precompressed JSON.
+
+        Returns:
+            ReferenceDocument: The rendered list of subcategory objects.
+        """
+        return reference_document_cache.get_or_render(
+            "subcategories", lambda: SUBCATEGORY_LIST.dump_json(SUBCATEGORY_LIST.validate_python(self.get_all()))
+        )
+
     def create(self, request: SchemaSubcategory) -> SchemaSubcategoryShow:
         """
         Create a new subcategory.
@@ -60,7 +75,9 @@ class SubcategoryController:
             new_subcategory = Subcategory(name=request.name, category_id=request.category_id)
 
             self.db.add(new_subcategory)
+            reference_document_cache.notify(self.db)
             self.db.commit()
+            reference_document_cache.invalidate()
             self.db.refresh(new_subcategory)
 
             return new_subcategory
@@ -144,10 +161,19 @@ class SubcategoryController:
                         detail=f"A subcategory with name '{request.name}' already exists under this category.",
                     )
 
-            for key, value in request.model_dump(exclude_unset=True).items():
+            changes = request.model_dump(exclude_unset=True)
+            ticket_ids = []
+            if any(getattr(subcategory, key) != value for key, value in changes.items()):
+                ticket_ids = self.db.scalars(select(Ticket.id).where(Ticket.subcategory_ids.contains([subcategory_id]))).all()
+                ticket_document_cache.notify(self.db, ticket_ids)
+
+            for key, value in changes.items():
                 setattr(subcategory, key, value)
 
+            reference_document_cache.notify(self.db)
             self.db.commit()
+            reference_document_cache.invalidate()
+            ticket_document_cache.invalidate(ticket_ids)
             self.db.refresh(subcategory)
             return subcategory
         except SQLAlchemyError as e:
@@ -161,6 +187,9 @@ class SubcategoryController:
         """
         Delete a subcategory by its ID.
 
+        Its ticket associations are removed by the database through ON DELETE CASCADE, and its ID is removed
+        from the ``subcategory_ids`` array of the tickets, which records an update of each of them.
+
         Args:
             subcategory_id (UUID4): The ID of the subcategory to delete.
 
@@ -171,15 +200,19 @@ class SubcategoryController:
             HTTPException: If the subcategory is not found.
         """
         try:
-            subcategory = self.db.query(Subcategory).filter(Subcategory.id == subcategory_id).first()
-            if not subcategory:
+            ticket_ids = remove_from_tickets(self.db, [], [subcategory_id])
+
+            deleted = self.db.query(Subcategory).filter(Subcategory.id == subcategory_id).delete(synchronize_session=False)
+            if not deleted:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Subcategory {subcategory_id} not found",
                 )
 
-            self.db.delete(subcategory)
+            reference_document_cache.notify(self.db)
             self.db.commit()
+            reference_document_cache.invalidate()
+            ticket_document_cache.invalidate(ticket_ids)
             return f"Subcategory {subcategory_id} deleted successfully."
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -1,21 +1,84 @@
 """Controllers for managing ticket operations in the database related to Ticket API endpoints."""
 
-from typing import List
+from typing import List, Optional, Tuple, Union
+from datetime import datetime
+import base64
+import json
 import logging
-from pydantic import UUID4
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+import uuid
+from sqlalchemy import bindparam, delete, func, select, text, tuple_
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException, status, Depends
-from app.infrastructure import get_db, Ticket, Category, Subcategory, Severity, TicketSubcategory, TicketCategory
-from app.schemas import TicketUpdate as SchemaTicketUpdate, TicketShow as SchemaTicketShow, Ticket as SchemaTicket, SeverityShow as SchemaSeverity
+from app.core import UUID4or7, traced_methods, uuid7
+from app.infrastructure import (
+    get_db,
+    Ticket,
+    Category,
+    Subcategory,
+    Severity,
+    TicketSubcategory,
+    TicketCategory,
+    TicketEvent,
+    TicketArchive,
+    TicketComment,
+)
+from app.infrastructure.cache import ticket_document_cache
+from app.infrastructure.events import TICKET_EVENTS_CHANNEL, events_after, latest_cursor, parse_cursor
+from app.schemas import (
+    TicketUpdate as SchemaTicketUpdate,
+    TicketShow as SchemaTicketShow,
+    Ticket as SchemaTicket,
+    SeverityShow as SchemaSeverity,
+    TicketChange as SchemaTicketChange,
+    TicketChanges as SchemaTicketChanges,
+    TicketListQuery as SchemaTicketListQuery,
+    TicketCommentShow as SchemaTicketCommentShow,
+    TicketCommentListQuery as SchemaTicketCommentListQuery,
+    TicketCommentBatch as SchemaTicketCommentBatch,
+)
 from app.scripts import External
+from .idempotency_controller import IdempotencyController
+from .category_controller import ticket_counts_cache
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
 JSONPLACEHOLDER_URL = "https://jsonplaceholder.typicode.com"
+IDEMPOTENCY_SCOPE = "tickets"
+EVENT_BACKLOG_LIMIT = 1000
+COMMENT_SNIPPET_LENGTH = 120
 
+CATEGORIES_BY_IDS = select(Category).where(Category.id.in_(bindparam("ids", expanding=True)))
+SUBCATEGORIES_BY_IDS = select(Subcategory).where(Subcategory.id.in_(bindparam("ids", expanding=True)))
+TICKETS_BY_IDS = select(Ticket).where(Ticket.id.in_(bindparam("ids", expanding=True)))
+ARCHIVED_TICKET_BY_ID = select(TicketArchive).where(TicketArchive.id == bindparam("id"))
+TICKET_BY_TITLE = select(Ticket.id).where(Ticket.title == bindparam("title")).limit(1)
 
+COMMENT_BATCH_SQL = text(
+    """
+    WITH input AS (
+        SELECT * FROM unnest(
+            CAST(:ticket_ids AS uuid[]), CAST(:comment_ids AS uuid[]), CAST(:bodies AS text[]), CAST(:snippets AS text[]), CAST(:authors AS text[])
+        ) AS i(ticket_id, comment_id, body, snippet, author)
+    ), updated AS (
+        UPDATE tickets t SET
+            comment = i.snippet, comment_user = i.author, comment_count = t.comment_count + 1, version = t.version + 1, updated_at = now()
+        FROM input i
+        WHERE t.id = i.ticket_id
+        RETURNING t.id, t.version, i.comment_id, i.body, i.author
+    ), comments AS (
+        INSERT INTO ticket_comments (id, ticket_id, body, author)
+        SELECT comment_id, id, body, author FROM updated
+    )
+    INSERT INTO ticket_events (ticket_id, event_type, version, data)
+    SELECT id, 'commented', version, jsonb_build_object('comment_id', comment_id, 'comment', body, 'comment_user', author) FROM updated
+    RETURNING id, ticket_id
+    """
+)
+
+
+@traced_methods
 class TicketController:
     """
     A controller class for managing ticket operations in the database.
@@ -29,81 +92,70 @@ class TicketController:
             db (Session): The database session.
         """
         self.db = db
+        self.idempotency = IdempotencyController(db)
 
-    def get_all(self) -> List[SchemaTicketShow]:
+    def get_all(self, request: SchemaTicketListQuery) -> List[SchemaTicketShow]:
         """
-        Get all tickets.
+        Get all tickets, optionally only those in a category or subcategory.
+
+        The category and subcategory filters are containment tests on the GIN-indexed ``category_ids`` and
+        ``subcategory_ids`` arrays, so they need no join through the association tables.
+
+        Args:
+            request (SchemaTicketListQuery): Whether to include archived tickets and the optional filters.
 
         Returns:
-            List[SchemaTicketShow]: A list of ticket objects.
+            List[SchemaTicketShow]: A list of ticket objects, live tickets first.
 
         Raises:
-            HTTPException: Raised if no tickets are found.
+            HTTPException: Raised if there are no tickets at all.
         """
-        tickets = self.db.query(Ticket).all()
-        if not tickets:
+        models = [Ticket, TicketArchive] if request.include_archived else [Ticket]
+        tickets = []
+        for model in models:
+            query = self.db.query(model).options(selectinload(model.severity))
+            if request.category_id:
+                query = query.filter(model.category_ids.contains([request.category_id]))
+            if request.subcategory_id:
+                query = query.filter(model.subcategory_ids.contains([request.subcategory_id]))
+            tickets.extend(self._load_tickets(query.all()))
+
+        if not tickets and not (request.category_id or request.subcategory_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No tickets found")
-        return [self._load_categories_and_subcategories(ticket) for ticket in tickets]
+        return tickets
 
-    def create(self, request: SchemaTicket) -> SchemaTicketShow:
+    def create(self, request: SchemaTicket, idempotency_key: Optional[str] = None, caller_id: Optional[str] = None) -> SchemaTicketShow:
         """
         Create a new ticket.
-        """
-        try:
-            required_fields = [request.title, request.category_ids, request.severity_id]
-            if not all(required_fields):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Title, category_ids, and severity_id must be filled",
-                )
 
-            severity = self.db.query(Severity).filter(Severity.id == request.severity_id).first()
-            if not severity:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Severity with ID '{request.severity_id}' not found.",
-                )
-            if severity.level == 1:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Cannot create a ticket with severity level 1.",
-                )
-
-            categories = self.db.query(Category).filter(Category.id.in_(request.category_ids)).all()
-            if len(categories) != len(request.category_ids):
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="One or more categories not found.",
-                )
+        Args:
+            request (SchemaTicket): The request containing details of the new ticket.
+            idempotency_key (Optional[str]): Client-supplied key; a retry with the same key replays the first response.
+            caller_id (Optional[str]): The ID of the user sending the request, the idempotency key is scoped to it.
 
-            subcategories = []
-            if request.subcategory_ids:
-                subcategories = self.db.query(Subcategory).filter(Subcategory.id.in_(request.subcategory_ids)).all()
-                if len(subcategories) != len(request.subcategory_ids):
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail="One or more subcategories not found.",
-                    )
+        Returns:
+            SchemaTicketShow: The newly created ticket.
 
-                for subcategory in subcategories:
-                    if subcategory.category_id not in request.category_ids:
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail=f"Subcategory '{subcategory.name}' does not belong to the provided categories.",
-                        )
+        Raises:
+            HTTPException: Raised if any field is invalid, a ticket with the same title already exists
+                or the idempotency key was used with a different payload.
+        """
+        scope = self.idempotency.scope(IDEMPOTENCY_SCOPE, caller_id)
+        if idempotency_key:
+            stored_ticket = self.idempotency.replay(scope, idempotency_key, request)
+            if stored_ticket is not None:
+                return SchemaTicketShow.model_validate(stored_ticket)
 
-            existing_ticket = self.db.query(Ticket).filter(Ticket.title == request.title).first()
-            if existing_ticket:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f"Ticket with title '{request.title}' already exists.",
-                )
+        try:
+            categories, subcategories = self._validate_create_request(request)
 
             new_ticket = Ticket(
                 title=request.title,
                 description=request.description,
                 severity_id=request.severity_id,
                 status=request.status,
+                category_ids=[category.id for category in categories],
+                subcategory_ids=[subcategory.id for subcategory in subcategories],
             )
 
             for category in categories:
@@ -115,11 +167,28 @@ class TicketController:
                 self.db.add(ticket_subcategory)
 
             self.db.add(new_ticket)
+            self.db.flush()
+
+            ticket_data = self._load_categories_and_subcategories(new_ticket)
+            self._record_event(new_ticket, "created", ticket_data.model_dump(mode="json"))
+            if idempotency_key:
+                self.idempotency.remember(scope, idempotency_key, request, ticket_data.model_dump(mode="json"))
+
             self.db.commit()
-            self.db.refresh(new_ticket)
+            ticket_counts_cache.invalidate()
 
-            return self._load_categories_and_subcategories(new_ticket)
+            return ticket_data
 
+        except IntegrityError as e:
+            self.db.rollback()
+            stored_ticket = self.idempotency.replay(scope, idempotency_key, request) if idempotency_key else None
+            if stored_ticket is not None:
+                return SchemaTicketShow.model_validate(stored_ticket)
+            logger.error("Error creating ticket: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="An error occurred while creating the ticket. Please try again.",
+            ) from e
         except SQLAlchemyError as e:
             self.db.rollback()
             logger.error("Error creating ticket: %s", e)
@@ -128,12 +197,76 @@ class TicketController:
                 detail="An error occurred while creating the ticket. Please try again.",
             ) from e
 
-    def show(self, ticket_id: UUID4) -> SchemaTicketShow:
+    def _validate_create_request(self, request: SchemaTicket) -> Tuple[List[Category], List[Subcategory]]:
+        """
+        Validate a ticket creation request against the database.
+
+        Args:
+            request (SchemaTicket): The request containing details of the new ticket.
+
+        Returns:
+            Tuple[List[Category], List[Subcategory]]: The categories and subcategories referenced by the request.
+
+        Raises:
+            HTTPException: Raised if any field is invalid or a ticket with the same title already exists.
+        """
+        required_fields = [request.title, request.category_ids, request.severity_id]
+        if not all(required_fields):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Title, category_ids, and severity_id must be filled",
+            )
+
+        severity = self.db.get(Severity, request.severity_id)
+        if not severity:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Severity with ID '{request.severity_id}' not found.",
+            )
+        if severity.level == 1:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot create a ticket with severity level 1.",
+            )
+
+        categories = self.db.scalars(CATEGORIES_BY_IDS, {"ids": list(request.category_ids)}).all()
+        if len(categories) != len(request.category_ids):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="One or more categories not found.",
+            )
+
+        subcategories = []
+        if request.subcategory_ids:
+            subcategories = self.db.scalars(SUBCATEGORIES_BY_IDS, {"ids": list(request.subcategory_ids)}).all()
+            if len(subcategories) != len(request.subcategory_ids):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="One or more subcategories not found.",
+                )
+
+            for subcategory in subcategories:
+                if subcategory.category_id not in request.category_ids:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Subcategory '{subcategory.name}' does not belong to the provided categories.",
+                    )
+
+        if self.db.scalar(TICKET_BY_TITLE, {"title": request.title}) is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Ticket with title '{request.title}' already exists.",
+            )
+
+        return categories, subcategories
+
+    def show(self, ticket_id: UUID4or7, include_archived: bool = False) -> SchemaTicketShow:
         """
         Retrieve a ticket by ticket ID.
 
         Args:
-            ticket_id (UUID4): The ID of the ticket to retrieve.
+            ticket_id (UUID4or7): The ID of the ticket to retrieve.
+            include_archived (bool): Whether to look the ticket up in the archive if it is not live.
 
         Returns:
             SchemaTicketShow: The ticket corresponding to the provided ID.
@@ -141,34 +274,100 @@ class TicketController:
         Raises:
             HTTPException: Raised if the ticket with the provided ID is not found.
         """
+        if include_archived:
+            ticket = self.db.get(Ticket, ticket_id)
+            if ticket:
+                return self._load_categories_and_subcategories(ticket)
+            archived = self.db.scalars(ARCHIVED_TICKET_BY_ID, {"id": ticket_id}).first()
+            if archived:
+                return self._load_tickets([archived])[0]
+
         ticket = self._get_ticket_by_id(ticket_id)
         return self._load_categories_and_subcategories(ticket)
 
-    def update(self, ticket_id: UUID4, request: SchemaTicketUpdate) -> SchemaTicketShow:
+    def show_document(self, ticket_id: UUID4or7) -> Tuple[int, bytes]:
+        """
+        Retrieve the rendered JSON of a live ticket, from the ticket document cache when possible.
+
+        Args:
+            ticket_id (UUID4or7): The ID of the ticket to retrieve.
+
+        Returns:
+            Tuple[int, bytes]: The ticket version and its JSON document.
+
+        Raises:
+            HTTPException: Raised if the ticket with the provided ID is not found.
+        """
+        document = ticket_document_cache.get(ticket_id)
+        if document is not None:
+            return document
+
+        token = ticket_document_cache.token()
+        ticket = self.show(ticket_id)
+        body = ticket.model_dump_json().encode()
+        ticket_document_cache.put(ticket_id, ticket.version, body, token)
+        return ticket.version, body
+
+    def update(
+        self, ticket_id: UUID4or7, request: SchemaTicketUpdate, if_match: Optional[str] = None, caller: Optional[str] = None
+    ) -> SchemaTicketShow:
         """
         Update ticket information.
 
+        The write is conditional on the ticket version: the expected version comes from the If-Match header
+        or, failing that, the ``version`` field of the request. The UPDATE itself is issued with
+        ``WHERE version = ?``, so a concurrent writer that committed first makes this one fail without row locks.
+
+        A ``comment`` is appended to the comments of the ticket, by ``comment_user`` or, if omitted, the caller;
+        ``comment_user`` alone is rejected, as it only names the author of a new comment.
+
         Args:
-            ticket_id (UUID4): The ID of the ticket to update.
+            ticket_id (UUID4or7): The ID of the ticket to update.
             request (SchemaTicketUpdate): The updated ticket information.
+            if_match (Optional[str]): The If-Match header value, an ETag previously returned for the ticket.
+            caller (Optional[str]): The username of the user sending the request, the default comment author.
 
         Returns:
             SchemaTicketShow: The updated ticket information.
 
         Raises:
-            HTTPException: Raised if the ticket with the provided ID is not found or if any field is invalid.
+            HTTPException: Raised if the ticket with the provided ID is not found, if any field is invalid
+                or if the ticket was modified since the expected version (412).
         """
+        if request.comment_user is not None and not request.comment:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="comment_user can only be sent with a comment.",
+            )
+        expected_version = self._parse_if_match(if_match) if if_match else request.version
         try:
             ticket = self._get_ticket_by_id(ticket_id)
+            if expected_version is not None and ticket.version != expected_version:
+                raise HTTPException(
+                    status_code=status.HTTP_412_PRECONDITION_FAILED,
+                    detail=f"Ticket {ticket_id} was modified (current version {ticket.version}).",
+                )
+
             self._validate_and_update_severity(ticket, request)
             self._update_categories(ticket, request)
             self._update_subcategories(ticket, request)
-            self._update_ticket_fields(ticket, request)
+            self._update_ticket_fields(ticket, request, caller)
+            ticket.updated_at = func.now()
 
+            self.db.flush()
+            self._record_event(ticket, "updated", request.model_dump(mode="json", exclude_unset=True, exclude={"version"}))
             self.db.commit()
+            ticket_counts_cache.invalidate()
+            ticket_document_cache.invalidate([ticket.id])
             self.db.refresh(ticket)
 
             return self._load_categories_and_subcategories(ticket)
+        except StaleDataError as e:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail=f"Ticket {ticket_id} was modified by another request.",
+            ) from e
         except SQLAlchemyError as e:
             self.db.rollback()
             logger.error("Error updating ticket %s: %s", ticket_id, e)
@@ -177,8 +376,33 @@ class TicketController:
                 detail="An error occurred while updating the ticket. Please try again.",
             ) from e
 
-    def _get_ticket_by_id(self, ticket_id: UUID4) -> Ticket:
-        ticket = self.db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    @staticmethod
+    def _parse_if_match(if_match: str) -> Optional[int]:
+        """
+        Extract the expected ticket version from an If-Match header.
+
+        Args:
+            if_match (str): The header value, e.g. ``"3"``, ``W/"3"`` or ``*``.
+
+        Returns:
+            Optional[int]: The expected version, or None for ``*`` (any version).
+
+        Raises:
+            HTTPException: Raised if the header is not a ticket ETag.
+        """
+        tag = if_match.strip()
+        if tag == "*":
+            return None
+        tag = tag.removeprefix("W/").strip('"')
+        if not tag.isdigit():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail='If-Match must be a ticket ETag, e.g. "3".',
+            )
+        return int(tag)
+
+    def _get_ticket_by_id(self, ticket_id: UUID4or7) -> Ticket:
+        ticket = self.db.get(Ticket, ticket_id)
         if not ticket:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -188,7 +412,7 @@ class TicketController:
 
     def _validate_and_update_severity(self, ticket: Ticket, request: SchemaTicketUpdate):
         if request.severity_id:
-            severity = self.db.query(Severity).filter(Severity.id == request.severity_id).first()
+            severity = self.db.get(Severity, request.severity_id)
             if not severity:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -215,7 +439,7 @@ class TicketController:
         if request.category_ids is not None:
             new_category_ids = request.category_ids
 
-            categories = self.db.query(Category).filter(Category.id.in_(new_category_ids)).all()
+            categories = self.db.scalars(CATEGORIES_BY_IDS, {"ids": list(new_category_ids)}).all()
             if len(categories) != len(new_category_ids):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -227,6 +451,7 @@ class TicketController:
             for category in categories:
                 ticket_category = TicketCategory(ticket=ticket, category=category)
                 self.db.add(ticket_category)
+            ticket.category_ids = [category.id for category in categories]
 
             self.db.flush()
 
@@ -243,9 +468,9 @@ class TicketController:
         """
         if request.subcategory_ids is not None:
             new_sub_ids = request.subcategory_ids
-            current_category_ids = {category.category_id for category in ticket.ticket_categories}
+            current_category_ids = set(ticket.category_ids)
 
-            subcategories = self.db.query(Subcategory).filter(Subcategory.id.in_(new_sub_ids)).all()
+            subcategories = self.db.scalars(SUBCATEGORIES_BY_IDS, {"ids": list(new_sub_ids)}).all()
             if len(subcategories) != len(new_sub_ids):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -264,13 +489,41 @@ class TicketController:
             for subcategory in subcategories:
                 ticket_subcategory = TicketSubcategory(ticket=ticket, subcategory=subcategory)
                 self.db.add(ticket_subcategory)
+            ticket.subcategory_ids = [subcategory.id for subcategory in subcategories]
 
             self.db.flush()
 
-    def _update_ticket_fields(self, ticket: Ticket, request: SchemaTicketUpdate):
+    def _update_ticket_fields(self, ticket: Ticket, request: SchemaTicketUpdate, caller: Optional[str] = None):
         for key, value in request.model_dump(exclude_unset=True).items():
-            if key not in {"category_ids", "subcategory_ids"}:
+            if key not in {"category_ids", "subcategory_ids", "version", "comment", "comment_user"}:
                 setattr(ticket, key, value)
+        if request.comment:
+            self._add_comment(ticket, request.comment, request.comment_user or caller)
+
+    def _add_comment(self, ticket: Ticket, body: str, author: Optional[str]) -> TicketComment:
+        """
+        Append a comment to a ticket and refresh the snippet of the latest comment and the comment count on the ticket.
+
+        Args:
+            ticket (Ticket): The ticket to comment on.
+            body (str): The text of the comment.
+            author (Optional[str]): The author of the comment.
+
+        Returns:
+            TicketComment: The new comment, written on the next flush.
+        """
+        comment = TicketComment(id=uuid7(), ticket_id=ticket.id, body=body, author=author)
+        self.db.add(comment)
+        ticket.comment = self._comment_snippet(body)
+        ticket.comment_user = author
+        ticket.comment_count = Ticket.comment_count + 1
+        return comment
+
+    @staticmethod
+    def _comment_snippet(body: str) -> str:
+        if len(body) <= COMMENT_SNIPPET_LENGTH:
+            return body
+        return body[: COMMENT_SNIPPET_LENGTH - 3] + "..."
 
     def _load_categories_and_subcategories(self, ticket: Ticket) -> SchemaTicketShow:
         """
@@ -282,9 +535,53 @@ class TicketController:
         Returns:
             SchemaTicketShow: The schema object with loaded categories and subcategories.
         """
-        categories = [tc.category for tc in ticket.ticket_categories]
-        subcategories = [ts.subcategory for ts in ticket.ticket_subcategories]
+        return self._load_tickets([ticket])[0]
 
+    def _load_tickets(self, tickets: List[Union[Ticket, TicketArchive]]) -> List[SchemaTicketShow]:
+        """
+        Build the schema objects of live or archived tickets, loading their categories and subcategories in two
+        primary-key queries from the ``category_ids``/``subcategory_ids`` arrays instead of the association tables.
+
+        Categories or subcategories deleted after a ticket was archived are left out.
+
+        Args:
+            tickets (List[Union[Ticket, TicketArchive]]): The tickets.
+
+        Returns:
+            List[SchemaTicketShow]: The schema objects, in the same order.
+        """
+        category_ids = {category_id for ticket in tickets for category_id in ticket.category_ids}
+        subcategory_ids = {subcategory_id for ticket in tickets for subcategory_id in ticket.subcategory_ids}
+        categories = {category.id: category for category in self.db.scalars(CATEGORIES_BY_IDS, {"ids": list(category_ids)})} if category_ids else {}
+        subcategories = (
+            {subcategory.id: subcategory for subcategory in self.db.scalars(SUBCATEGORIES_BY_IDS, {"ids": list(subcategory_ids)})}
+            if subcategory_ids
+            else {}
+        )
+        return [
+            self._build_ticket_show(
+                ticket,
+                [categories[category_id] for category_id in ticket.category_ids if category_id in categories],
+                [subcategories[subcategory_id] for subcategory_id in ticket.subcategory_ids if subcategory_id in subcategories],
+                archived_at=getattr(ticket, "archived_at", None),
+            )
+            for ticket in tickets
+        ]
+
+    @staticmethod
+    def _build_ticket_show(ticket, categories: List[Category], subcategories: List[Subcategory], archived_at=None) -> SchemaTicketShow:
+        """
+        Build the schema object of a ticket, nesting the subcategories under their categories.
+
+        Args:
+            ticket (Ticket | TicketArchive): The live or archived ticket.
+            categories (List[Category]): The categories of the ticket.
+            subcategories (List[Subcategory]): The subcategories of the ticket.
+            archived_at (Optional[datetime]): When the ticket was archived, None for live tickets.
+
+        Returns:
+            SchemaTicketShow: The schema object.
+        """
         category_subcategory_map = {category.id: [] for category in categories}
         for subcategory in subcategories:
             if subcategory.category_id in category_subcategory_map:
@@ -312,16 +609,111 @@ class TicketController:
             updated_at=ticket.updated_at,
             comment=ticket.comment,
             comment_user=ticket.comment_user,
+            comment_count=ticket.comment_count,
+            version=ticket.version,
+            archived_at=archived_at,
         )
 
         return ticket_data
 
-    def delete(self, ticket_id: UUID4) -> str:
+    def _record_event(self, ticket: Ticket, event_type: str, data: dict):
+        """
+        Write a change event to the outbox in the current transaction and notify listeners on commit.
+
+        The cached document of the ticket is invalidated in every process on commit as well.
+
+        Args:
+            ticket (Ticket): The changed ticket.
+            event_type (str): One of "created", "updated", "deleted" or "commented".
+            data (dict): The JSON-serializable changed fields.
+        """
+        event = TicketEvent(ticket_id=ticket.id, event_type=event_type, version=ticket.version, data=data)
+        self.db.add(event)
+        self.db.flush()
+        self.db.execute(select(func.pg_notify(TICKET_EVENTS_CHANNEL, str(event.id))))
+        ticket_document_cache.notify(self.db, [ticket.id])
+
+    def get_event_backlog(self, last_event_id: Optional[str]) -> Tuple[List[dict], Tuple[int, int], bool]:
+        """
+        Get the events a streaming client missed since its last received event.
+
+        Args:
+            last_event_id (Optional[str]): The cursor of the last event the client received, if resuming.
+
+        Returns:
+            Tuple[List[dict], Tuple[int, int], bool]: The missed events, the cursor the live stream continues
+            from and whether the backlog was truncated to ``EVENT_BACKLOG_LIMIT`` events.
+
+        Raises:
+            HTTPException: Raised if the cursor is malformed.
+        """
+        if not last_event_id:
+            row = self.db.execute(latest_cursor()).first()
+            return [], (row.txid, row.id) if row else (0, 0), False
+
+        try:
+            cursor = parse_cursor(last_event_id)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+        events = [event.to_dict() for event in self.db.scalars(events_after(cursor, EVENT_BACKLOG_LIMIT))]
+        if events:
+            cursor = parse_cursor(events[-1]["cursor"])
+        return events, cursor, len(events) == EVENT_BACKLOG_LIMIT
+
+    def get_changes(self, since: Optional[str], limit: int) -> SchemaTicketChanges:
+        """
+        Get the tickets changed after a point of the change sequence.
+
+        Only the outbox events after the watermark are read, through the (txid, id) index, so a poll costs
+        O(changes) rather than O(tickets). Several changes to the same ticket within a page collapse into one
+        entry with its current state, or a tombstone if it no longer exists: ``archived`` if its last change
+        moved it to the archive, ``deleted`` otherwise. The current state may include changes beyond the returned
+        watermark; those are sent again on the next poll.
+
+        Args:
+            since (Optional[str]): The ``next`` watermark of the previous page. If omitted, starts from the beginning.
+            limit (int): The maximum number of change events to consume.
+
+        Returns:
+            SchemaTicketChanges: The changed tickets and tombstones, the next watermark and whether more changes are pending.
+
+        Raises:
+            HTTPException: Raised if the watermark is malformed.
+        """
+        cursor = (0, 0)
+        if since:
+            try:
+                cursor = parse_cursor(since)
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+        events = self.db.scalars(events_after(cursor, limit)).all()
+        if not events:
+            return SchemaTicketChanges(changes=[], next=f"{cursor[0]}-{cursor[1]}", has_more=False)
+
+        ticket_ids = list(dict.fromkeys(event.ticket_id for event in reversed(events)))[::-1]
+        last_event_types = {event.ticket_id: event.event_type for event in events}
+        tickets = {ticket.id: ticket for ticket in self.db.scalars(TICKETS_BY_IDS, {"ids": ticket_ids})}
+
+        changes = []
+        for ticket_id in ticket_ids:
+            ticket = tickets.get(ticket_id)
+            if ticket is None and last_event_types[ticket_id] == "archived":
+                changes.append(SchemaTicketChange(ticket_id=ticket_id, archived=True))
+            elif ticket is None:
+                changes.append(SchemaTicketChange(ticket_id=ticket_id, deleted=True))
+            else:
+                changes.append(SchemaTicketChange(ticket_id=ticket_id, ticket=self._load_categories_and_subcategories(ticket)))
+
+        return SchemaTicketChanges(changes=changes, next=events[-1].cursor, has_more=len(events) == limit)
+
+    def delete(self, ticket_id: UUID4or7) -> str:
         """
         Delete a ticket by ticket UUID.
 
         Args:
-            ticket_id (UUID4): The ID of the ticket to be deleted.
+            ticket_id (UUID4or7): The ID of the ticket to be deleted.
 
         Returns:
             str: A message confirming the deletion of the ticket.
@@ -332,13 +724,13 @@ class TicketController:
         try:
             ticket = self._get_ticket_by_id(ticket_id)
 
-            self.db.query(TicketSubcategory).filter(TicketSubcategory.ticket_id == ticket.id).delete(synchronize_session="fetch")
-
-            self.db.query(TicketCategory).filter(TicketCategory.ticket_id == ticket.id).delete(synchronize_session="fetch")
-
             self.db.delete(ticket)
+            self.db.execute(delete(TicketComment).where(TicketComment.ticket_id == ticket.id))
+            self._record_event(ticket, "deleted", {})
 
             self.db.commit()
+            ticket_counts_cache.invalidate()
+            ticket_document_cache.invalidate([ticket.id])
 
             return f"Ticket {ticket_id} deleted."
 
@@ -350,40 +742,154 @@ class TicketController:
                 detail="An error occurred while deleting the ticket. Please try again.",
             ) from e
 
-    def add_comment_to_ticket(self, ticket_id: UUID4) -> dict:
+    def get_comments(self, ticket_id: UUID4or7, request: SchemaTicketCommentListQuery) -> Tuple[List[SchemaTicketCommentShow], Optional[str]]:
+        """
+        Get a page of the comments of a live or archived ticket, oldest first.
+
+        Pages are read with keyset pagination on (created_at, id) through the ``(ticket_id, created_at)`` index,
+        so the cost of a page does not depend on its position or on the number of comments of the ticket.
+
+        Args:
+            ticket_id (UUID4or7): The ID of the ticket.
+            request (SchemaTicketCommentListQuery): The page size and the cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[SchemaTicketCommentShow], Optional[str]]: The comments and the cursor of the next page, or None on the last page.
+
+        Raises:
+            HTTPException: Raised if the cursor is malformed or the ticket is not found.
+        """
+        limit = request.limit
+        query = (
+            select(TicketComment).where(TicketComment.ticket_id == ticket_id).order_by(TicketComment.created_at, TicketComment.id).limit(limit + 1)
+        )
+        if request.after:
+            query = query.where(tuple_(TicketComment.created_at, TicketComment.id) > self._decode_comment_cursor(request.after))
+
+        comments = self.db.scalars(query).all()
+        if not comments and self.db.get(Ticket, ticket_id) is None and self.db.scalars(ARCHIVED_TICKET_BY_ID, {"id": ticket_id}).first() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Ticket {ticket_id} not found",
+            )
+
+        next_cursor = self._encode_comment_cursor(comments[limit - 1]) if len(comments) > limit else None
+        return [SchemaTicketCommentShow.model_validate(comment) for comment in comments[:limit]], next_cursor
+
+    @staticmethod
+    def _encode_comment_cursor(comment: TicketComment) -> str:
+        return base64.urlsafe_b64encode(json.dumps([comment.created_at.isoformat(), str(comment.id)]).encode()).decode()
+
+    @staticmethod
+    def _decode_comment_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+        try:
+            created_at, comment_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return datetime.fromisoformat(created_at), uuid.UUID(comment_id)
+        except (ValueError, TypeError) as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from e
+
+    def add_comment_to_ticket(self, ticket_id: UUID4or7) -> dict:
         """
         Add a comment from JSONPlaceholder to a ticket.
 
         Args:
-            ticket_id (UUID4): The ID of the ticket to add a comment to.
+            ticket_id (UUID4or7): The ID of the ticket to add a comment to.
 
         Returns:
             dict: A dictionary confirming the addition of the comment.
 
         Raises:
-            HTTPException: If there's an issue fetching comments or updating the ticket.
+            HTTPException: If the ticket is not found (404), or there's an issue fetching comments or updating the ticket.
         """
         try:
+            ticket = self.db.get(Ticket, ticket_id)
+            if not ticket:
+                raise HTTPException(status_code=404, detail="Ticket not found.")
+
             comment_data = External.fetch_random_comment()
             comment_text = comment_data["comment_text"]
             comment_user = comment_data["comment_user"]
 
-            ticket = self.db.query(Ticket).filter(Ticket.id == ticket_id).first()
-            if not ticket:
-                raise HTTPException(status_code=404, detail="Ticket not found.")
-
-            ticket.comment = comment_text
-            ticket.comment_user = comment_user
+            comment = self._add_comment(ticket, comment_text, comment_user)
+            self._record_event(ticket, "commented", {"comment_id": str(comment.id), "comment": comment_text, "comment_user": comment_user})
             self.db.commit()
+            ticket_document_cache.invalidate([ticket.id])
             self.db.refresh(ticket)
 
-            return {"ticket_id": str(ticket_id), "comment": comment_text, "comment_user": comment_user}
+            return {"ticket_id": str(ticket_id), "comment_id": str(comment.id), "comment": comment_text, "comment_user": comment_user}
 
+        except HTTPException:
+            raise
         except Exception as e:
             self.db.rollback()
             logger.error("Error adding comment to ticket: %s", e)
             raise HTTPException(status_code=500, detail=str(e)) from e
 
+    def add_comments_to_tickets(self, request: SchemaTicketCommentBatch) -> dict:
+        """
+        Add a comment from JSONPlaceholder to each of many tickets.
+
+        The comment corpus is fetched once and sampled without replacement, one comment per ticket. The comments,
+        the ticket snippets and counts and the "commented" events are then written by a single statement.
+
+        Args:
+            request (SchemaTicketCommentBatch): The ticket IDs and/or the status, category and subcategory filters,
+                and the maximum number of tickets to comment on.
+
+        Returns:
+            dict: The number and the IDs of the tickets commented on.
+
+        Raises:
+            HTTPException: If neither ticket IDs nor a filter are given, or there's an issue fetching comments or updating the tickets.
+        """
+        if not (request.ticket_ids or request.status or request.category_id or request.subcategory_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Either ticket_ids or a status, category_id or subcategory_id filter must be given.",
+            )
+
+        query = select(Ticket.id).order_by(Ticket.id).limit(request.limit)
+        if request.ticket_ids:
+            query = query.where(Ticket.id.in_(request.ticket_ids))
+        if request.status:
+            query = query.where(Ticket.status == request.status)
+        if request.category_id:
+            query = query.where(Ticket.category_ids.contains([request.category_id]))
+        if request.subcategory_id:
+            query = query.where(Ticket.subcategory_ids.contains([request.subcategory_id]))
+
+        try:
+            ticket_ids = self.db.scalars(query).all()
+            if not ticket_ids:
+                return {"commented": 0, "ticket_ids": []}
+
+            comments = External.fetch_comment_sample(len(ticket_ids))
+            rows = self.db.execute(
+                COMMENT_BATCH_SQL,
+                {
+                    "ticket_ids": [str(ticket_id) for ticket_id in ticket_ids],
+                    "comment_ids": [str(uuid7()) for _ in ticket_ids],
+                    "bodies": [comment["comment_text"] for comment in comments],
+                    "snippets": [self._comment_snippet(comment["comment_text"]) for comment in comments],
+                    "authors": [comment["comment_user"] for comment in comments],
+                },
+            ).all()
+            if rows:
+                self.db.execute(select(func.pg_notify(TICKET_EVENTS_CHANNEL, str(max(row.id for row in rows)))))
+                ticket_document_cache.notify(self.db, [row.ticket_id for row in rows])
+            self.db.commit()
+            ticket_document_cache.invalidate([row.ticket_id for row in rows])
+
+            return {"commented": len(rows), "ticket_ids": [str(row.ticket_id) for row in rows]}
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error("Error adding comments to tickets: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="An error occurred while adding the comments. Please try again.",
+            ) from e
+
 
 def get_ticket_controller(db: Session = Depends(get_db)):
     """
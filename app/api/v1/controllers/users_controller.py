@@ -1,20 +1,40 @@
 """Controllers for managing user operations in the database related to User API endpoints."""
 
-from typing import List
+from typing import List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import base64
+import json
 import logging
+import random
+import uuid
 from pydantic import UUID4
+from sqlalchemy import func, inspect, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException, status, Depends
-from app.core import Hash
-from app.infrastructure import get_db, User
-from app.schemas import UserUpdate as SchemaUserUpdate, User as SchemaUser, UserShow as SchemaUserShow
+from app.core import Hash, traced_methods
+from app.core.auth.jwt_token import ACCESS_TOKEN_EXPIRE_MINUTES
+from app.infrastructure import get_db, User, TokenRevocation
+from app.infrastructure.events import revocation_set
+from app.schemas import (
+    UserUpdate as SchemaUserUpdate,
+    User as SchemaUser,
+    UserShow as SchemaUserShow,
+    UserListItem as SchemaUserListItem,
+    UserListQuery as SchemaUserListQuery,
+)
 from app.scripts import External
+from .idempotency_controller import IdempotencyController
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
+IDEMPOTENCY_SCOPE = "users"
+USER_LIST_COLUMNS = (User.id, User.name, User.username, User.email, User.role, User.active, User.created_at)
+RANDOM_USER_PASSWORD = "password"
 
+
+@traced_methods
 class UserController:
     """
     A controller class for managing user operations in the database.
@@ -28,35 +48,81 @@ class UserController:
             db (Session): The database session.
         """
         self.db = db
+        self.idempotency = IdempotencyController(db)
 
-    def get_all(self) -> List[SchemaUserShow]:
+    def get_all(self, request: SchemaUserListQuery) -> Tuple[List[SchemaUserListItem], Optional[str]]:
         """
-        Get all users.
+        Get a page of users ordered by username.
+
+        Pages are read with keyset pagination on (username, id), so the cost of a page does not depend on its
+        position. Only the listed columns are selected; password hashes are never loaded.
+
+        Args:
+            request (SchemaUserListQuery): The page size, the cursor returned with the previous page, and the role,
+                active status and case-insensitive username/name/email prefix to filter on.
 
         Returns:
-            List[SchemaUserShow]: A list of user objects.
+            Tuple[List[SchemaUserListItem], Optional[str]]: The users and the cursor of the next page, or None on the last page.
 
         Raises:
-            HTTPException: Raised if no users are found.
+            HTTPException: Raised if the cursor is malformed, or if no users are found without filters.
         """
-        users = self.db.query(User).all()
-        if not users:
+        limit = request.limit
+        query = select(*USER_LIST_COLUMNS).order_by(User.username, User.id).limit(limit + 1)
+        if request.after:
+            query = query.where(tuple_(User.username, User.id) > self._decode_cursor(request.after))
+        if request.role:
+            query = query.where(User.role == request.role)
+        if request.active is not None:
+            query = query.where(User.active.is_(request.active))
+        if request.search:
+            pattern = request.search.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            query = query.where(or_(*(func.lower(column).like(pattern) for column in (User.username, User.name, User.email))))
+
+        rows = self.db.execute(query).all()
+        if not rows and not request.model_dump(exclude_defaults=True, exclude={"limit"}):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No users found")
-        return users
 
-    def create(self, request: SchemaUser) -> SchemaUserShow:
+        users = [SchemaUserListItem.model_validate(row) for row in rows[:limit]]
+        next_cursor = self._encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+        return users, next_cursor
+
+    @staticmethod
+    def _encode_cursor(row) -> str:
+        return base64.urlsafe_b64encode(json.dumps([row.username, str(row.id)]).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[str, uuid.UUID]:
+        try:
+            username, user_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return username, uuid.UUID(user_id)
+        except (ValueError, TypeError) as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from e
+
+    def create(self, request: SchemaUser, idempotency_key: Optional[str] = None, caller_id: Optional[str] = None) -> SchemaUserListItem:
         """
         Create a new user.
 
+        The response, which is also what an idempotency key stores for replay, leaves out the password hash.
+
         Args:
             request (UserCreate): The request containing details of the new user.
+            idempotency_key (Optional[str]): Client-supplied key; a retry with the same key replays the first response.
+            caller_id (Optional[str]): The ID of the user sending the request, the idempotency key is scoped to it.
 
         Returns:
-            SchemaUserShow: The newly created user object.
+            SchemaUserListItem: The newly created user object, without its password.
 
         Raises:
-            HTTPException: Raised if any required field is not provided or if a user with the same username already exists.
+            HTTPException: Raised if any required field is not provided, if a user with the same username already exists
+                or if the idempotency key was used with a different payload.
         """
+        scope = self.idempotency.scope(IDEMPOTENCY_SCOPE, caller_id)
+        if idempotency_key:
+            stored_user = self.idempotency.replay(scope, idempotency_key, request)
+            if stored_user is not None:
+                return SchemaUserListItem.model_validate(stored_user)
+
         try:
             required_fields = [request.name, request.username, request.email, request.password]
             if not all(required_fields):
@@ -81,10 +147,24 @@ class UserController:
             )
 
             self.db.add(new_user)
+            self.db.flush()
+
+            user_data = SchemaUserListItem.model_validate(new_user)
+            if idempotency_key:
+                self.idempotency.remember(scope, idempotency_key, request, user_data.model_dump(mode="json"))
+
             self.db.commit()
-            self.db.refresh(new_user)
 
-            return new_user
+            return user_data
+        except IntegrityError as e:
+            self.db.rollback()
+            stored_user = self.idempotency.replay(scope, idempotency_key, request) if idempotency_key else None
+            if stored_user is not None:
+                return SchemaUserListItem.model_validate(stored_user)
+            logger.error("Error creating user: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An error occurred while creating the user. Please try again."
+            ) from e
         except SQLAlchemyError as e:
             self.db.rollback()
             logger.error("Error creating user: %s", e)
@@ -105,7 +185,7 @@ class UserController:
         Raises:
             HTTPException: Raised if the user with the provided ID is not found.
         """
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = self.db.get(User, user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -117,6 +197,8 @@ class UserController:
         """
         Update user information.
 
+        Deactivating or reactivating a user takes effect immediately on the tokens already issued to them.
+
         Args:
             user_id (UUID4): The ID of the user to update.
             request (UserUpdate): The updated user information.
@@ -125,17 +207,17 @@ class UserController:
             SchemaUserShow: The updated user information.
 
         Raises:
-            HTTPException: Raised if the user with the provided ID is not found or if any field is left blank.
+            HTTPException: Raised if the user with the provided ID is not found or if any field is left blank or null.
         """
         try:
-            user = self.db.query(User).filter(User.id == user_id).first()
+            user = self.db.get(User, user_id)
             if not user:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"User {user_id} not found",
                 )
 
-            if any(value == "" for value in request.model_dump(exclude_unset=True).values()):
+            if any(value in ("", None) for value in request.model_dump(exclude_unset=True).values()):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="No field can be left blank",
@@ -144,7 +226,14 @@ class UserController:
             for key, value in request.dict(exclude_unset=True).items():
                 setattr(user, key, value)
 
+            revocation = None
+            if inspect(user).attrs.active.history.has_changes():
+                revocation = {"user_id": str(user.id), "active": request.active}
+                revocation_set.notify(self.db, revocation)
+
             self.db.commit()
+            if revocation:
+                revocation_set.apply(revocation)
             self.db.refresh(user)
             return user
         except SQLAlchemyError as e:
@@ -169,15 +258,13 @@ class UserController:
             HTTPException: Raised if the user with the provided ID is not found.
         """
         try:
-            user = self.db.query(User).filter(User.id == user_id)
-            if not user.first():
+            user = self.db.get(User, user_id)
+            if not user:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User {user_id} not found")
 
-            user_dict = user.first().to_dict()
-            user_dict["password"] = Hash.bcrypt(password)
-            user.update(user_dict)
+            user.password = Hash.bcrypt(password)
             self.db.commit()
-            return user.first()
+            return user
         except SQLAlchemyError as e:
             self.db.rollback()
             logger.error("Error resetting password for user %s: %s", user_id, e)
@@ -187,7 +274,7 @@ class UserController:
 
     def delete(self, user_id: UUID4) -> str:
         """
-        Delete a user by user UUID.
+        Delete a user by user UUID and revoke the tokens already issued to them.
 
         Args:
             user_id (UUID4): The ID of the user to be deleted.
@@ -199,12 +286,18 @@ class UserController:
             HTTPException: Raised if the user with the provided ID is not found.
         """
         try:
-            user = self.db.query(User).filter(User.id == user_id).first()
+            user = self.db.get(User, user_id)
             if not user:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User {user_id} not found")
 
+            expires_at = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+            revocation = {"user_id": str(user.id), "expires_at": expires_at.isoformat()}
+            self.db.add(TokenRevocation(user_id=user.id, expires_at=expires_at))
+            revocation_set.notify(self.db, revocation)
+
             self.db.delete(user)
             self.db.commit()
+            revocation_set.apply(revocation)
             return f"User {user_id} deleted."
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -234,7 +327,7 @@ class UserController:
                 name=user_data["name"],
                 email=user_data["email"],
                 username=user_data["username"],
-                password=Hash.bcrypt("password"),
+                password=Hash.bcrypt(RANDOM_USER_PASSWORD),
                 active=True,
                 role="user",
             )
@@ -254,6 +347,59 @@ class UserController:
             logger.error("Error creating random user: %s", e)
             raise HTTPException(status_code=500, detail=str(e)) from e
 
+    def create_random_users(self, count: int) -> List[User]:
+        """
+        Create up to ``count`` random users using data from an external API.
+
+        The external users are fetched once and those whose email or username is already taken are left out with
+        a single query. Every user gets the same default password, so it is hashed once for the whole batch, and
+        the users are written with one multi-row INSERT; usernames taken concurrently are skipped.
+
+        Args:
+            count (int): The maximum number of users to create.
+
+        Returns:
+            List[User]: The created users.
+
+        Raises:
+            HTTPException: If every external user already exists or there's an issue creating the users.
+        """
+        try:
+            external_users = list({user["username"]: user for user in External.fetch_users()}.values())
+
+            taken = self.db.execute(
+                select(User.email, User.username).where(
+                    or_(User.email.in_([user["email"] for user in external_users]), User.username.in_([user["username"] for user in external_users]))
+                )
+            ).all()
+            taken_emails = {row.email for row in taken}
+            taken_usernames = {row.username for row in taken}
+            available = [user for user in external_users if user["email"] not in taken_emails and user["username"] not in taken_usernames]
+            if not available:
+                raise HTTPException(status_code=409, detail="Every user from the external API already exists.")
+
+            password = Hash.bcrypt(RANDOM_USER_PASSWORD)
+            rows = [
+                {"id": uuid.uuid4(), "password": password, "active": True, "role": "user", **user}
+                for user in random.sample(available, min(count, len(available)))
+            ]
+            users = self.db.scalars(
+                insert(User).on_conflict_do_nothing(index_elements=[User.username]).returning(User),
+                rows,
+            ).all()
+            self.db.commit()
+
+            logger.info("Created %d random users", len(users))
+            return users
+
+        except HTTPException as e:
+            logger.error("Error creating random users: %s", e)
+            raise e
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Error creating random users: %s", e)
+            raise HTTPException(status_code=500, detail=str(e)) from e
+
 
 def get_user_controller(db: Session = Depends(get_db)):
     """
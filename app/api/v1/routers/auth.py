@@ -1,25 +1,47 @@
 """Auth Routes"""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Security, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from app.infrastructure.database.models import User
 from app.infrastructure.database import get_db
 from app.core.auth.hashing import Hash
 from app.core.auth.jwt_token import create_access_token
+from app.core.auth.oauth import get_current_active_user
 from app.core import ROLE_SCOPES
+from app.schemas import LogoutRequest, RefreshTokenRequest, TokenData
+from app.api.v1 import RefreshTokenController, get_refresh_token_controller
 
 router = APIRouter(prefix="/login", tags=["Authentication"])
 
+USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+
+
+def _token_response(user: User, refresh_token: str) -> dict:
+    scopes = ROLE_SCOPES.get(user.role, [])
+    access_token = create_access_token(data={"id": user.id, "username": user.username, "role": user.role}, scopes=scopes)
+
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "user_id": user.id,
+        "role": user.role,
+        "scopes": scopes,
+        "token_type": "bearer",
+    }
+
 
 @router.post("/")
 def login(request: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """Authenticate user and generate access token.
 
     This endpoint is used to authenticate users by validating their credentials
-    (username and password). If the credentials are valid, an access token is generated
-    and returned to the client.
+    (username and password). If the credentials are valid, an access token and a
+    refresh token are generated and returned to the client. Passwords hashed with an
+    outdated policy are rehashed with the current one.
 
     Args:
         request (OAuth2PasswordRequestForm): The request containing user credentials.
@@ -27,23 +49,69 @@ def login(request: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(
         db (Session): The database session dependency. Defaults to Depends(get_db).
 
     Returns:
-        dict: A dictionary containing the generated access token and token type.
+        dict: A dictionary containing the generated access token, refresh token and token type.
 
     Raises:
         HTTPException: If the provided credentials are invalid or incorrect.
     """
 
-    user = db.query(User).filter(User.username == request.username).first()
+    user = db.scalars(USER_BY_USERNAME, {"username": request.username}).first()
 
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
-    if not Hash.verify(request.password, user.password):
+    verified, new_hash = Hash.verify_and_update(request.password, user.password)
+    if not verified:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect password")
 
-    scopes = ROLE_SCOPES.get(user.role, [])
-    access_token = create_access_token(data={"id": user.id, "username": user.username, "role": user.role}, scopes=scopes)
+    if not user.active:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive user")
+
+    if new_hash:
+        user.password = new_hash
+
+    refresh_token = RefreshTokenController(db).issue(user)
+    db.commit()
+
+    return _token_response(user, refresh_token)
+
+
+@router.post("/refresh")
+def refresh(request: RefreshTokenRequest, controller: RefreshTokenController = Depends(get_refresh_token_controller)):
+    """Exchange a refresh token for a new access token.
 
-    data = {"access_token": access_token, "user_id": user.id, "role": user.role, "scopes": scopes, "token_type": "bearer"}
+    The presented refresh token is single-use: the response carries its replacement.
+    Presenting an already used token revokes every token issued from the same login.
 
-    return data
+    Args:
+        request (RefreshTokenRequest): The request containing the refresh token.
+        controller (RefreshTokenController): The refresh token controller instance.
+
+    Returns:
+        dict: A dictionary containing the new access token, refresh token and token type.
+
+    Raises:
+        HTTPException: If the refresh token is invalid, expired, reused or its user is inactive.
+    """
+    user, refresh_token = controller.rotate(request.refresh_token)
+
+    return _token_response(user, refresh_token)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    request: Optional[LogoutRequest] = None,
+    controller: RefreshTokenController = Depends(get_refresh_token_controller),
+    current_user: TokenData = Security(get_current_active_user),
+):
+    """Revoke the access token used for the request.
+
+    The revocation is propagated to every API process, so the token is rejected
+    immediately rather than when it expires.
+
+    Args:
+        request (Optional[LogoutRequest]): The refresh token to revoke as well, if any.
+        controller (RefreshTokenController): The refresh token controller instance.
+        current_user (TokenData): The data of the access token to revoke.
+    """
+    controller.logout(current_user, request.refresh_token if request else None)
@@ -1,10 +1,11 @@
 """Category routers"""
 
-from typing import List
-from fastapi import APIRouter, Depends, Security, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Request, Security, status
 from pydantic import UUID4
-from app.schemas import Category, CategoryShow, CategoryUpdate
+from app.schemas import Category, CategoryShow, CategoryTree, CategoryUpdate
 from app.api.v1 import get_category_controller, CategoryController
+from app.api.compression import reference_response
 from app.core.auth.oauth import get_current_active_user
 
 router = APIRouter(prefix="/categories", tags=["Categories"])
@@ -12,29 +13,40 @@ router = APIRouter(prefix="/categories", tags=["Categories"])
 
 @router.get(
     "/",
-    response_model=List[CategoryShow],
+    response_model=List[CategoryTree],
+    response_model_exclude_none=True,
     status_code=status.HTTP_200_OK,
 )
 def get_all_categories(
+    request: Request,
+    include: Optional[str] = Query(default=None, description="Comma-separated list of: subcategories, counts."),
     controller: CategoryController = Depends(get_category_controller),
     current_user: CategoryShow = Security(get_current_active_user, scopes=["read"]),
 ):
     """
     Retrieve all categories.
 
-    Retrieves all categories stored in the database.
+    Retrieves all categories stored in the database with their subcategories. With
+    ``include=subcategories,counts`` every category and subcategory also carries its
+    number of open (not resolved) and total tickets. Lists without counts are served from
+    a cache of precompressed bodies.
 
     Parameters:
+    - request (Request): The incoming request, for content negotiation.
+    - include (Optional[str]): What to embed in each category. Defaults to subcategories.
     - controller (CategoryController): The category controller instance.
     - _: CategoryShow: The current user (unused).
 
     Returns:
-    - List[CategoryShow]: A list of category objects with restricted information.
+    - List[CategoryTree]: A list of category objects with restricted information.
 
     Raises:
-    - HTTPException: If there's an issue retrieving categories from the database.
+    - HTTPException: If an include is unknown or there's an issue retrieving categories from the database.
     """
-    return controller.get_all()
+    includes = {part.strip() for part in include.split(",") if part.strip()} if include is not None else None
+    if includes is not None and "counts" in includes:
+        return controller.get_all(includes)
+    return reference_response(request, controller.get_all_document(includes))
 
 
 @router.post(
@@ -0,0 +1,79 @@
+"""Debug routers"""
+
+from typing import Any, Dict, List, Literal
+from fastapi import APIRouter, Query, Security, status
+from app.schemas import User
+from app.core import tracer
+from app.infrastructure.database.slow_queries import slow_query_log
+from app.core.auth.oauth import get_current_active_user
+
+router = APIRouter(prefix="/debug", tags=["Debug"])
+
+
+@router.get(
+    "/traces",
+    response_model=List[Dict[str, Any]],
+    status_code=status.HTTP_200_OK,
+)
+def get_slow_traces(
+    min_duration_ms: float = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=500),
+    current_user: User = Security(get_current_active_user, scopes=["admin"]),
+):
+    """
+    Retrieve the slowest recent traces of this worker process.
+
+    Each trace holds the spans of one request: the route, the controller methods, the SQL statements
+    and the external API calls, with their durations and attributes. Only the traces kept in this
+    process's buffer are returned; other workers keep their own.
+
+    Parameters:
+    - min_duration_ms (float): Only return traces at least this long, in milliseconds.
+    - limit (int): The maximum number of traces to return.
+    - _: User: The current user (unused).
+
+    Returns:
+    - List[Dict[str, Any]]: The traces, slowest first.
+    """
+    return tracer.exporter.traces(min_duration_ms, limit)
+
+
+@router.get(
+    "/slow-queries",
+    response_model=List[Dict[str, Any]],
+    status_code=status.HTTP_200_OK,
+)
+def get_slow_queries(
+    limit: int = Query(20, ge=1, le=500),
+    order_by: Literal["total_ms", "max_ms", "mean_ms", "count"] = Query("total_ms"),
+    current_user: User = Security(get_current_active_user, scopes=["admin"]),
+):
+    """
+    Retrieve the slowest statements recorded by this worker process.
+
+    Statements slower than ``SLOW_QUERY_THRESHOLD_MS`` are grouped by fingerprint, the statement with its
+    literals and parameters replaced by ``?``. Each entry holds the calls, total, mean and maximum time, the
+    code that ran it and, for sampled SELECT statements, its latest ``EXPLAIN (ANALYZE, BUFFERS)`` plan.
+
+    Parameters:
+    - limit (int): The maximum number of fingerprints to return.
+    - order_by (str): The statistic to sort by: "total_ms", "max_ms", "mean_ms" or "count".
+    - _: User: The current user (unused).
+
+    Returns:
+    - List[Dict[str, Any]]: The fingerprints, slowest first.
+    """
+    return slow_query_log.top(limit, order_by)
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries(
+    current_user: User = Security(get_current_active_user, scopes=["admin"]),
+):
+    """
+    Clear the slow statements recorded by this worker process, e.g. after deploying a new index.
+
+    Parameters:
+    - _: User: The current user (unused).
+    """
+    slow_query_log.clear()
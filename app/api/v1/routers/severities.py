@@ -1,10 +1,11 @@
 """Severity routers"""
 
 from typing import List
-from fastapi import APIRouter, Depends, Security, status
+from fastapi import APIRouter, Depends, Request, Security, status
 from pydantic import UUID4
 from app.schemas import Severity, SeverityShow, SeverityUpdate
 from app.api.v1 import get_severity_controller, SeverityController
+from app.api.compression import reference_response
 from app.core.auth.oauth import get_current_active_user
 
 router = APIRouter(prefix="/severities", tags=["Severities"])
@@ -16,15 +17,17 @@ router = APIRouter(prefix="/severities", tags=["Severities"])
     status_code=status.HTTP_200_OK,
 )
 def get_all_severities(
+    request: Request,
     controller: SeverityController = Depends(get_severity_controller),
     current_user: SeverityShow = Security(get_current_active_user, scopes=["read"]),
 ):
     """
     Retrieve all severity levels.
 
-    Retrieves all severity levels stored in the database.
+    Retrieves all severity levels stored in the database, served from a cache of precompressed bodies.
 
     Parameters:
+    - request (Request): The incoming request, for content negotiation.
     - controller (SeverityController): The severity controller instance.
     - _: SeverityShow: The current user (unused).
 
@@ -34,7 +37,7 @@ def get_all_severities(
     Raises:
     - HTTPException: If there's an issue retrieving severity levels from the database.
     """
-    return controller.get_all()
+    return reference_response(request, controller.get_all_document())
 
 
 @router.post(
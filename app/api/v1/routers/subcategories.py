@@ -1,9 +1,10 @@
 """Subcategory routers"""
 
 from typing import List
-from fastapi import APIRouter, Depends, status, Security
+from fastapi import APIRouter, Depends, Request, status, Security
 from pydantic import UUID4
 from app.api.v1 import SubcategoryController, get_subcategory_controller
+from app.api.compression import reference_response
 from app.schemas import Subcategory, SubcategoryShow, SubcategoryUpdate
 from app.core.auth.oauth import get_current_active_user
 
@@ -12,20 +13,22 @@ router = APIRouter(prefix="/subcategories", tags=["Subcategories"])
 
 @router.get("/", response_model=List[SubcategoryShow], status_code=status.HTTP_200_OK)
 def get_all_subcategories(
+    request: Request,
     controller: SubcategoryController = Depends(get_subcategory_controller),
     current_user=Security(get_current_active_user, scopes=["read"]),
 ):
     """
-    Retrieve all subcategories.
+    Retrieve all subcategories, served from a cache of precompressed bodies.
 
     Parameters:
+    - request (Request): The incoming request, for content negotiation.
     - controller (SubcategoryController): The subcategory controller instance.
     - current_user: The current user for authorization (unused here).
 
     Returns:
     - List[SubcategoryShow]: A list of subcategory objects with restricted information.
     """
-    return controller.get_all()
+    return reference_response(request, controller.get_all_document())
 
 
 @router.post("/", response_model=SubcategoryShow, status_code=status.HTTP_201_CREATED)
@@ -1,11 +1,24 @@
 """Ticket routers"""
 
-from typing import List
-from fastapi import APIRouter, Depends, Security, status
-from pydantic import UUID4
-from app.schemas import Ticket, TicketShow, TicketUpdate
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, Security, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from app.core import UUID4or7
+from app.schemas import (
+    Ticket,
+    TicketChanges,
+    TicketCommentBatch,
+    TicketCommentListQuery,
+    TicketCommentShow,
+    TicketListQuery,
+    TicketShow,
+    TicketUpdate,
+)
 from app.api.v1 import get_ticket_controller, TicketController
 from app.core.auth.oauth import get_current_active_user
+from app.infrastructure.events import ticket_event_broker
 
 router = APIRouter(prefix="/tickets", tags=["Tickets"])
 
@@ -16,15 +29,18 @@ router = APIRouter(prefix="/tickets", tags=["Tickets"])
     status_code=status.HTTP_200_OK,
 )
 def get_all_tickets(
+    request: TicketListQuery = Depends(),
     controller: TicketController = Depends(get_ticket_controller),
     current_user: Ticket = Security(get_current_active_user, scopes=["read"]),
 ):
     """
     Retrieve all tickets.
 
-    Retrieves all tickets stored in the database.
+    Retrieves all tickets stored in the database, or only those in ``category_id`` and/or ``subcategory_id``.
+    Resolved tickets moved to the archive are only returned with ``include_archived``.
 
     Parameters:
+    - request (TicketListQuery): ``include_archived`` and the optional ``category_id``/``subcategory_id`` filters.
     - controller (TicketController): The ticket controller instance.
     - _: Ticket: The current user (unused).
 
@@ -34,7 +50,7 @@ def get_all_tickets(
     Raises:
     - HTTPException: If there's an issue retrieving tickets from the database.
     """
-    return controller.get_all()
+    return controller.get_all(request)
 
 
 @router.post(
@@ -46,6 +62,7 @@ def create_ticket(
     request: Ticket,
     controller: TicketController = Depends(get_ticket_controller),
     current_user: Ticket = Security(get_current_active_user, scopes=["read"]),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key", max_length=255),
 ):
     """
     Create a new ticket.
@@ -53,7 +70,8 @@ def create_ticket(
     Parameters:
     - request (Ticket): The ticket data to create the new ticket.
     - controller (TicketController): The ticket controller instance.
-    - _: Ticket: The current user (unused).
+    - current_user (Ticket): The current user, idempotency keys are scoped to it.
+    - idempotency_key (Optional[str]): Retries sent by the same user with the same key return the first response without creating a new ticket.
 
     Returns:
     - TicketShow: The created ticket data with restricted information.
@@ -61,12 +79,12 @@ def create_ticket(
     Raises:
     - HTTPException: If there's an issue creating the ticket.
     """
-    return controller.create(request)
+    return controller.create(request, idempotency_key, str(current_user.id))
 
 
 @router.delete("/", status_code=status.HTTP_202_ACCEPTED)
 def delete_ticket(
-    ticket_id: UUID4,
+    ticket_id: UUID4or7,
     controller: TicketController = Depends(get_ticket_controller),
     current_user: Ticket = Security(get_current_active_user, scopes=["admin"]),
 ):
@@ -74,7 +92,7 @@ def delete_ticket(
     Delete a ticket.
 
     Parameters:
-    - ticket_id (UUID4): The ID of the ticket to delete.
+    - ticket_id (UUID4or7): The ID of the ticket to delete.
     - controller (TicketController): The ticket controller instance.
     - _: Ticket: The current user (unused).
 
@@ -87,17 +105,99 @@ def delete_ticket(
     return controller.delete(ticket_id)
 
 
+@router.get("/changes", response_model=TicketChanges, status_code=status.HTTP_200_OK)
+def get_ticket_changes(
+    since: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+    controller: TicketController = Depends(get_ticket_controller),
+    current_user: Ticket = Security(get_current_active_user, scopes=["read"]),
+):
+    """
+    Retrieve the tickets created, updated, deleted or archived since a watermark.
+
+    Deleted and archived tickets are returned as tombstones, with ``deleted`` or ``archived`` set; archived
+    ones can still be read with ``include_archived``. Clients store the returned ``next`` watermark and send it
+    as ``since`` on the following poll, repeating while ``has_more`` is true.
+
+    Parameters:
+    - since (Optional[str]): The watermark returned by the previous poll. Omit it to start from the beginning.
+    - limit (int): The maximum number of changes to read.
+    - controller (TicketController): The ticket controller instance.
+    - _: Ticket: The current user (unused).
+
+    Returns:
+    - TicketChanges: The changed tickets and tombstones, with the next watermark.
+
+    Raises:
+    - HTTPException: If the watermark is malformed.
+    """
+    return controller.get_changes(since, limit)
+
+
+@router.get("/stream", status_code=status.HTTP_200_OK)
+async def stream_ticket_events(
+    controller: TicketController = Depends(get_ticket_controller),
+    current_user: Ticket = Security(get_current_active_user, scopes=["read"]),
+    last_event_id: Optional[str] = Header(default=None, alias="Last-Event-ID"),
+):
+    """
+    Stream ticket changes as Server-Sent Events.
+
+    Each event carries the change type (``ticket.created``, ``ticket.updated``, ``ticket.deleted`` or
+    ``ticket.commented``), the ticket ID, its version and the changed fields. Clients reconnecting with
+    the ``Last-Event-ID`` header first receive the events they missed; if there are too many, the stream
+    ends after them and the client resumes from the last one. The broker subscription is removed once the
+    response ends, even if the client disconnected before the stream started.
+
+    Parameters:
+    - controller (TicketController): The ticket controller instance.
+    - _: Ticket: The current user (unused).
+    - last_event_id (Optional[str]): The ID of the last event received, to resume the stream.
+
+    Returns:
+    - StreamingResponse: The ``text/event-stream`` response.
+
+    Raises:
+    - HTTPException: If the Last-Event-ID is malformed.
+    """
+    subscription = ticket_event_broker.subscribe((0, 0))
+    try:
+        backlog, cursor, truncated = await run_in_threadpool(controller.get_event_backlog, last_event_id)
+    except HTTPException:
+        ticket_event_broker.unsubscribe(subscription)
+        raise
+
+    subscription.after = cursor
+    if truncated:
+        ticket_event_broker.unsubscribe(subscription)
+        subscription.offer(None)
+
+    return StreamingResponse(
+        subscription.stream(backlog),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(ticket_event_broker.unsubscribe, subscription),
+    )
+
+
 @router.get("/{ticket_id}", response_model=TicketShow, status_code=status.HTTP_200_OK)
 def get_ticket(
-    ticket_id: UUID4,
+    ticket_id: UUID4or7,
+    response: Response,
+    include_archived: bool = False,
     controller: TicketController = Depends(get_ticket_controller),
     current_user: Ticket = Security(get_current_active_user, scopes=["read"]),
 ):
     """
     Retrieve ticket by ticket ID.
 
+    The ticket version is returned in the ETag header, to be sent back as If-Match on updates. Live tickets
+    are served from the rendered-document cache when possible, without querying the database.
+
     Parameters:
-    - ticket_id (UUID4): The ID of the ticket to retrieve.
+    - ticket_id (UUID4or7): The ID of the ticket to retrieve.
+    - response (Response): The outgoing response, used to set the ETag header.
+    - include_archived (bool): Whether to look the ticket up in the archive if it is not live.
     - controller (TicketController): The ticket controller instance.
     - _: Ticket: The current user (unused).
 
@@ -107,7 +207,48 @@ def get_ticket(
     Raises:
     - HTTPException: If the ticket with the specified ID is not found.
     """
-    return controller.show(ticket_id)
+    if include_archived:
+        ticket = controller.show(ticket_id, include_archived)
+        response.headers["ETag"] = f'"{ticket.version}"'
+        return ticket
+
+    version, body = controller.show_document(ticket_id)
+    return Response(content=body, media_type="application/json", headers={"ETag": f'"{version}"'})
+
+
+@router.get("/{ticket_id}/comments", response_model=List[TicketCommentShow], status_code=status.HTTP_200_OK)
+def get_ticket_comments(
+    ticket_id: UUID4or7,
+    response: Response,
+    request: TicketCommentListQuery = Depends(),
+    controller: TicketController = Depends(get_ticket_controller),
+    current_user: Ticket = Security(get_current_active_user, scopes=["read"]),
+):
+    """
+    Retrieve the comments of a ticket, one page at a time.
+
+    Comments are ordered oldest first. When more comments follow, the cursor of the next page is
+    returned in the ``X-Next-Cursor`` response header; send it back as ``after``.
+
+    Parameters:
+    - ticket_id (UUID4or7): The ID of the live or archived ticket.
+    - response (Response): The outgoing response, used to set the X-Next-Cursor header.
+    - request (TicketCommentListQuery): The query parameters:
+        - limit (int): The maximum number of comments to return.
+        - after (Optional[str]): The cursor of the page to read.
+    - controller (TicketController): The ticket controller instance.
+    - _: Ticket: The current user (unused).
+
+    Returns:
+    - List[TicketCommentShow]: A page of the comments of the ticket.
+
+    Raises:
+    - HTTPException: If the cursor is malformed or the ticket is not found.
+    """
+    comments, next_cursor = controller.get_comments(ticket_id, request)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return comments
 
 
 @router.patch(
@@ -116,27 +257,36 @@ def get_ticket(
     status_code=status.HTTP_200_OK,
 )
 def update_ticket(
-    ticket_id: UUID4,
+    ticket_id: UUID4or7,
     request: TicketUpdate,
+    response: Response,
     controller: TicketController = Depends(get_ticket_controller),
     current_user: Ticket = Security(get_current_active_user, scopes=["read"]),
+    if_match: Optional[str] = Header(default=None, alias="If-Match"),
 ):
     """
     Update ticket data.
 
+    A ``comment`` is added to the ticket's comments, see ``GET /tickets/{ticket_id}/comments``; ``comment_user``
+    names its author and defaults to the current user.
+
     Parameters:
-    - ticket_id (UUID4): The ID of the ticket to update.
+    - ticket_id (UUID4or7): The ID of the ticket to update.
     - request (TicketUpdate): The ticket data to be updated.
+    - response (Response): The outgoing response, used to set the ETag header.
     - controller (TicketController): The ticket controller instance.
-    - _: Ticket: The current user (unused).
+    - current_user (Ticket): The current user, the author of a ``comment`` sent without ``comment_user``.
+    - if_match (Optional[str]): ETag of the version being edited; stale versions are rejected with 412.
 
     Returns:
     - TicketShow: The updated ticket data with restricted information.
 
     Raises:
-    - HTTPException: If the ticket with the specified ID is not found or if there's an issue updating the ticket.
+    - HTTPException: If the ticket with the specified ID is not found, if the ticket changed since the expected
+      version or if there's an issue updating the ticket.
     """
-    updated_ticket = controller.update(ticket_id, request)
+    updated_ticket = controller.update(ticket_id, request, if_match, current_user.username)
+    response.headers["ETag"] = f'"{updated_ticket.version}"'
     return updated_ticket
 
 
@@ -145,7 +295,7 @@ def update_ticket(
     status_code=status.HTTP_200_OK,
 )
 def add_comment(
-    ticket_id: UUID4,
+    ticket_id: UUID4or7,
     controller: TicketController = Depends(get_ticket_controller),
     current_user=Security(get_current_active_user, scopes=["admin"]),
 ):
@@ -153,7 +303,7 @@ def add_comment(
     Add a comment to a ticket using JSONPlaceholder API.
 
     Parameters:
-    - ticket_id (UUID4): The ID of the ticket to add a comment to.
+    - ticket_id (UUID4or7): The ID of the ticket to add a comment to.
     - controller (CommentController): The comment controller instance.
     - _: The current user (unused).
 
@@ -164,3 +314,33 @@ def add_comment(
     - HTTPException: If there's an issue adding the comment.
     """
     return controller.add_comment_to_ticket(ticket_id)
+
+
+@router.post(
+    "/add",
+    status_code=status.HTTP_200_OK,
+)
+def add_comments(
+    request: TicketCommentBatch,
+    controller: TicketController = Depends(get_ticket_controller),
+    current_user=Security(get_current_active_user, scopes=["admin"]),
+):
+    """
+    Add a comment from the JSONPlaceholder API to each of many tickets.
+
+    The tickets are those in ``ticket_ids`` and/or matching the ``status``, ``category_id`` and
+    ``subcategory_id`` filters, up to ``limit`` tickets. The comments are fetched once and every ticket
+    gets a different one while the corpus lasts.
+
+    Parameters:
+    - request (TicketCommentBatch): The ticket IDs and/or filters and the maximum number of tickets.
+    - controller (TicketController): The ticket controller instance.
+    - _: The current user (unused).
+
+    Returns:
+    - dict: The number and the IDs of the tickets commented on.
+
+    Raises:
+    - HTTPException: If no tickets or filters are given, or there's an issue adding the comments.
+    """
+    return controller.add_comments_to_tickets(request)
@@ -1,49 +1,65 @@
 """User routers"""
 
-from typing import List
-from fastapi import APIRouter, Depends, Security, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, Query, Response, Security, status
 from pydantic import UUID4
-from app.schemas import User, UserShow, UserUpdate, UserPassword
+from app.schemas import User, UserListItem, UserListQuery, UserShow, UserUpdate, UserPassword
 from app.api.v1 import get_user_controller, UserController
 from app.core.auth.oauth import get_current_active_user
+from app.scripts.external.external import JSONPLACEHOLDER_USER_COUNT
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.get(
     "/",
-    response_model=List[UserShow],
+    response_model=List[UserListItem],
     status_code=status.HTTP_200_OK,
 )
 def get_all_users(
+    response: Response,
+    request: UserListQuery = Depends(),
     controller: UserController = Depends(get_user_controller),
     current_user: User = Security(get_current_active_user, scopes=["admin"]),
 ):
     """
-    Retrieve all users.
+    Retrieve users, one page at a time.
 
-    Retrieves all users stored in the database.
+    Users are ordered by username. When more users match, the cursor of the next page is
+    returned in the ``X-Next-Cursor`` response header; send it back as ``after``.
 
     Parameters:
+    - request (UserListQuery): The query parameters:
+        - limit (int): The maximum number of users to return.
+        - after (Optional[str]): The cursor of the page to read.
+        - role (Optional[str]): Only return users with this role.
+        - active (Optional[bool]): Only return active or inactive users.
+        - search (Optional[str]): Only return users whose username, name or email starts with this text.
     - controller (UserController): The user controller instance.
     - _: User: The current user (unused).
 
     Returns:
-    - List[UserShow]: A list of user objects with restricted information.
+    - List[UserListItem]: A list of user objects without their passwords.
 
     Raises:
-    - HTTPException: If there's an issue retrieving users from the database.
+    - HTTPException: If the cursor is malformed or there's an issue retrieving users from the database.
     """
-    return controller.get_all()
+    users, next_cursor = controller.get_all(request)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return users
 
 
 @router.post(
     "/",
-    response_model=UserShow,
+    response_model=UserListItem,
     status_code=status.HTTP_201_CREATED,
 )
 def create_user(
-    request: User, controller: UserController = Depends(get_user_controller), current_user: User = Security(get_current_active_user, scopes=["admin"])
+    request: User,
+    controller: UserController = Depends(get_user_controller),
+    current_user: User = Security(get_current_active_user, scopes=["admin"]),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key", max_length=255),
 ):
     """
     Create a new user.
@@ -51,15 +67,16 @@ def create_user(
     Parameters:
     - request (User): The user data to create the new user.
     - controller (UserController): The user controller instance.
-    - _: User: The current user (unused).
+    - current_user (User): The current user, idempotency keys are scoped to it.
+    - idempotency_key (Optional[str]): Retries sent by the same user with the same key return the first response without creating a new user.
 
     Returns:
-    - UserShow: The created user data with restricted information.
+    - UserListItem: The created user data, without the password hash.
 
     Raises:
     - HTTPException: If there's an issue creating the user.
     """
-    return controller.create(request)
+    return controller.create(request, idempotency_key, str(current_user.id))
 
 
 @router.delete("/", status_code=status.HTTP_202_ACCEPTED)
@@ -187,3 +204,33 @@ def create_random_user(
     """
     user = controller.create_random_user()
     return user
+
+
+@router.post(
+    "/create_random_users",
+    response_model=List[UserListItem],
+    status_code=status.HTTP_201_CREATED,
+)
+def create_random_users(
+    count: int = Query(default=JSONPLACEHOLDER_USER_COUNT, ge=1, le=JSONPLACEHOLDER_USER_COUNT),
+    controller: UserController = Depends(get_user_controller),
+    current_user: User = Security(get_current_active_user, scopes=["admin"]),
+):
+    """
+    Create random users using data from an external API, fetched once for the whole batch.
+
+    The external API has ``JSONPLACEHOLDER_USER_COUNT`` users, which bounds ``count``. Users whose email or
+    username already exists are skipped, so fewer than ``count`` users may be created.
+
+    Parameters:
+    - count (int): The maximum number of users to create, at most the number of external users.
+    - controller (UserController): The user controller instance.
+    - _: User: The current user (unused).
+
+    Returns:
+    - List[UserListItem]: The created users, without their password hashes.
+
+    Raises:
+    - HTTPException: If every external user already exists or there's an issue creating the users.
+    """
+    return controller.create_random_users(count)
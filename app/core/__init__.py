@@ -4,3 +4,6 @@ from .auth.hashing import Hash
 from .auth.jwt_token import create_access_token, verify_token
 from .scopes.scopes import ROLE_SCOPES
 from .enums.enums import TicketStatus
+from .identifiers.uuids import uuid7, UUID4or7
+from .logs.logging_setup import configure_logging, request_id_var
+from .tracing.tracer import tracer, traced, traced_methods
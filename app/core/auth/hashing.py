@@ -1,15 +1,83 @@
-"""Hashing class using bcrypt encryption."""
+"""Hashing class using a configurable password hashing policy."""
 
-from passlib.context import CryptContext
+import functools
+import os
+from typing import TYPE_CHECKING, Optional, Tuple
+from dotenv import load_dotenv
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+load_dotenv()
+
+PASSWORD_HASH_SCHEME = os.environ.get("PASSWORD_HASH_SCHEME", "bcrypt")
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+ARGON2_TIME_COST = int(os.environ.get("ARGON2_TIME_COST", "3"))
+ARGON2_MEMORY_COST = int(os.environ.get("ARGON2_MEMORY_COST", "65536"))
+ARGON2_PARALLELISM = int(os.environ.get("ARGON2_PARALLELISM", "4"))
+
+SUPPORTED_SCHEMES = ("bcrypt", "argon2")
+
+
+def build_context(
+    scheme: str = PASSWORD_HASH_SCHEME,
+    bcrypt_rounds: int = BCRYPT_ROUNDS,
+    argon2_time_cost: int = ARGON2_TIME_COST,
+    argon2_memory_cost: int = ARGON2_MEMORY_COST,
+    argon2_parallelism: int = ARGON2_PARALLELISM,
+) -> "CryptContext":
+    """Build the password hashing context for a policy.
+
+    New hashes use ``scheme`` with the given parameters. Hashes made with the other scheme, or with
+    other parameters, still verify but are reported by ``needs_update`` so they are replaced on login.
+
+    Args:
+        scheme (str): The scheme of new hashes, "bcrypt" or "argon2" (argon2id).
+        bcrypt_rounds (int): The bcrypt cost factor (log2 of the iterations).
+        argon2_time_cost (int): The number of argon2 passes.
+        argon2_memory_cost (int): The argon2 memory in KiB.
+        argon2_parallelism (int): The number of argon2 lanes.
+
+    Returns:
+        CryptContext: The configured context.
+
+    Raises:
+        ValueError: If the scheme is not supported.
+    """
+    if scheme not in SUPPORTED_SCHEMES:
+        raise ValueError(f"Unsupported password hash scheme '{scheme}', expected one of {', '.join(SUPPORTED_SCHEMES)}")
+
+    from passlib.context import CryptContext  # pylint: disable=import-outside-toplevel
+
+    return CryptContext(
+        schemes=[scheme] + [other for other in SUPPORTED_SCHEMES if other != scheme],
+        deprecated="auto",
+        bcrypt__rounds=bcrypt_rounds,
+        bcrypt__min_rounds=bcrypt_rounds,
+        bcrypt__max_rounds=bcrypt_rounds,
+        argon2__type="ID",
+        argon2__time_cost=argon2_time_cost,
+        argon2__memory_cost=argon2_memory_cost,
+        argon2__parallelism=argon2_parallelism,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def pwd_context() -> "CryptContext":
+    """Get the context of the configured policy, importing passlib and its backends on first use.
+
+    Returns:
+        CryptContext: The configured context.
+    """
+    return build_context()
 
 
 class Hash:
     """A class providing methods for hashing and verifying passwords.
 
     This module provides a Hash class with methods for hashing and verifying passwords
-    using bcrypt encryption.
+    using the policy configured through PASSWORD_HASH_SCHEME, BCRYPT_ROUNDS and the
+    ARGON2_* environment variables (bcrypt with 12 rounds by default).
 
     Example:
         - hashed = Hash.bcrypt("password123")
@@ -22,7 +90,7 @@ class Hash:
 
     @staticmethod
     def bcrypt(password: str):
-        """Hash a password using bcrypt encryption.
+        """Hash a password using the configured hashing policy.
 
         Args:
             password (str): The password to be hashed.
@@ -31,7 +99,7 @@ class Hash:
             str: The hashed password.
 
         """
-        return pwd_context.hash(password)
+        return pwd_context().hash(password)
 
     @staticmethod
     def verify(plain_password, hashed_password):
@@ -45,4 +113,32 @@ class Hash:
             bool: True if the plain password matches the hashed password, False otherwise.
 
         """
-        return pwd_context.verify(plain_password, hashed_password)
+        return pwd_context().verify(plain_password, hashed_password)
+
+    @staticmethod
+    def needs_update(hashed_password: str) -> bool:
+        """Check if a hash was made with another scheme or parameters than the configured policy.
+
+        Args:
+            hashed_password (str): The stored hashed password.
+
+        Returns:
+            bool: True if the password should be rehashed.
+
+        """
+        return pwd_context().needs_update(hashed_password)
+
+    @staticmethod
+    def verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify a password and rehash it if the stored hash is outdated.
+
+        Args:
+            plain_password (str): The plain text password.
+            hashed_password (str): The stored hashed password.
+
+        Returns:
+            Tuple[bool, Optional[str]]: Whether the password matches, and the new hash to store if it
+            matched and the stored hash needs an update, None otherwise.
+
+        """
+        return pwd_context().verify_and_update(plain_password, hashed_password)
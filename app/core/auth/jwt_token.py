@@ -2,7 +2,7 @@
 
 from typing import List
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from jose import JWTError, jwt
 from app.schemas.auth import TokenData
 
@@ -26,7 +26,7 @@ def create_access_token(data: dict, scopes: List[str] = None):
     """
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire, "scopes": scopes or []})
+    to_encode.update({"exp": expire, "scopes": scopes or [], "jti": uuid.uuid4().hex})
     to_encode["id"] = str(to_encode["id"])
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
@@ -36,14 +36,14 @@ def verify_token(token: str, credentials_exception):
     """
     Verify token.
 
-    Verifies the provided JWT token and extracts the username, user ID, role, and scopes.
+    Verifies the provided JWT token and extracts the username, user ID, role, scopes, token ID and expiry.
 
     Parameters:
     - token (str): The JWT token to verify.
     - credentials_exception: The exception to raise if verification fails.
 
     Returns:
-    - schemas.TokenData: The token data containing the username, user ID, role, and scopes.
+    - schemas.TokenData: The token data containing the username, user ID, role, scopes, token ID and expiry.
 
     Raises:
     - credentials_exception: If there's an issue decoding the token or if the token is invalid.
@@ -57,7 +57,8 @@ def verify_token(token: str, credentials_exception):
         if not username or not user_id or not role:
             raise credentials_exception
         user_id_uuid = uuid.UUID(user_id)
-        token_data = TokenData(username=username, id=user_id_uuid, role=role, scopes=scopes)
+        expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc) if "exp" in payload else None
+        token_data = TokenData(username=username, id=user_id_uuid, role=role, scopes=scopes, jti=payload.get("jti"), expires_at=expires_at)
         return token_data
     except JWTError:
         raise credentials_exception from credentials_exception
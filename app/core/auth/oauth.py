@@ -3,6 +3,7 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, SecurityScopes
 from app import schemas
+from app.infrastructure.events import revocation_set
 from . import jwt_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/login")
@@ -32,7 +33,9 @@ def get_current_user(token: str = Depends(oauth2_scheme)):
 
 def get_current_active_user(security_scopes: SecurityScopes, current_user: schemas.User = Depends(get_current_user)):
     """
-    Verify that the current user has the necessary scopes.
+    Verify that the token was not revoked and the current user has the necessary scopes.
+
+    The revocation check is an in-memory lookup of the user ID and token ID, with no database query.
 
     Args:
         security_scopes (SecurityScopes): The security scopes required.
@@ -42,8 +45,15 @@ def get_current_active_user(security_scopes: SecurityScopes, current_user: schem
         schemas.User: The current user.
 
     Raises:
-        HTTPException: If the user does not have the necessary permissions.
+        HTTPException: If the token was revoked, the user is inactive or deleted, or the user does not have the necessary permissions.
     """
+    if revocation_set.is_revoked(current_user.id, current_user.jti):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     if security_scopes.scopes:
         token_scopes = current_user.scopes
         for scope in security_scopes.scopes:
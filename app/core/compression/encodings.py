@@ -0,0 +1,139 @@
+"""Content-Encoding negotiation and gzip/brotli compression of response bodies."""
+
+import gzip
+import importlib
+import zlib
+from typing import Dict, Optional, Tuple
+
+IDENTITY = "identity"
+GZIP = "gzip"
+BROTLI = "br"
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+PRECOMPRESSED_GZIP_LEVEL = 9
+PRECOMPRESSED_BROTLI_QUALITY = 11
+
+
+def _import_brotli():
+    try:
+        return importlib.import_module("brotli")
+    except ImportError:
+        return None
+
+
+brotli = _import_brotli()
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """
+    Get the content codings this process can produce, most preferred first.
+
+    Returns:
+        Tuple[str, ...]: "br" when the ``brotli`` package is installed, then "gzip".
+    """
+    return (BROTLI, GZIP) if brotli is not None else (GZIP,)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> str:
+    """
+    Choose the coding of a response from the request's ``Accept-Encoding`` header.
+
+    The coding with the highest q-value wins; ties go to brotli, then gzip. Codings with ``q=0`` are
+    never chosen, and a ``*`` entry applies to the codings not listed explicitly.
+
+    Args:
+        accept_encoding (Optional[str]): The header value, or None if it was not sent.
+
+    Returns:
+        str: "br", "gzip" or "identity".
+    """
+    if not accept_encoding:
+        return IDENTITY
+
+    weights: Dict[str, float] = {}
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.strip().partition(";")
+        coding = coding.strip().lower()
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        if coding:
+            weights[coding] = weight
+
+    best, best_weight = IDENTITY, 0.0
+    for coding in supported_encodings():
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str, precompressed: bool = False) -> bytes:
+    """
+    Compress a complete body.
+
+    Args:
+        body (bytes): The uncompressed body.
+        encoding (str): "br", "gzip" or "identity".
+        precompressed (bool): Use the highest compression level, for bodies compressed once and served many times.
+
+    Returns:
+        bytes: The encoded body.
+    """
+    if encoding == BROTLI:
+        return brotli.compress(body, quality=PRECOMPRESSED_BROTLI_QUALITY if precompressed else BROTLI_QUALITY)
+    if encoding == GZIP:
+        return gzip.compress(body, compresslevel=PRECOMPRESSED_GZIP_LEVEL if precompressed else GZIP_LEVEL, mtime=0)
+    return body
+
+
+class StreamCompressor:
+    """
+    Incremental compressor for streamed bodies.
+
+    Every chunk is flushed, so clients can decode each chunk as soon as it arrives instead of waiting
+    for the compressor's buffer to fill.
+    """
+
+    def __init__(self, encoding: str):
+        """
+        Initialize the compressor.
+
+        Args:
+            encoding (str): "br" or "gzip".
+        """
+        self.encoding = encoding
+        if encoding == BROTLI:
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes) -> bytes:
+        """
+        Compress and flush a chunk.
+
+        Args:
+            chunk (bytes): The uncompressed chunk.
+
+        Returns:
+            bytes: The encoded bytes to send.
+        """
+        if self.encoding == BROTLI:
+            return self._compressor.process(chunk) + self._compressor.flush()
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        """
+        End the stream.
+
+        Returns:
+            bytes: The remaining encoded bytes, including the format trailer.
+        """
+        if self.encoding == BROTLI:
+            return self._compressor.finish()
+        return self._compressor.flush(zlib.Z_FINISH)
@@ -0,0 +1,63 @@
+"""
+Time-ordered UUID generation and validation of ticket identifiers.
+
+UUIDv7 (RFC 9562) keys start with a millisecond Unix timestamp, so new rows land at the right edge of the
+primary key and association indexes instead of on random pages, and key order follows creation order.
+"""
+
+import os
+import threading
+import time
+import uuid
+from typing import Annotated
+from pydantic import AfterValidator
+
+
+class UUID7Generator:
+    """
+    Generate UUIDv7 identifiers that are strictly increasing within the process.
+
+    The 12 bits after the timestamp hold a counter, seeded randomly every millisecond and incremented for
+    identifiers generated within the same millisecond.
+    """
+
+    def __init__(self):
+        """Initialize the generator."""
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+
+    def __call__(self) -> uuid.UUID:
+        """
+        Generate a UUIDv7.
+
+        Returns:
+            uuid.UUID: The new identifier.
+        """
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+            else:
+                self._counter += 1
+                if self._counter > 0xFFF:
+                    self._last_ms += 1
+                    self._counter = 0
+            timestamp_ms, counter = self._last_ms, self._counter
+
+        rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFFFFFFFFFFFFFF
+        return uuid.UUID(int=(timestamp_ms & 0xFFFFFFFFFFFF) << 80 | 0x7 << 76 | counter << 64 | 0x2 << 62 | rand_b)
+
+
+uuid7 = UUID7Generator()
+
+
+def _check_version(value: uuid.UUID) -> uuid.UUID:
+    if value.version not in (4, 7):
+        raise ValueError("UUID version 4 or 7 expected")
+    return value
+
+
+UUID4or7 = Annotated[uuid.UUID, AfterValidator(_check_version)]
+"""A UUID of version 4 (random) or 7 (time-ordered); the nil UUID and other versions are rejected."""
@@ -0,0 +1,219 @@
+"""Process-wide logging: a non-blocking queue pipeline with JSON records, request IDs and rate limiting."""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+LOG_LEVELS = os.environ.get("LOG_LEVELS", "")
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "json")
+LOG_RATE_LIMIT_LEVEL = os.environ.get("LOG_RATE_LIMIT_LEVEL", "WARNING").upper()
+LOG_RATE_LIMIT_BURST = int(os.environ.get("LOG_RATE_LIMIT_BURST", "10"))
+LOG_RATE_LIMIT_PER_MINUTE = float(os.environ.get("LOG_RATE_LIMIT_PER_MINUTE", "60"))
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+RECORD_ATTRIBUTES = set(logging.makeLogRecord({}).__dict__) | {"message", "request_id", "suppressed"}
+
+
+class RequestIdFilter(logging.Filter):
+    """
+    Stamp records with the ID of the request being served, read where the record is created.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Add the ``request_id`` attribute to the record."""
+        record.request_id = request_id_var.get()
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Drop repetitive records, such as the same database error logged by every request of an error storm.
+
+    Records are grouped by logger, level and message template. Each group may log ``burst`` records at once and
+    then ``per_minute`` records per minute; the next record let through reports how many were dropped in
+    between in its ``suppressed`` attribute. Records below ``level`` are never dropped.
+    """
+
+    def __init__(self, level: int, burst: int, per_minute: float, max_keys: int = 10000):
+        """
+        Initialize the filter.
+
+        Args:
+            level (int): The lowest level that is rate limited.
+            burst (int): The number of records of a group let through at once.
+            per_minute (float): The sustained number of records of a group let through per minute.
+            max_keys (int): The number of groups tracked; the oldest ones are forgotten beyond it.
+        """
+        super().__init__()
+        self.level = level
+        self.burst = burst
+        self.rate = per_minute / 60
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, int, str], Tuple[float, float, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Let the record through if its group has a token left, counting it as suppressed otherwise."""
+        if record.levelno < self.level:
+            return True
+
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at, suppressed = self._buckets.pop(key, (float(self.burst), now, 0))
+            tokens = min(float(self.burst), tokens + (now - updated_at) * self.rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now, suppressed + 1)
+                return False
+            self._buckets[key] = (tokens - 1, now, 0)
+            while len(self._buckets) > self.max_keys:
+                del self._buckets[next(iter(self._buckets))]
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line, including the request ID and any ``extra`` fields.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Render the record as JSON."""
+        document = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            document["request_id"] = record.request_id
+        if getattr(record, "suppressed", 0):
+            document["suppressed"] = record.suppressed
+        for key, value in record.__dict__.items():
+            if key not in RECORD_ATTRIBUTES and not key.startswith("_"):
+                document[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            document["exception"] = record.exc_text
+        if record.stack_info:
+            document["stack"] = record.stack_info
+        return json.dumps(document, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """
+    Format records as plain text lines, for reading logs in a terminal during development.
+    """
+
+    def __init__(self):
+        """Initialize the formatter with the line layout."""
+        super().__init__("%(asctime)s %(levelname)s [%(name)s] [%(request_id)s] %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Render the record, noting how many similar records were suppressed before it."""
+        record.request_id = getattr(record, "request_id", None) or "-"
+        line = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        return f"{line} ({suppressed} similar messages suppressed)" if suppressed else line
+
+
+class StructuredQueueHandler(QueueHandler):
+    """
+    Queue handler keeping records structured: the message is merged with its arguments and the traceback
+    rendered to text where the record is created, but the formatting itself is left to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a copy of the record that is safe to hand to another thread."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class LoggingPipeline:
+    """
+    The root logging setup of the process.
+
+    Application threads only put records on an in-memory queue; a single listener thread formats them and
+    writes them to stderr, so a slow log sink or an error storm does not block request handling. The
+    pipeline is restarted in forked children, as the listener thread does not survive a fork.
+    """
+
+    def __init__(self):
+        """Initialize an unconfigured pipeline."""
+        self.handler: Optional[StructuredQueueHandler] = None
+        self.listener: Optional[QueueListener] = None
+        self._lock = threading.Lock()
+
+    def configure(self, level: str = LOG_LEVEL, levels: str = LOG_LEVELS, log_format: str = LOG_FORMAT):
+        """
+        Route every log record of the process through the queue, replacing any handler of the root logger.
+
+        Calling it again only updates the levels.
+
+        Args:
+            level (str): The level of the root logger.
+            levels (str): Per-logger levels, e.g. ``sqlalchemy.engine=WARNING,app.api=DEBUG``.
+            log_format (str): "json" for structured records, or "text".
+        """
+        root = logging.getLogger()
+        root.setLevel(level)
+        for entry in filter(None, (part.strip() for part in levels.split(","))):
+            name, _, logger_level = entry.partition("=")
+            logging.getLogger(name.strip()).setLevel(logger_level.strip().upper())
+
+        with self._lock:
+            if self.handler is not None:
+                return
+            stream_handler = logging.StreamHandler(sys.stderr)
+            stream_handler.setFormatter(JSONFormatter() if log_format == "json" else TextFormatter())
+            self.handler = StructuredQueueHandler(queue.SimpleQueue())
+            self.handler.addFilter(RequestIdFilter())
+            self.handler.addFilter(RateLimitFilter(logging.getLevelName(LOG_RATE_LIMIT_LEVEL), LOG_RATE_LIMIT_BURST, LOG_RATE_LIMIT_PER_MINUTE))
+            for existing in root.handlers[:]:
+                root.removeHandler(existing)
+            root.addHandler(self.handler)
+            self.listener = QueueListener(self.handler.queue, stream_handler, respect_handler_level=True)
+            self.listener.start()
+        atexit.register(self.stop)
+        os.register_at_fork(after_in_child=self._restart_in_child)
+
+    def stop(self):
+        """Write the queued records and stop the listener thread."""
+        with self._lock:
+            listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.stop()
+
+    def _restart_in_child(self):
+        self._lock = threading.Lock()
+        if self.handler is not None and self.listener is not None:
+            self.handler.queue = queue.SimpleQueue()
+            self.listener = QueueListener(self.handler.queue, *self.listener.handlers, respect_handler_level=True)
+            self.listener.start()
+
+
+logging_pipeline = LoggingPipeline()
+
+
+def configure_logging():
+    """Configure the process-wide logging pipeline from the LOG_* environment variables."""
+    logging_pipeline.configure()
@@ -0,0 +1,304 @@
+"""
+Lightweight request tracing with the span model of OpenTelemetry.
+
+Spans carry W3C trace and span IDs, a parent, attributes and a status, and are exported in the OTLP JSON
+field layout, so traces can be read by OpenTelemetry tooling. Finished traces are kept in memory for the
+debug endpoint and, if ``TRACE_FILE`` is set, appended to that file as one JSON line per trace.
+"""
+
+import functools
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+TRACING_ENABLED = os.environ.get("TRACING_ENABLED", "true").lower() == "true"
+TRACE_BUFFER_SIZE = int(os.environ.get("TRACE_BUFFER_SIZE", "500"))
+TRACE_FILE = os.environ.get("TRACE_FILE")
+
+STATUS_UNSET = "STATUS_CODE_UNSET"
+STATUS_OK = "STATUS_CODE_OK"
+STATUS_ERROR = "STATUS_CODE_ERROR"
+
+current_span_var: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """
+    A timed operation within a trace.
+    """
+
+    def __init__(
+        self, name: str, trace_id: str, parent_span_id: Optional[str] = None, attributes: Optional[Dict[str, Any]] = None, is_root: bool = False
+    ):
+        """
+        Start a span.
+
+        Args:
+            name (str): The operation name, e.g. ``TicketController.show`` or ``SELECT tickets``.
+            trace_id (str): The 32 hex digit ID of the trace.
+            parent_span_id (Optional[str]): The 16 hex digit ID of the parent span, which may belong to another service.
+            attributes (Optional[Dict[str, Any]]): Initial attributes.
+            is_root (bool): Whether this is the first span of the trace in this process.
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.is_root = is_root
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status = STATUS_UNSET
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self._start_perf_ns = time.perf_counter_ns()
+        self._end_perf_ns: Optional[int] = None
+
+    @property
+    def duration_ms(self) -> float:
+        """The duration of the span in milliseconds, up to now if it has not ended."""
+        end = self._end_perf_ns if self._end_perf_ns is not None else time.perf_counter_ns()
+        return (end - self._start_perf_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any):
+        """
+        Set an attribute of the span.
+
+        Args:
+            key (str): The attribute name, e.g. ``db.statement``.
+            value (Any): The attribute value.
+        """
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException):
+        """
+        Mark the span as failed by an exception.
+
+        Args:
+            exception (BaseException): The exception raised within the span.
+        """
+        self.status = STATUS_ERROR
+        self.attributes["exception.type"] = type(exception).__name__
+        self.attributes["exception.message"] = str(exception)
+
+    def end(self):
+        """End the span, measuring its duration with the monotonic clock."""
+        if self._end_perf_ns is None:
+            self._end_perf_ns = time.perf_counter_ns()
+            self.end_time_ns = self.start_time_ns + (self._end_perf_ns - self._start_perf_ns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Export the span in the OTLP JSON field layout.
+
+        Returns:
+            Dict[str, Any]: The span.
+        """
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "startTimeUnixNano": self.start_time_ns,
+            "endTimeUnixNano": self.end_time_ns,
+            "durationMs": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "status": {"code": self.status},
+        }
+
+
+class InMemoryTraceExporter:
+    """
+    Keep the most recent finished traces, optionally appending each one to a JSON lines file.
+
+    Spans are collected per trace as they end; a trace is finished when its root span in this process ends.
+    """
+
+    def __init__(self, max_traces: int, path: Optional[str] = None, max_pending: int = 10000):
+        """
+        Initialize the exporter.
+
+        Args:
+            max_traces (int): The number of finished traces kept.
+            path (Optional[str]): A file each finished trace is appended to, or None.
+            max_pending (int): The number of unfinished traces tracked; the oldest are dropped beyond it.
+        """
+        self.path = path
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._traces: deque = deque(maxlen=max_traces)
+
+    def export(self, span: Span):
+        """
+        Collect an ended span.
+
+        Args:
+            span (Span): The span.
+        """
+        with self._lock:
+            spans = self._pending.setdefault(span.trace_id, [])
+            spans.append(span)
+            if not span.is_root:
+                while len(self._pending) > self.max_pending:
+                    self._pending.popitem(last=False)
+                return
+            del self._pending[span.trace_id]
+            trace = {
+                "traceId": span.trace_id,
+                "name": span.name,
+                "durationMs": round(span.duration_ms, 3),
+                "startTimeUnixNano": span.start_time_ns,
+                "spans": [item.to_dict() for item in sorted(spans, key=lambda item: item.start_time_ns)],
+            }
+            self._traces.append(trace)
+        if self.path:
+            with open(self.path, "a", encoding="utf-8") as trace_file:
+                trace_file.write(json.dumps(trace, default=str) + "\n")
+
+    def traces(self, min_duration_ms: float = 0, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Get the slowest recent traces.
+
+        Args:
+            min_duration_ms (float): Only traces at least this long are returned.
+            limit (int): The maximum number of traces returned.
+
+        Returns:
+            List[Dict[str, Any]]: The traces, slowest first.
+        """
+        with self._lock:
+            traces = [trace for trace in self._traces if trace["durationMs"] >= min_duration_ms]
+        return sorted(traces, key=lambda trace: trace["durationMs"], reverse=True)[:limit]
+
+    def clear(self):
+        """Drop every trace."""
+        with self._lock:
+            self._pending.clear()
+            self._traces.clear()
+
+
+class Tracer:
+    """
+    Create spans nested through a context variable, so they follow requests across threads and tasks.
+    """
+
+    def __init__(self, exporter: InMemoryTraceExporter, enabled: bool = True):
+        """
+        Initialize the tracer.
+
+        Args:
+            exporter (InMemoryTraceExporter): Where ended spans are sent.
+            enabled (bool): Whether spans are recorded at all.
+        """
+        self.exporter = exporter
+        self.enabled = enabled
+
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None, trace_id: Optional[str] = None, parent_span_id: Optional[str] = None
+    ) -> Span:
+        """
+        Start a span as a child of the current span, without making it current.
+
+        Args:
+            name (str): The operation name.
+            attributes (Optional[Dict[str, Any]]): Initial attributes.
+            trace_id (Optional[str]): The trace to join for a root span, e.g. from an incoming ``traceparent``.
+            parent_span_id (Optional[str]): The remote parent of a root span.
+
+        Returns:
+            Span: The started span.
+        """
+        parent = current_span_var.get()
+        if parent is not None:
+            return Span(name, parent.trace_id, parent.span_id, attributes)
+        return Span(name, trace_id or secrets.token_hex(16), parent_span_id, attributes, is_root=True)
+
+    def end_span(self, span: Span):
+        """
+        End a span and export it.
+
+        Args:
+            span (Span): The span.
+        """
+        span.end()
+        self.exporter.export(span)
+
+    @contextmanager
+    def start_as_current_span(self, name: str, attributes: Optional[Dict[str, Any]] = None, **kwargs) -> Iterator[Optional[Span]]:
+        """
+        Run a block within a new current span, recording any exception raised in it.
+
+        Args:
+            name (str): The operation name.
+            attributes (Optional[Dict[str, Any]]): Initial attributes.
+            **kwargs: ``trace_id`` and ``parent_span_id`` for a root span continuing a remote trace.
+
+        Yields:
+            Optional[Span]: The span, or None if tracing is disabled.
+        """
+        if not self.enabled:
+            yield None
+            return
+        span = self.start_span(name, attributes, **kwargs)
+        token = current_span_var.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            current_span_var.reset(token)
+            self.end_span(span)
+
+
+tracer = Tracer(InMemoryTraceExporter(TRACE_BUFFER_SIZE, TRACE_FILE), enabled=TRACING_ENABLED)
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """
+    Decorate a function to run it within a span.
+
+    Spans are only recorded inside a trace, such as a request, so functions called at startup or from
+    scripts do not create traces of their own.
+
+    Args:
+        name (Optional[str]): The span name. Defaults to the function's qualified name.
+
+    Returns:
+        Callable[[Callable], Callable]: The decorator.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        span_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if current_span_var.get() is None:
+                return function(*args, **kwargs)
+            with tracer.start_as_current_span(span_name, {"code.function": function.__qualname__}):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def traced_methods(cls: type) -> type:
+    """
+    Decorate a class to run each of its public methods within a span named ``Class.method``.
+
+    Args:
+        cls (type): The class.
+
+    Returns:
+        type: The same class.
+    """
+    for attribute, value in list(vars(cls).items()):
+        if not attribute.startswith("_") and callable(value) and not isinstance(value, (staticmethod, classmethod)):
+            setattr(cls, attribute, traced(f"{cls.__name__}.{attribute}")(value))
+    return cls
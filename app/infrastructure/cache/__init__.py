@@ -0,0 +1,17 @@
+"""
+This module provides the caches of rendered ticket documents and reference lists.
+"""
+
+from app.infrastructure.cache.ticket_documents import (
+    TICKET_CACHE_CHANNEL,
+    LRUBackend,
+    RedisBackend,
+    TicketDocumentCache,
+    ticket_document_cache,
+)
+from app.infrastructure.cache.reference_documents import (
+    REFERENCE_CACHE_CHANNEL,
+    ReferenceDocument,
+    ReferenceDocumentCache,
+    reference_document_cache,
+)
@@ -0,0 +1,141 @@
+"""Cache of the rendered, precompressed reference lists: categories, severities and subcategories."""
+
+import hashlib
+import threading
+from typing import Callable, Dict, Optional
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.core.compression.encodings import IDENTITY, compress, supported_encodings
+from app.infrastructure.events.listener import NotificationListener, notification_listener
+
+REFERENCE_CACHE_CHANNEL = "reference_cache"
+
+
+class ReferenceDocument:
+    """
+    A rendered JSON list with a body for every supported content coding, compressed once when cached.
+    """
+
+    def __init__(self, body: bytes):
+        """
+        Render the document's codings.
+
+        Args:
+            body (bytes): The uncompressed JSON body.
+        """
+        self.etag = f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+        self.bodies: Dict[str, bytes] = {IDENTITY: body}
+        for encoding in supported_encodings():
+            self.bodies[encoding] = compress(body, encoding, precompressed=True)
+
+
+class ReferenceDocumentCache:
+    """
+    Keep the reference lists in memory, as they are read on every page load and rarely change.
+
+    Writers to categories, subcategories or severities call ``notify`` in their transaction and ``invalidate``
+    after committing; every list is dropped at once, since a category change also changes the subcategory list.
+    Other processes drop theirs when the notification arrives, and every list is dropped when the listener
+    reconnects. As for ticket documents, ``put`` discards a list rendered from a read that started before an
+    invalidation.
+    """
+
+    def __init__(self, listener: NotificationListener):
+        """
+        Initialize an empty cache.
+
+        Args:
+            listener (NotificationListener): The listener providing invalidation notifications.
+        """
+        self.listener = listener
+        self._lock = threading.Lock()
+        self._documents: Dict[str, ReferenceDocument] = {}
+        self._sequence = 0
+        self._started = False
+
+    def get(self, key: str) -> Optional[ReferenceDocument]:
+        """
+        Get a cached list.
+
+        Args:
+            key (str): The list name, including any variant, e.g. ``categories?include=subcategories``.
+
+        Returns:
+            Optional[ReferenceDocument]: The document, or None on a miss.
+        """
+        if not self._started:
+            self._start()
+        return self._documents.get(key)
+
+    def token(self) -> int:
+        """
+        Get the invalidation position to pass to ``put``; must be read before querying the database.
+
+        Returns:
+            int: The current invalidation sequence number.
+        """
+        return self._sequence
+
+    def put(self, key: str, body: bytes, token: int) -> ReferenceDocument:
+        """
+        Compress a rendered list and store it unless the lists were invalidated after ``token`` was read.
+
+        Args:
+            key (str): The list name.
+            body (bytes): The rendered JSON.
+            token (int): The value of ``token()`` read before the list was loaded.
+
+        Returns:
+            ReferenceDocument: The document, stored or not.
+        """
+        document = ReferenceDocument(body)
+        with self._lock:
+            if self._sequence == token:
+                self._documents[key] = document
+        return document
+
+    def get_or_render(self, key: str, render: Callable[[], bytes]) -> ReferenceDocument:
+        """
+        Get a cached list, rendering and storing it on a miss.
+
+        Args:
+            key (str): The list name.
+            render (Callable[[], bytes]): Loads the list from the database and returns its JSON.
+
+        Returns:
+            ReferenceDocument: The document.
+        """
+        document = self.get(key)
+        if document is None:
+            token = self.token()
+            document = self.put(key, render(), token)
+        return document
+
+    def invalidate(self):
+        """Drop every list in this process."""
+        with self._lock:
+            self._sequence += 1
+            self._documents.clear()
+
+    @staticmethod
+    def notify(db: Session):
+        """
+        Invalidate the lists in every process once the caller's transaction commits.
+
+        Args:
+            db (Session): The session of the transaction making the change.
+        """
+        db.execute(select(func.pg_notify(REFERENCE_CACHE_CHANNEL, "")))
+
+    def _start(self):
+        with self._lock:
+            start = not self._started
+            self._started = True
+        if start:
+            self.listener.subscribe(REFERENCE_CACHE_CHANNEL, self._on_notification)
+
+    def _on_notification(self, _payload: Optional[str]):
+        self.invalidate()
+
+
+reference_document_cache = ReferenceDocumentCache(notification_listener)
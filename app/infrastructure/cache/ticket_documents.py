@@ -0,0 +1,304 @@
+"""Cache of rendered ticket documents, invalidated across processes with Postgres notifications."""
+
+import importlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.infrastructure.events.listener import NotificationListener, notification_listener
+
+logger = logging.getLogger(__name__)
+
+TICKET_CACHE_CHANNEL = "ticket_cache"
+TICKET_CACHE_SIZE = int(os.environ.get("TICKET_CACHE_SIZE", "10000"))
+TICKET_CACHE_REDIS_URL = os.environ.get("TICKET_CACHE_REDIS_URL")
+TICKET_CACHE_TTL_SECONDS = int(os.environ.get("TICKET_CACHE_TTL_SECONDS", "3600"))
+INVALIDATE_ALL = "*"
+NOTIFY_PAYLOAD_LIMIT = 7900
+
+Document = Tuple[int, bytes]
+
+
+class LRUBackend:
+    """
+    In-process storage for ticket documents, evicting the least recently used ones.
+    """
+
+    errors: Tuple[type, ...] = ()
+
+    def __init__(self, max_size: int):
+        """
+        Initialize the backend.
+
+        Args:
+            max_size (int): The maximum number of documents kept.
+        """
+        self.max_size = max_size
+        self._documents: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a document and mark it as recently used.
+
+        Args:
+            key (str): The ticket ID.
+
+        Returns:
+            Optional[bytes]: The stored value, or None.
+        """
+        with self._lock:
+            value = self._documents.get(key)
+            if value is not None:
+                self._documents.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes):
+        """
+        Store a document.
+
+        Args:
+            key (str): The ticket ID.
+            value (bytes): The value to store.
+        """
+        with self._lock:
+            self._documents[key] = value
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+
+    def delete(self, keys: Iterable[str]):
+        """
+        Remove documents.
+
+        Args:
+            keys (Iterable[str]): The ticket IDs.
+        """
+        with self._lock:
+            for key in keys:
+                self._documents.pop(key, None)
+
+    def clear(self):
+        """Remove every document."""
+        with self._lock:
+            self._documents.clear()
+
+
+class RedisBackend:
+    """
+    Redis storage for ticket documents, shared by every worker and host.
+
+    Requires the ``redis`` package, which is only imported when this backend is configured.
+    """
+
+    def __init__(self, url: str, ttl_seconds: int, prefix: str = "ticket-document:"):
+        """
+        Initialize the backend.
+
+        Args:
+            url (str): The Redis URL, e.g. ``redis://cache:6379/0``.
+            ttl_seconds (int): How long a document is kept at most.
+            prefix (str): The prefix of the Redis keys.
+        """
+        redis = importlib.import_module("redis")
+        self.errors = (redis.RedisError,)
+        self.client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a document.
+
+        Args:
+            key (str): The ticket ID.
+
+        Returns:
+            Optional[bytes]: The stored value, or None.
+        """
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes):
+        """
+        Store a document.
+
+        Args:
+            key (str): The ticket ID.
+            value (bytes): The value to store.
+        """
+        self.client.set(self.prefix + key, value, ex=self.ttl_seconds)
+
+    def delete(self, keys: Iterable[str]):
+        """
+        Remove documents.
+
+        Args:
+            keys (Iterable[str]): The ticket IDs.
+        """
+        names = [self.prefix + key for key in keys]
+        if names:
+            self.client.delete(*names)
+
+    def clear(self):
+        """Remove every document."""
+        names = list(self.client.scan_iter(match=self.prefix + "*", count=1000))
+        for start in range(0, len(names), 1000):
+            self.client.delete(*names[start : start + 1000])
+
+
+class TicketDocumentCache:
+    """
+    Serve the rendered JSON of ``GET /tickets/{id}`` without touching the database.
+
+    Writers call ``notify`` in the transaction that changes a ticket, or anything rendered in it, and
+    ``invalidate`` after committing. The notification makes every other process drop the document too,
+    and each process drops everything when its listener reconnects, since notifications may have been missed.
+
+    A document rendered from a read that started before an invalidation is never stored: ``put`` takes the
+    ``token`` read before querying the database and discards the document if the ticket was invalidated since.
+    """
+
+    def __init__(self, backend, listener: NotificationListener, tracked_invalidations: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            backend (LRUBackend | RedisBackend): Where documents are stored.
+            listener (NotificationListener): The listener providing invalidation notifications.
+            tracked_invalidations (int): How many recent per-ticket invalidations are remembered for ``put``.
+        """
+        self.backend = backend
+        self.listener = listener
+        self.tracked_invalidations = tracked_invalidations
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._floor = 0
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()
+        self._started = False
+
+    def get(self, ticket_id) -> Optional[Document]:
+        """
+        Get the cached document of a ticket.
+
+        Args:
+            ticket_id (UUID): The ticket ID.
+
+        Returns:
+            Optional[Document]: The ticket version and JSON body, or None on a miss.
+        """
+        if not self._started:
+            self._start()
+        try:
+            value = self.backend.get(str(ticket_id))
+        except self.backend.errors as e:
+            logger.error("Error reading ticket document %s: %s", ticket_id, e)
+            return None
+        if value is None:
+            return None
+        version, _, body = value.partition(b" ")
+        return int(version), body
+
+    def token(self) -> int:
+        """
+        Get the invalidation position to pass to ``put``; must be read before querying the database.
+
+        Returns:
+            int: The current invalidation sequence number.
+        """
+        return self._sequence
+
+    def put(self, ticket_id, version: int, body: bytes, token: int):
+        """
+        Store the document of a ticket unless it was invalidated after ``token`` was read.
+
+        Args:
+            ticket_id (UUID): The ticket ID.
+            version (int): The ticket version, returned as the ETag.
+            body (bytes): The rendered JSON.
+            token (int): The value of ``token()`` read before the ticket was loaded.
+        """
+        key = str(ticket_id)
+        if self._is_stale(key, token):
+            return
+        try:
+            self.backend.set(key, f"{version} ".encode() + body)
+            if self._is_stale(key, token):
+                self.backend.delete([key])
+        except self.backend.errors as e:
+            logger.error("Error storing ticket document %s: %s", ticket_id, e)
+
+    def invalidate(self, ticket_ids: Optional[Iterable] = None):
+        """
+        Drop the documents of some tickets, or of every ticket, in this process.
+
+        Args:
+            ticket_ids (Optional[Iterable]): The ticket IDs, or None for every ticket.
+        """
+        keys = None if ticket_ids is None else [str(ticket_id) for ticket_id in ticket_ids]
+        with self._lock:
+            self._sequence += 1
+            if keys is None:
+                self._floor = self._sequence
+                self._invalidated.clear()
+            else:
+                for key in keys:
+                    self._invalidated[key] = self._sequence
+                    self._invalidated.move_to_end(key)
+                while len(self._invalidated) > self.tracked_invalidations:
+                    _, sequence = self._invalidated.popitem(last=False)
+                    self._floor = max(self._floor, sequence)
+        try:
+            if keys is None:
+                self.backend.clear()
+            else:
+                self.backend.delete(keys)
+        except self.backend.errors as e:
+            logger.error("Error invalidating ticket documents: %s", e)
+
+    @staticmethod
+    def notify(db: Session, ticket_ids: Optional[Iterable] = None):
+        """
+        Invalidate documents in every process once the caller's transaction commits.
+
+        Args:
+            db (Session): The session of the transaction making the change.
+            ticket_ids (Optional[Iterable]): The changed ticket IDs, or None for every ticket.
+        """
+        if ticket_ids is None:
+            db.execute(select(func.pg_notify(TICKET_CACHE_CHANNEL, INVALIDATE_ALL)))
+            return
+
+        payload = ""
+        for ticket_id in ticket_ids:
+            if len(payload) + len(str(ticket_id)) >= NOTIFY_PAYLOAD_LIMIT:
+                db.execute(select(func.pg_notify(TICKET_CACHE_CHANNEL, payload)))
+                payload = ""
+            payload = f"{payload},{ticket_id}" if payload else str(ticket_id)
+        if payload:
+            db.execute(select(func.pg_notify(TICKET_CACHE_CHANNEL, payload)))
+
+    def _is_stale(self, key: str, token: int) -> bool:
+        with self._lock:
+            return self._floor > token or self._invalidated.get(key, 0) > token
+
+    def _start(self):
+        with self._lock:
+            start = not self._started
+            self._started = True
+        if start:
+            self.listener.subscribe(TICKET_CACHE_CHANNEL, self._on_notification)
+
+    def _on_notification(self, payload: Optional[str]):
+        if payload is None or payload == INVALIDATE_ALL:
+            self.invalidate()
+        else:
+            self.invalidate(payload.split(","))
+
+
+ticket_document_cache = TicketDocumentCache(
+    RedisBackend(TICKET_CACHE_REDIS_URL, TICKET_CACHE_TTL_SECONDS) if TICKET_CACHE_REDIS_URL else LRUBackend(TICKET_CACHE_SIZE),
+    notification_listener,
+)
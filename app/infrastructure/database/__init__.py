@@ -5,6 +5,8 @@ from dotenv import load_dotenv
 from sqlalchemy import create_engine
 
 from sqlalchemy.orm import sessionmaker, scoped_session
+from .tracing import instrument_engine
+from .slow_queries import SLOW_QUERY_LOG_ENABLED, slow_query_log
 
 load_dotenv()
 
@@ -17,6 +19,9 @@ DB_NAME = os.environ["DB_NAME"]
 connection_string = f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 engine = create_engine(connection_string, pool_size=20, max_overflow=10)
+instrument_engine(engine)
+if SLOW_QUERY_LOG_ENABLED:
+    slow_query_log.instrument(engine)
 
 SessionLocal = scoped_session(sessionmaker(bind=engine, autocommit=False, autoflush=False))
 
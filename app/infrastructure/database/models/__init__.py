@@ -9,3 +9,9 @@ from app.infrastructure.database.models.subcategory import Subcategory
 from app.infrastructure.database.models.user import User
 from app.infrastructure.database.models.ticket_category import TicketCategory
 from app.infrastructure.database.models.ticket_subcategory import TicketSubcategory
+from app.infrastructure.database.models.idempotency_key import IdempotencyKey
+from app.infrastructure.database.models.ticket_event import TicketEvent
+from app.infrastructure.database.models.refresh_token import RefreshToken
+from app.infrastructure.database.models.token_revocation import TokenRevocation
+from app.infrastructure.database.models.ticket_archive import TicketArchive
+from app.infrastructure.database.models.ticket_comment import TicketComment
@@ -20,13 +20,11 @@ class Category(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
 
-    ticket_categories = relationship("TicketCategory", back_populates="category")
-    subcategories = relationship("Subcategory", back_populates="category")
+    ticket_categories = relationship("TicketCategory", back_populates="category", cascade="all, delete", passive_deletes=True)
+    subcategories = relationship("Subcategory", back_populates="category", cascade="all, delete", passive_deletes=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    ticket_categories = relationship("TicketCategory", back_populates="category")
-
     def __repr__(self):
         """Return a string representation of the Category instance."""
         return f"<Category id={self.id} name={self.name}>"
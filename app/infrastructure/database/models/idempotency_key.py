@@ -0,0 +1,48 @@
+"""IdempotencyKey Model"""
+
+from sqlalchemy import Column, DateTime, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from app.infrastructure.database.base import Base
+
+
+class IdempotencyKey(Base):
+    """
+    Represents the stored outcome of a request sent with an Idempotency-Key header.
+
+    Attributes:
+        scope (str): The resource and the caller the key belongs to (e.g. "tickets:<user id>").
+        key (str): The client-supplied idempotency key.
+        request_hash (str): HMAC-SHA-256 fingerprint of the original request payload, keyed with the app secret.
+        response (dict): The response body returned to the first request.
+        created_at (DateTime): Timestamp when the key was first used.
+        expires_at (DateTime): Timestamp after which the key may be reused.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    scope = Column(String, primary_key=True)
+    key = Column(String(255), primary_key=True)
+    request_hash = Column(String(64), nullable=False)
+    response = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+    def __repr__(self):
+        """Return a string representation of the IdempotencyKey instance."""
+        return f"<IdempotencyKey scope={self.scope} key={self.key}>"
+
+    def to_dict(self):
+        """
+        Convert the IdempotencyKey instance to a dictionary.
+
+        Returns:
+            dict: A dictionary representation of the IdempotencyKey instance.
+        """
+        return {
+            "scope": self.scope,
+            "key": self.key,
+            "request_hash": self.request_hash,
+            "response": self.response,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "expires_at": self.expires_at.isoformat(),
+        }
@@ -0,0 +1,54 @@
+"""RefreshToken Model"""
+
+import uuid
+from sqlalchemy import Column, DateTime, ForeignKey, String, UUID, func
+from app.infrastructure.database.base import Base
+
+
+class RefreshToken(Base):
+    """
+    Represents an issued refresh token.
+
+    Only the SHA-256 digest of the token is stored. Every refresh revokes the presented token and issues a
+    new one in the same family; presenting a revoked token again means it was stolen or replayed, and the
+    whole family is revoked.
+
+    Attributes:
+        id (UUID): The unique identifier of the token.
+        token_hash (str): Hex SHA-256 digest of the opaque token.
+        family_id (UUID): Identifier shared by every token rotated from the same login.
+        user_id (UUID): The user the token was issued to.
+        created_at (DateTime): Timestamp when the token was issued.
+        expires_at (DateTime): Timestamp after which the token is no longer accepted.
+        revoked_at (DateTime): Timestamp when the token was rotated or revoked, if it was.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    token_hash = Column(String(64), nullable=False, unique=True, index=True)
+    family_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        """Return a string representation of the RefreshToken instance."""
+        return f"<RefreshToken id={self.id} user_id={self.user_id} family_id={self.family_id}>"
+
+    def to_dict(self):
+        """
+        Convert the RefreshToken instance to a dictionary.
+
+        Returns:
+            dict: A dictionary representation of the RefreshToken instance.
+        """
+        return {
+            "id": str(self.id),
+            "family_id": str(self.family_id),
+            "user_id": str(self.user_id),
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "expires_at": self.expires_at.isoformat(),
+            "revoked_at": self.revoked_at.isoformat() if self.revoked_at else None,
+        }
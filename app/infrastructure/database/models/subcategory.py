@@ -20,9 +20,9 @@ class Subcategory(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
-    category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id"), nullable=False)
+    category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id", ondelete="CASCADE"), nullable=False)
 
-    ticket_subcategories = relationship("TicketSubcategory", back_populates="subcategory")
+    ticket_subcategories = relationship("TicketSubcategory", back_populates="subcategory", cascade="all, delete", passive_deletes=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -1,11 +1,11 @@
 """Ticket Model"""
 
-import uuid
-from sqlalchemy import UUID, Column, DateTime, String, Text, ForeignKey, Enum as SAEnum
+from sqlalchemy import UUID, Column, DateTime, Index, Integer, String, Text, ForeignKey, Enum as SAEnum
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.infrastructure.database.base import Base
-from app.core import TicketStatus
+from app.core import TicketStatus, uuid7
 
 
 class Ticket(Base):
@@ -13,30 +13,46 @@ class Ticket(Base):
     Represents a support or issue ticket in the system.
 
     Attributes:
-        id (UUID): Primary key for the ticket.
+        id (UUID): Time-ordered (UUIDv7) primary key for the ticket.
         title (str): Title of the ticket.
         description (str): Detailed description of the ticket issue.
         severity_id (UUID): Foreign key linking to the ticket's severity.
         status (TicketStatus): Status of the ticket (ABERTO, EM_PROGRESSO, RESOLVIDO).
+        comment (str): A snippet of the latest comment, the full history is in ``ticket_comments``.
+        comment_user (str): The author of the latest comment.
+        comment_count (int): The number of comments on the ticket.
         created_at (timestamp): Timestamp when the ticket was created.
         updated_at (timestamp): Timestamp when the ticket was last updated.
+        version (int): Row version, bumped on every write and checked by the UPDATE to detect concurrent changes.
+        category_ids (List[UUID]): The categories of the ticket, a GIN-indexed copy of ``ticket_categories``.
+        subcategory_ids (List[UUID]): The subcategories of the ticket, a GIN-indexed copy of ``ticket_subcategories``.
     """
 
     __tablename__ = "tickets"
+    __table_args__ = (
+        Index("ix_tickets_category_ids", "category_ids", postgresql_using="gin"),
+        Index("ix_tickets_subcategory_ids", "subcategory_ids", postgresql_using="gin"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("uuid_generate_v7()"))
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     severity_id = Column(UUID(as_uuid=True), ForeignKey("severity.id"), nullable=False)
     status = Column(SAEnum(TicketStatus), default=TicketStatus.ABERTO, nullable=False)
     comment = Column(Text, nullable=True)
     comment_user = Column(String, nullable=True)
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    ticket_categories = relationship("TicketCategory", back_populates="ticket", cascade="all, delete-orphan")
-    ticket_subcategories = relationship("TicketSubcategory", back_populates="ticket")
+    version = Column(Integer, nullable=False, server_default="1")
+    category_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, default=list, server_default="{}")
+    subcategory_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, default=list, server_default="{}")
+    ticket_categories = relationship("TicketCategory", back_populates="ticket", cascade="all, delete-orphan", passive_deletes=True)
+    ticket_subcategories = relationship("TicketSubcategory", back_populates="ticket", cascade="all, delete-orphan", passive_deletes=True)
     severity = relationship("Severity", back_populates="tickets")
 
+    __mapper_args__ = {"version_id_col": version}
+
     def __repr__(self):
         """Return a string representation of the Ticket instance."""
         return f"<Ticket id={self.id} title={self.title} status={self.status}>"
@@ -56,8 +72,10 @@ class Ticket(Base):
             "status": self.status.value,
             "comment": self.comment,
             "comment_user": self.comment_user,
+            "comment_count": self.comment_count,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "version": self.version,
         }
 
     @classmethod
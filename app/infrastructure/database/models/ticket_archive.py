@@ -0,0 +1,62 @@
+"""TicketArchive Model"""
+
+from sqlalchemy import UUID, Column, DateTime, Index, Integer, String, Text, ForeignKey, Enum as SAEnum, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import relationship
+from app.infrastructure.database.base import Base
+from app.core import TicketStatus
+
+
+class TicketArchive(Base):
+    """
+    Represents a resolved ticket moved out of the ``tickets`` table by the archival job.
+
+    The table is range-partitioned by ``created_at`` month, one ``tickets_archive_YYYY_MM`` partition per
+    month created on demand, so old months can be detached or dropped without touching the live tickets.
+    Archived tickets are read-only; their categories and subcategories are kept as ID arrays instead of
+    association rows.
+
+    Attributes:
+        id (UUID): The ID the ticket had in the ``tickets`` table.
+        created_at (timestamp): Timestamp when the ticket was created, the partition key.
+        title (str): Title of the ticket.
+        description (str): Detailed description of the ticket issue.
+        severity_id (UUID): Foreign key linking to the ticket's severity.
+        status (TicketStatus): Status of the ticket when it was archived.
+        comment (str): A snippet of the latest comment added to the ticket.
+        comment_user (str): The author of the latest comment.
+        comment_count (int): The number of comments on the ticket.
+        updated_at (timestamp): Timestamp when the ticket was last updated.
+        version (int): The ticket version when it was archived.
+        category_ids (List[UUID]): The categories of the ticket.
+        subcategory_ids (List[UUID]): The subcategories of the ticket.
+        archived_at (timestamp): Timestamp when the ticket was archived.
+    """
+
+    __tablename__ = "tickets_archive"
+    __table_args__ = (
+        Index("ix_tickets_archive_category_ids", "category_ids", postgresql_using="gin"),
+        Index("ix_tickets_archive_subcategory_ids", "subcategory_ids", postgresql_using="gin"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    created_at = Column(DateTime(timezone=True), primary_key=True)
+    title = Column(String, nullable=False)
+    description = Column(Text, nullable=True)
+    severity_id = Column(UUID(as_uuid=True), ForeignKey("severity.id"), nullable=False)
+    status = Column(SAEnum(TicketStatus), nullable=False)
+    comment = Column(Text, nullable=True)
+    comment_user = Column(String, nullable=True)
+    comment_count = Column(Integer, nullable=False, server_default="0")
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+    version = Column(Integer, nullable=False)
+    category_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, server_default="{}")
+    subcategory_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, server_default="{}")
+    archived_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    severity = relationship("Severity")
+
+    def __repr__(self):
+        """Return a string representation of the TicketArchive instance."""
+        return f"<TicketArchive id={self.id} title={self.title} archived_at={self.archived_at}>"
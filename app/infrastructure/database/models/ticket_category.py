@@ -16,8 +16,8 @@ class TicketCategory(Base):
 
     __tablename__ = "ticket_categories"
 
-    ticket_id = Column(UUID(as_uuid=True), ForeignKey("tickets.id"), primary_key=True)
-    category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id"), primary_key=True)
+    ticket_id = Column(UUID(as_uuid=True), ForeignKey("tickets.id", ondelete="CASCADE"), primary_key=True)
+    category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True)
 
     ticket = relationship("Ticket", back_populates="ticket_categories")
     category = relationship("Category", back_populates="ticket_categories")
@@ -0,0 +1,34 @@
+"""TicketComment Model"""
+
+from sqlalchemy import UUID, Column, DateTime, Index, String, Text, func, text
+from app.infrastructure.database.base import Base
+from app.core import uuid7
+
+
+class TicketComment(Base):
+    """
+    Represents a comment added to a ticket.
+
+    Comments are only read one page at a time, through the ``(ticket_id, created_at)`` index; the ticket
+    itself only carries their count and a snippet of the latest one.
+
+    Attributes:
+        id (UUID): Time-ordered (UUIDv7) primary key for the comment.
+        ticket_id (UUID): The ticket the comment belongs to. Not a foreign key, archived tickets keep their comments.
+        body (str): The text of the comment.
+        author (str): The author of the comment.
+        created_at (timestamp): Timestamp when the comment was added.
+    """
+
+    __tablename__ = "ticket_comments"
+    __table_args__ = (Index("ix_ticket_comments_ticket_id_created_at", "ticket_id", "created_at"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("uuid_generate_v7()"))
+    ticket_id = Column(UUID(as_uuid=True), nullable=False)
+    body = Column(Text, nullable=False)
+    author = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self):
+        """Return a string representation of the TicketComment instance."""
+        return f"<TicketComment id={self.id} ticket_id={self.ticket_id} author={self.author}>"
@@ -0,0 +1,61 @@
+"""TicketEvent Model"""
+
+from sqlalchemy import BigInteger, Column, DateTime, Identity, Index, Integer, String, UUID, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from app.infrastructure.database.base import Base
+
+
+class TicketEvent(Base):
+    """
+    Represents a ticket change recorded in the transactional outbox.
+
+    Events are inserted in the same transaction as the ticket change they describe. ``txid`` is the id of
+    that transaction; ordering by ``(txid, id)`` and only reading transactions older than the snapshot
+    xmin gives a change sequence with no gaps, even when transactions commit out of ``id`` order.
+
+    Attributes:
+        id (int): Monotonic event identifier.
+        txid (int): Id of the transaction that recorded the event.
+        ticket_id (UUID): The ticket the event refers to. Not a foreign key, deleted tickets keep their events.
+        event_type (str): One of "created", "updated", "deleted", "commented" or "archived".
+        version (int): The ticket version after the change.
+        data (dict): The changed fields.
+        created_at (DateTime): Timestamp when the event was recorded.
+    """
+
+    __tablename__ = "ticket_events"
+
+    id = Column(BigInteger, Identity(), primary_key=True)
+    txid = Column(BigInteger, nullable=False, server_default=text("pg_current_xact_id()::text::bigint"))
+    ticket_id = Column(UUID(as_uuid=True), nullable=False)
+    event_type = Column(String, nullable=False)
+    version = Column(Integer, nullable=True)
+    data = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (Index("ix_ticket_events_txid_id", "txid", "id"),)
+
+    def __repr__(self):
+        """Return a string representation of the TicketEvent instance."""
+        return f"<TicketEvent id={self.id} ticket_id={self.ticket_id} event_type={self.event_type}>"
+
+    @property
+    def cursor(self) -> str:
+        """Return the position of the event in the change sequence, as sent to clients."""
+        return f"{self.txid}-{self.id}"
+
+    def to_dict(self):
+        """
+        Convert the TicketEvent instance to a dictionary.
+
+        Returns:
+            dict: A dictionary representation of the TicketEvent instance.
+        """
+        return {
+            "cursor": self.cursor,
+            "type": self.event_type,
+            "ticket_id": str(self.ticket_id),
+            "version": self.version,
+            "data": self.data,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
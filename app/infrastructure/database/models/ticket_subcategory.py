@@ -17,8 +17,8 @@ class TicketSubcategory(Base):
 
     __tablename__ = "ticket_subcategories"
 
-    ticket_id = Column(UUID(as_uuid=True), ForeignKey("tickets.id"), primary_key=True)
-    subcategory_id = Column(UUID(as_uuid=True), ForeignKey("subcategories.id"), primary_key=True)
+    ticket_id = Column(UUID(as_uuid=True), ForeignKey("tickets.id", ondelete="CASCADE"), primary_key=True)
+    subcategory_id = Column(UUID(as_uuid=True), ForeignKey("subcategories.id", ondelete="CASCADE"), primary_key=True)
 
     ticket = relationship("Ticket", back_populates="ticket_subcategories")
     subcategory = relationship("Subcategory", back_populates="ticket_subcategories")
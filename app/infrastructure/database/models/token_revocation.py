@@ -0,0 +1,47 @@
+"""TokenRevocation Model"""
+
+from sqlalchemy import BigInteger, Column, DateTime, Identity, String, UUID, func
+from app.infrastructure.database.base import Base
+
+
+class TokenRevocation(Base):
+    """
+    Represents the revocation of an access token, or of every access token of a deleted user.
+
+    Revocations only need to outlive the tokens they revoke, so each one expires with them. Deactivated users
+    are not recorded here: ``User.active`` is the source of truth for them.
+
+    Attributes:
+        id (int): The unique identifier of the revocation.
+        jti (str): The revoked token identifier, if a single token was revoked.
+        user_id (UUID): The user whose tokens are all revoked, if the user was deleted.
+        expires_at (DateTime): Timestamp after which no revoked token can still be valid.
+        created_at (DateTime): Timestamp when the revocation was recorded.
+    """
+
+    __tablename__ = "token_revocations"
+
+    id = Column(BigInteger, Identity(), primary_key=True)
+    jti = Column(String, nullable=True)
+    user_id = Column(UUID(as_uuid=True), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        """Return a string representation of the TokenRevocation instance."""
+        return f"<TokenRevocation id={self.id} jti={self.jti} user_id={self.user_id}>"
+
+    def to_dict(self):
+        """
+        Convert the TokenRevocation instance to a dictionary.
+
+        Returns:
+            dict: A dictionary representation of the TokenRevocation instance.
+        """
+        return {
+            "id": self.id,
+            "jti": self.jti,
+            "user_id": str(self.user_id) if self.user_id else None,
+            "expires_at": self.expires_at.isoformat(),
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
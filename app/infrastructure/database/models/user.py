@@ -1,7 +1,7 @@
 """User Model"""
 
 import uuid
-from sqlalchemy import Column, String, Boolean, DateTime, UUID
+from sqlalchemy import Column, String, Boolean, DateTime, Index, UUID, text
 from sqlalchemy.sql import func
 from app.infrastructure.database.base import Base
 
@@ -39,6 +39,14 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_users_inactive", "id", postgresql_where=text("active IS false")),
+        Index("ix_users_username_id", "username", "id"),
+        Index("ix_users_username_prefix", text("lower(username) text_pattern_ops")),
+        Index("ix_users_name_prefix", text("lower(name) text_pattern_ops")),
+        Index("ix_users_email_prefix", text("lower(email) text_pattern_ops")),
+    )
+
     def __repr__(self):
         """
         Return a string representation of the user object.
@@ -1,9 +1,10 @@
 """Create initial tables in the database."""
 
 import os
+from sqlalchemy import func, select
 from app.core import TicketStatus
-from app.infrastructure.database.models import User, Severity, Category, Subcategory, Ticket, TicketCategory, TicketSubcategory
-from app.infrastructure.database import SessionLocal
+from app.infrastructure.database.models import User, Severity, Category, Subcategory, Ticket, TicketCategory, TicketSubcategory, TicketEvent
+from app.infrastructure.database import SessionLocal, engine
 from app.core.auth.hashing import Hash
 from app.infrastructure.database import DB_HOST, DB_NAME, DB_PASSWORD, DB_PORT, DB_USER
 
@@ -13,6 +14,27 @@ connection_string = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{
 
 """This module provides functions to create initial tables and records in the database."""
 
+SEED_LOCK_ID = 7_204_201
+
+
+def seed_database():
+    """Create every initial record that does not exist yet.
+
+    Runs at application startup in every worker. A Postgres advisory lock serializes workers starting
+    together, so the later ones find the records created by the first instead of inserting duplicates.
+    """
+    with engine.connect() as connection:
+        connection.execute(select(func.pg_advisory_lock(SEED_LOCK_ID)))
+        try:
+            create_sysadmin()
+            create_severities()
+            create_categories()
+            create_subcategories()
+            create_fake_tickets()
+        finally:
+            db.close()
+            connection.execute(select(func.pg_advisory_unlock(SEED_LOCK_ID)))
+
 
 def create_sysadmin():
     """Create the sysadmin user if it does not exist.
@@ -111,18 +133,24 @@ def create_fake_tickets():
                 title="Ticket Test 1",
                 description="This is a test ticket for development purposes.",
                 severity_id=development_severity.id,
+                category_ids=[development_category.id],
+                subcategory_ids=[subcategory.id for subcategory in development_subcategories],
                 status=TicketStatus.ABERTO,
             ),
             Ticket(
                 title="Ticket Test 2",
                 description="This is a test ticket for testing purposes.",
                 severity_id=testing_severity.id,
+                category_ids=[testing_category.id],
+                subcategory_ids=[subcategory.id for subcategory in testing_subcategories],
                 status=TicketStatus.EM_PROGRESSO,
             ),
             Ticket(
                 title="Ticket Test 3",
                 description="This is a test ticket for deployment purposes.",
                 severity_id=deploy_severity.id,
+                category_ids=[deploy_category.id],
+                subcategory_ids=[subcategory.id for subcategory in deploy_subcategories],
                 status=TicketStatus.RESOLVIDO,
             ),
         ]
@@ -146,6 +174,8 @@ def create_fake_tickets():
                 for subcategory in deploy_subcategories:
                     db.add(TicketSubcategory(ticket_id=ticket.id, subcategory_id=subcategory.id))
 
+            db.add(TicketEvent(ticket_id=ticket.id, event_type="created", version=ticket.version))
+
         db.commit()
         print("Fake tickets created!")
 
@@ -0,0 +1,237 @@
+"""
+A log of the statements slower than a threshold, grouped by fingerprint with the code that ran them.
+
+A sampled share of the slow SELECT statements is run again under ``EXPLAIN (ANALYZE, BUFFERS)`` to keep
+their latest plan, within a savepoint that is always rolled back. Statements whose effects a rollback does not
+undo or that take locks (``FOR UPDATE``, advisory locks, notifications, sequences) are never run again. The log
+lives in the memory of each worker process.
+"""
+
+import inspect
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.tracing.tracer import current_span_var
+
+SLOW_QUERY_LOG_ENABLED = os.environ.get("SLOW_QUERY_LOG_ENABLED", "true").lower() == "true"
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get("SLOW_QUERY_THRESHOLD_MS", "100"))
+SLOW_QUERY_EXPLAIN_SAMPLE_RATE = float(os.environ.get("SLOW_QUERY_EXPLAIN_SAMPLE_RATE", "0"))
+SLOW_QUERY_MAX_FINGERPRINTS = int(os.environ.get("SLOW_QUERY_MAX_FINGERPRINTS", "500"))
+
+STATEMENT_MAX_LENGTH = 2000
+CALL_SITES_KEPT = 5
+SKIPPED_PATHS = (os.path.dirname(__file__), f"{os.sep}sqlalchemy{os.sep}", f"{os.sep}app{os.sep}core{os.sep}tracing{os.sep}")
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_SIDE_EFFECTS = re.compile(
+    r"\bFOR\s+(?:NO\s+KEY\s+)?UPDATE\b|\bFOR\s+(?:KEY\s+)?SHARE\b|\bpg_(?:try_)?advisory_\w+|\bpg_notify\b|\b(?:nextval|setval)\b",
+    re.IGNORECASE,
+)
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a statement so the executions of the same query share one entry.
+
+    Literals and bound parameters become ``?``, lists of them (such as expanded ``IN`` parameters)
+    become ``(?)`` whatever their length, and whitespace is collapsed.
+
+    Args:
+        statement (str): The SQL statement.
+
+    Returns:
+        str: The fingerprint.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def is_explainable(statement: str) -> bool:
+    """
+    Tell whether a statement can safely be run again under ``EXPLAIN ANALYZE``.
+
+    Only plain SELECT statements qualify: those with locking clauses or calling advisory lock, notification
+    or sequence functions are excluded, as running them twice takes locks or has effects a rollback keeps.
+
+    Args:
+        statement (str): The SQL statement.
+
+    Returns:
+        bool: Whether the statement can be explained.
+    """
+    return statement.lstrip()[:6].upper() == "SELECT" and not _SIDE_EFFECTS.search(_STRING_LITERAL.sub("?", statement))
+
+
+def call_site() -> Optional[str]:
+    """
+    Find the application code that ran the current statement.
+
+    Returns:
+        Optional[str]: The innermost application frame outside of the database layer, as
+        ``path:function:line``, or None if the statement was not run by application code.
+    """
+    frame = inspect.currentframe()
+    while frame is not None:
+        path = frame.f_code.co_filename
+        if f"{os.sep}app{os.sep}" in path and not any(skipped in path for skipped in SKIPPED_PATHS):
+            return f"{path[path.rindex(f'{os.sep}app{os.sep}') + 1 :]}:{frame.f_code.co_name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return None
+
+
+class SlowQueryLog:
+    """
+    Record the statements run by an engine that take longer than a threshold.
+    """
+
+    def __init__(self, threshold_ms: float, explain_sample_rate: float = 0.0, max_fingerprints: int = 500):
+        """
+        Initialize the log.
+
+        Args:
+            threshold_ms (float): Statements at least this long are recorded, in milliseconds.
+            explain_sample_rate (float): The share of the slow SELECT statements whose plan is captured, from 0 to 1.
+            max_fingerprints (int): The number of fingerprints kept; those with the least total time are dropped beyond it.
+        """
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.max_fingerprints = max_fingerprints
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def instrument(self, engine: Engine):
+        """
+        Time every statement the engine runs.
+
+        Args:
+            engine (Engine): The engine to instrument.
+        """
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    @staticmethod
+    def _before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany):
+        context.slow_query_started_at = time.perf_counter()
+
+    def _after_cursor_execute(self, _conn, cursor, statement, parameters, context, executemany):
+        started_at = getattr(context, "slow_query_started_at", None)
+        if started_at is None:
+            return
+        duration_ms = (time.perf_counter() - started_at) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        plan = None
+        if not executemany and is_explainable(statement) and random.random() < self.explain_sample_rate:
+            plan = self._explain(cursor, statement, parameters)
+        span = current_span_var.get()
+        self.record(statement, duration_ms, call_site(), span.name if span is not None else None, plan)
+
+    @staticmethod
+    def _explain(cursor, statement: str, parameters) -> Optional[Any]:
+        """
+        Run a SELECT statement again under ``EXPLAIN (ANALYZE, BUFFERS)``, on the raw connection so the
+        plan is not timed itself, within a savepoint that is rolled back once the plan is read, so neither
+        the second execution nor a failure affect the transaction.
+
+        Statements run outside of a transaction (autocommit) have no savepoint to roll back and are not explained.
+        """
+        connection = cursor.connection
+        if connection.autocommit:
+            return None
+        explain_cursor = connection.cursor()
+        try:
+            explain_cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                explain_cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters)
+                plan = explain_cursor.fetchone()[0]
+            finally:
+                explain_cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                explain_cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return json.loads(plan) if isinstance(plan, str) else plan
+        except Exception as e:
+            logger.warning("Could not explain slow query: %s", e)
+            return None
+        finally:
+            explain_cursor.close()
+
+    def record(self, statement: str, duration_ms: float, site: Optional[str] = None, operation: Optional[str] = None, plan: Optional[Any] = None):
+        """
+        Record a slow execution of a statement.
+
+        Args:
+            statement (str): The SQL statement.
+            duration_ms (float): The execution time in milliseconds.
+            site (Optional[str]): The application code that ran it.
+            operation (Optional[str]): The span it ran in, e.g. ``TicketController.create``.
+            plan (Optional[Any]): Its ``EXPLAIN`` plan, if captured.
+        """
+        key = fingerprint(statement)
+        logger.warning("Slow query (%.1f ms) at %s: %s", duration_ms, site or operation, key[:STATEMENT_MAX_LENGTH])
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "call_sites": Counter(), "plan": None}
+            entry["count"] += 1
+            entry["total_ms"] += duration_ms
+            entry["max_ms"] = max(entry["max_ms"], duration_ms)
+            entry["statement"] = statement[:STATEMENT_MAX_LENGTH]
+            entry["last_operation"] = operation
+            entry["last_seen"] = time.time()
+            entry["call_sites"][site or operation or "unknown"] += 1
+            if plan is not None:
+                entry["plan"] = plan
+            if len(self._entries) > self.max_fingerprints:
+                del self._entries[min((item for item in self._entries if item != key), key=lambda item: self._entries[item]["total_ms"])]
+
+    def top(self, limit: int = 20, order_by: str = "total_ms") -> List[Dict[str, Any]]:
+        """
+        Get the slowest fingerprints.
+
+        Args:
+            limit (int): The maximum number of fingerprints returned.
+            order_by (str): "total_ms", "max_ms", "mean_ms" or "count".
+
+        Returns:
+            List[Dict[str, Any]]: The fingerprints with their statistics, call sites and latest plan.
+        """
+        with self._lock:
+            entries = [
+                {
+                    "fingerprint": key,
+                    "count": entry["count"],
+                    "total_ms": round(entry["total_ms"], 3),
+                    "mean_ms": round(entry["total_ms"] / entry["count"], 3),
+                    "max_ms": round(entry["max_ms"], 3),
+                    "statement": entry["statement"],
+                    "last_operation": entry["last_operation"],
+                    "last_seen": entry["last_seen"],
+                    "call_sites": dict(entry["call_sites"].most_common(CALL_SITES_KEPT)),
+                    "plan": entry["plan"],
+                }
+                for key, entry in self._entries.items()
+            ]
+        return sorted(entries, key=lambda entry: entry[order_by], reverse=True)[:limit]
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(SLOW_QUERY_THRESHOLD_MS, SLOW_QUERY_EXPLAIN_SAMPLE_RATE, SLOW_QUERY_MAX_FINGERPRINTS)
@@ -0,0 +1,56 @@
+"""Spans for the SQL statements run by an engine."""
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core import tracer
+from app.core.tracing.tracer import current_span_var
+
+STATEMENT_MAX_LENGTH = 2000
+
+
+def _before_cursor_execute(_conn, _cursor, statement, _parameters, context, executemany):
+    if not tracer.enabled or current_span_var.get() is None:
+        return
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    context.trace_span = tracer.start_span(
+        f"db {operation}",
+        {
+            "db.system": "postgresql",
+            "db.operation": operation,
+            "db.statement": statement[:STATEMENT_MAX_LENGTH],
+            "db.executemany": executemany,
+            "db.compiled_cache": getattr(getattr(context, "cache_hit", None), "name", None),
+        },
+    )
+
+
+def _after_cursor_execute(_conn, cursor, _statement, _parameters, context, _executemany):
+    span = getattr(context, "trace_span", None)
+    if span is not None:
+        context.trace_span = None
+        span.set_attribute("db.rowcount", cursor.rowcount)
+        tracer.end_span(span)
+
+
+def _handle_error(exception_context):
+    context = exception_context.execution_context
+    span = getattr(context, "trace_span", None) if context is not None else None
+    if span is not None:
+        context.trace_span = None
+        span.record_exception(exception_context.original_exception)
+        tracer.end_span(span)
+
+
+def instrument_engine(engine: Engine):
+    """
+    Record a span for every statement the engine runs within a trace, with the SQL text, the row count and
+    whether the statement's compiled form came from the engine's cache (``CACHE_HIT``) or was compiled (``CACHE_MISS``).
+
+    Statements run outside of a trace, e.g. by migrations or scripts, are not recorded.
+
+    Args:
+        engine (Engine): The engine to instrument.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,16 @@
+"""
+This module provides the Postgres notification listener and the ticket event feed and token revocation set built on it.
+"""
+
+from app.infrastructure.events.listener import NotificationListener, notification_listener
+from app.infrastructure.events.ticket_events import (
+    TICKET_EVENTS_CHANNEL,
+    TicketEventBroker,
+    TicketEventSubscription,
+    ticket_event_broker,
+    events_after,
+    latest_cursor,
+    parse_cursor,
+    format_sse,
+)
+from app.infrastructure.events.revocations import REVOCATIONS_CHANNEL, RevocationSet, revocation_set
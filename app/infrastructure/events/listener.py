@@ -0,0 +1,102 @@
+"""Postgres LISTEN/NOTIFY listener shared by the in-process event consumers."""
+
+import logging
+import select
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+import psycopg2
+from psycopg2 import sql
+from app.infrastructure.database import DB_HOST, DB_NAME, DB_PASSWORD, DB_PORT, DB_USER
+
+logger = logging.getLogger(__name__)
+
+POLL_TIMEOUT_SECONDS = 1.0
+RECONNECT_DELAY_SECONDS = 2.0
+
+
+class NotificationListener:
+    """
+    Listen to Postgres notification channels on a dedicated connection and dispatch payloads to callbacks.
+
+    A single background thread serves every channel of the process, so the number of database connections
+    does not grow with the number of consumers. Callbacks run on that thread and must not block for long.
+    After every (re)connection each callback is invoked once with ``None``, since notifications sent while
+    disconnected are lost and consumers need to resynchronize from the database. Callbacks are expected to
+    handle their own errors.
+    """
+
+    def __init__(self):
+        """Initialize the listener without connecting."""
+        self._callbacks: Dict[str, List[Callable[[Optional[str]], None]]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, channel: str, callback: Callable[[Optional[str]], None]):
+        """
+        Register a callback for a notification channel and make sure the listener thread is running.
+
+        Args:
+            channel (str): The channel name passed to ``pg_notify``.
+            callback (Callable[[Optional[str]], None]): Called with each payload, or ``None`` after a reconnection.
+        """
+        with self._lock:
+            self._callbacks[channel].append(callback)
+        self.start()
+
+    def start(self):
+        """Start the listener thread if it is not running."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="pg-notification-listener", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the listener thread and close its connection."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=POLL_TIMEOUT_SECONDS * 2)
+
+    def _dispatch(self, channel: str, payload: Optional[str]):
+        with self._lock:
+            callbacks = list(self._callbacks.get(channel, []))
+        for callback in callbacks:
+            callback(payload)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except psycopg2.Error as e:
+                logger.error("Notification listener connection lost: %s", e)
+                self._stop.wait(RECONNECT_DELAY_SECONDS)
+
+    def _listen(self):
+        connection = psycopg2.connect(host=DB_HOST, port=DB_PORT, user=DB_USER, password=DB_PASSWORD, dbname=DB_NAME)
+        connection.autocommit = True
+        listening = set()
+        try:
+            while not self._stop.is_set():
+                with self._lock:
+                    channels = set(self._callbacks) - listening
+                for channel in channels:
+                    with connection.cursor() as cursor:
+                        cursor.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+                    listening.add(channel)
+                    self._dispatch(channel, None)
+
+                if select.select([connection], [], [], POLL_TIMEOUT_SECONDS) == ([], [], []):
+                    continue
+
+                connection.poll()
+                while connection.notifies:
+                    notification = connection.notifies.pop(0)
+                    self._dispatch(notification.channel, notification.payload)
+        finally:
+            connection.close()
+
+
+notification_listener = NotificationListener()
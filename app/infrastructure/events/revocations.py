@@ -0,0 +1,137 @@
+"""In-process set of revoked users and access tokens, kept fresh with Postgres notifications."""
+
+import json
+import logging
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from app.infrastructure.database import engine
+from app.infrastructure.database.models import TokenRevocation, User
+from app.infrastructure.events.listener import NotificationListener, notification_listener
+
+logger = logging.getLogger(__name__)
+
+REVOCATIONS_CHANNEL = "token_revocations"
+
+
+class RevocationSet:
+    """
+    Answer "is this token revoked?" from memory.
+
+    The set holds the ids of inactive and deleted users and the JTIs of revoked tokens. It is loaded from
+    the database once, then updated from notifications sent in the same transaction as each change, and
+    reloaded whenever the listener reconnects. Entries for deleted users and revoked tokens are dropped
+    once every token they could match has expired.
+    """
+
+    def __init__(self, listener: NotificationListener):
+        """
+        Initialize the set without loading it.
+
+        Args:
+            listener (NotificationListener): The listener providing revocation notifications.
+        """
+        self.listener = listener
+        self._users: Dict[uuid.UUID, Optional[datetime]] = {}
+        self._tokens: Dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._loaded = False
+
+    def is_revoked(self, user_id: uuid.UUID, jti: Optional[str]) -> bool:
+        """
+        Check whether a token was revoked, directly or through its user.
+
+        Args:
+            user_id (uuid.UUID): The user the token was issued to.
+            jti (Optional[str]): The token identifier, absent from tokens issued before revocation support.
+
+        Returns:
+            bool: True if the token must be rejected.
+        """
+        if not self._loaded:
+            self._start()
+
+        now = datetime.now(timezone.utc)
+        users, tokens = self._users, self._tokens
+        if user_id in users:
+            expires_at = users.get(user_id)
+            if expires_at is None or expires_at > now:
+                return True
+        token_expires_at = tokens.get(jti) if jti else None
+        return token_expires_at is not None and token_expires_at > now
+
+    @staticmethod
+    def notify(db: Session, change: dict):
+        """
+        Send a revocation change to every process once the caller's transaction commits.
+
+        Args:
+            db (Session): The session of the transaction making the change.
+            change (dict): The change, as accepted by ``apply``.
+        """
+        db.execute(select(func.pg_notify(REVOCATIONS_CHANNEL, json.dumps(change))))
+
+    def apply(self, change: dict):
+        """
+        Apply a revocation change to this process.
+
+        Args:
+            change (dict): Either ``{"user_id", "active"}`` for an activated or deactivated user,
+                ``{"user_id", "expires_at"}`` for a deleted user, or ``{"jti", "expires_at"}`` for a revoked token.
+                ``expires_at`` is an ISO 8601 timestamp.
+        """
+        expires_at = datetime.fromisoformat(change["expires_at"]) if change.get("expires_at") else None
+        with self._lock:
+            if change.get("jti"):
+                self._tokens[change["jti"]] = expires_at
+            elif change.get("user_id"):
+                user_id = uuid.UUID(change["user_id"])
+                if change.get("active"):
+                    self._users.pop(user_id, None)
+                else:
+                    self._users[user_id] = expires_at
+            self._prune(datetime.now(timezone.utc))
+
+    def reload(self):
+        """Replace the set with the revocations stored in the database."""
+        now = datetime.now(timezone.utc)
+        with Session(engine) as session:
+            users: Dict[uuid.UUID, Optional[datetime]] = {user_id: None for user_id in session.scalars(select(User.id).where(User.active.is_(False)))}
+            tokens: Dict[str, datetime] = {}
+            for revocation in session.scalars(select(TokenRevocation).where(TokenRevocation.expires_at > now)):
+                if revocation.jti:
+                    tokens[revocation.jti] = revocation.expires_at
+                elif revocation.user_id and revocation.user_id not in users:
+                    users[revocation.user_id] = revocation.expires_at
+        with self._lock:
+            self._users = users
+            self._tokens = tokens
+        self._loaded = True
+
+    def _start(self):
+        with self._start_lock:
+            if self._loaded:
+                return
+            self.reload()
+            self.listener.subscribe(REVOCATIONS_CHANNEL, self._on_notification)
+
+    def _prune(self, now: datetime):
+        self._tokens = {jti: expires_at for jti, expires_at in self._tokens.items() if expires_at > now}
+        self._users = {user_id: expires_at for user_id, expires_at in self._users.items() if expires_at is None or expires_at > now}
+
+    def _on_notification(self, payload: Optional[str]):
+        try:
+            if payload is None:
+                self.reload()
+            else:
+                self.apply(json.loads(payload))
+        except (SQLAlchemyError, ValueError, KeyError) as e:
+            logger.error("Error updating token revocations: %s", e)
+
+
+revocation_set = RevocationSet(notification_listener)
@@ -0,0 +1,258 @@
+"""Fan-out of ticket change events from the transactional outbox to streaming clients."""
+
+import asyncio
+import json
+import logging
+import threading
+from typing import AsyncIterator, List, Optional, Set, Tuple
+from sqlalchemy import BigInteger, Select, Text, cast, func, select, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from app.infrastructure.database import engine
+from app.infrastructure.database.models import TicketEvent
+from app.infrastructure.events.listener import NotificationListener, notification_listener
+
+logger = logging.getLogger(__name__)
+
+TICKET_EVENTS_CHANNEL = "ticket_events"
+SUBSCRIBER_QUEUE_SIZE = 1000
+KEEPALIVE_SECONDS = 15.0
+RETRY_PENDING_SECONDS = 0.5
+POLL_BATCH_SIZE = 500
+
+Cursor = Tuple[int, int]
+
+
+def parse_cursor(value: str) -> Cursor:
+    """
+    Parse a change-sequence cursor of the form ``"<txid>-<id>"``.
+
+    Args:
+        value (str): The cursor sent by the client.
+
+    Returns:
+        Cursor: The ``(txid, id)`` pair.
+
+    Raises:
+        ValueError: Raised if the value is not a valid cursor.
+    """
+    txid, _, event_id = value.strip().partition("-")
+    if not txid.isdigit() or not event_id.isdigit():
+        raise ValueError(f"Invalid cursor '{value}'")
+    return int(txid), int(event_id)
+
+
+def events_after(cursor: Cursor, limit: int) -> Select:
+    """
+    Build the query for the events that follow a cursor in the change sequence.
+
+    Only transactions older than the current snapshot xmin are read: they can no longer commit new events,
+    so a cursor never moves past an event that becomes visible later.
+
+    Args:
+        cursor (Cursor): The ``(txid, id)`` position to read after.
+        limit (int): The maximum number of events to return.
+
+    Returns:
+        Select: The ordered query.
+    """
+    safe_txid = select(cast(cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger)).scalar_subquery()
+    return (
+        select(TicketEvent)
+        .where(TicketEvent.txid < safe_txid, tuple_(TicketEvent.txid, TicketEvent.id) > tuple_(*cursor))
+        .order_by(TicketEvent.txid, TicketEvent.id)
+        .limit(limit)
+    )
+
+
+def latest_cursor() -> Select:
+    """
+    Build the query for the cursor of the last event that is safe to read.
+
+    Returns:
+        Select: A query returning the ``(txid, id)`` of that event, or no row if there are none.
+    """
+    safe_txid = select(cast(cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger)).scalar_subquery()
+    return (
+        select(TicketEvent.txid, TicketEvent.id).where(TicketEvent.txid < safe_txid).order_by(TicketEvent.txid.desc(), TicketEvent.id.desc()).limit(1)
+    )
+
+
+def format_sse(event: dict) -> str:
+    """
+    Serialize a ticket event as a Server-Sent Events message.
+
+    Args:
+        event (dict): The event, as returned by ``TicketEvent.to_dict``.
+
+    Returns:
+        str: The SSE message, using the cursor as the event id so clients resume with Last-Event-ID.
+    """
+    return f"id: {event['cursor']}\nevent: ticket.{event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+
+
+class TicketEventSubscription:
+    """
+    A streaming client's view of the ticket event feed.
+    """
+
+    def __init__(self, broker: "TicketEventBroker", loop: asyncio.AbstractEventLoop, after: Cursor):
+        """
+        Initialize the subscription.
+
+        Args:
+            broker (TicketEventBroker): The broker delivering events.
+            loop (asyncio.AbstractEventLoop): The event loop of the streaming request.
+            after (Cursor): Events at or before this cursor were already sent and are skipped.
+        """
+        self.broker = broker
+        self.loop = loop
+        self.after = after
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def offer(self, event: Optional[dict]):
+        """
+        Queue an event for the client; must run on the subscription's event loop.
+
+        A client that falls too far behind gets ``None`` and is disconnected, to resume with Last-Event-ID.
+
+        Args:
+            event (Optional[dict]): The event, or None to end the stream.
+        """
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.broker.unsubscribe(self)
+            self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    async def stream(self, backlog: List[dict]) -> AsyncIterator[str]:
+        """
+        Yield the backlog followed by live events as SSE messages, with periodic keep-alive comments.
+
+        The subscription should be registered before the backlog is read, with ``after`` then moved to the
+        end of the backlog, so events published in between are either replayed or delivered live.
+
+        Args:
+            backlog (List[dict]): Events replayed from the outbox before going live.
+
+        Yields:
+            str: SSE messages.
+        """
+        try:
+            for event in backlog:
+                yield format_sse(event)
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(self.queue.get(), timeout=KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is None:
+                    return
+                cursor = parse_cursor(event["cursor"])
+                if cursor <= self.after:
+                    continue
+                self.after = cursor
+                yield format_sse(event)
+        finally:
+            self.broker.unsubscribe(self)
+
+
+class TicketEventBroker:
+    """
+    Deliver committed ticket events to in-process subscribers.
+
+    Notifications only wake the broker up; events are read from the outbox with ``events_after`` so every
+    subscriber receives them in change-sequence order, once, regardless of commit order. Events of a
+    transaction that is still ahead of the snapshot xmin are retried shortly after.
+    """
+
+    def __init__(self, listener: NotificationListener):
+        """
+        Initialize the broker.
+
+        Args:
+            listener (NotificationListener): The listener providing outbox notifications.
+        """
+        self.listener = listener
+        self._subscribers: Set[TicketEventSubscription] = set()
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._cursor: Optional[Cursor] = None
+        self._pending: Set[int] = set()
+        self._started = False
+
+    def subscribe(self, after: Cursor) -> TicketEventSubscription:
+        """
+        Register a streaming client; must be called from the client's event loop.
+
+        Args:
+            after (Cursor): The last cursor the client has already seen.
+
+        Returns:
+            TicketEventSubscription: The subscription to stream from.
+        """
+        subscription = TicketEventSubscription(self, asyncio.get_running_loop(), after)
+        with self._lock:
+            self._subscribers.add(subscription)
+            start = not self._started
+            self._started = True
+        if start:
+            self.listener.subscribe(TICKET_EVENTS_CHANNEL, self._on_notification)
+        return subscription
+
+    def unsubscribe(self, subscription: TicketEventSubscription):
+        """
+        Remove a streaming client.
+
+        Args:
+            subscription (TicketEventSubscription): The subscription to remove.
+        """
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def _on_notification(self, payload: Optional[str]):
+        if payload and payload.isdigit():
+            with self._lock:
+                self._pending.add(int(payload))
+        try:
+            self._poll()
+        except SQLAlchemyError as e:
+            logger.error("Error reading ticket events: %s", e)
+
+    def _poll(self):
+        with self._poll_lock, Session(engine) as session:
+            if self._cursor is None:
+                row = session.execute(latest_cursor()).first()
+                self._cursor = (row.txid, row.id) if row else (0, 0)
+
+            while True:
+                events = [event.to_dict() for event in session.scalars(events_after(self._cursor, POLL_BATCH_SIZE))]
+                if not events:
+                    break
+                self._cursor = parse_cursor(events[-1]["cursor"])
+                self._publish(events)
+
+            with self._lock:
+                pending = list(self._pending)
+            if pending:
+                held_back = session.scalars(
+                    select(TicketEvent.id).where(TicketEvent.id.in_(pending), tuple_(TicketEvent.txid, TicketEvent.id) > tuple_(*self._cursor))
+                ).all()
+                with self._lock:
+                    self._pending.intersection_update(held_back)
+                    retry = bool(self._pending)
+                if retry:
+                    threading.Timer(RETRY_PENDING_SECONDS, self._on_notification, args=(None,)).start()
+
+    def _publish(self, events: List[dict]):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            for event in events:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+
+
+ticket_event_broker = TicketEventBroker(notification_listener)
@@ -2,29 +2,58 @@
 Main API script for Meli Ticket Manager.
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import router
-from app.infrastructure import create_sysadmin, create_categories, create_severities, create_subcategories, create_fake_tickets
-
-create_sysadmin()
-create_severities()
-create_categories()
-create_subcategories()
-create_fake_tickets()
-
-app = FastAPI(
-    title="Meli Ticket Manager",
-    description="Simplifique o gerenciamento de tickets com essa API intuitiva.",
-    version="0.0.0.1",
-)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-app.include_router(router)
+from app.api.compression import CompressionMiddleware
+from app.api.request_id import REQUEST_ID_HEADER, RequestIdMiddleware
+from app.api.tracing import TRACEPARENT_HEADER, TracingMiddleware
+from app.core import configure_logging
+from app.infrastructure import seed_database
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Seed the database when the server starts, before the first request is accepted."""
+    seed_database()
+    yield
+
+
+def create_app() -> FastAPI:
+    """
+    Create the API application.
+
+    Importing this module only builds the application; the database is seeded by the startup event,
+    so importing it (in a gunicorn master, a script or a benchmark) does not touch the database.
+
+    Returns:
+        FastAPI: The application.
+    """
+    configure_logging()
+
+    application = FastAPI(
+        title="Meli Ticket Manager",
+        description="Simplifique o gerenciamento de tickets com essa API intuitiva.",
+        version="0.0.0.1",
+        lifespan=lifespan,
+    )
+
+    application.add_middleware(CompressionMiddleware)
+    application.add_middleware(TracingMiddleware)
+    application.add_middleware(RequestIdMiddleware)
+
+    application.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["ETag", "X-Next-Cursor", REQUEST_ID_HEADER, TRACEPARENT_HEADER],
+    )
+
+    application.include_router(router)
+    return application
+
+
+app = create_app()
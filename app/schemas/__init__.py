@@ -1,21 +1,35 @@
 """Schemas Module Docstring"""
 
-from .auth import Login, Token, TokenData
-from .user import User, UserId, UserPassword, UserShow, UserUpdate
-from .ticket import Ticket, TicketUpdate, TicketShow, TicketId
+from .auth import Login, Token, TokenData, RefreshTokenRequest, LogoutRequest
+from .user import User, UserId, UserPassword, UserShow, UserUpdate, UserListItem, UserListQuery
+from .ticket import (
+    Ticket,
+    TicketUpdate,
+    TicketShow,
+    TicketId,
+    TicketChange,
+    TicketChanges,
+    TicketListQuery,
+    TicketCommentShow,
+    TicketCommentListQuery,
+    TicketCommentBatch,
+)
 from .severity import Severity, SeverityId, SeverityUpdate, SeverityShow
-from .category import Category, CategoryId, CategoryUpdate, CategoryShow
-from .subcategory import Subcategory, SubcategoryId, SubcategoryUpdate, SubcategoryShow
+from .category import Category, CategoryId, CategoryUpdate, CategoryShow, CategoryTree
+from .subcategory import Subcategory, SubcategoryId, SubcategoryUpdate, SubcategoryShow, SubcategoryNode
 
 __all__ = [
     "Category",
     "CategoryUpdate",
     "CategoryShow",
     "CategoryId",
+    "CategoryTree",
     "User",
     "UserUpdate",
     "UserShow",
     "UserId",
+    "UserListItem",
+    "UserListQuery",
     "UserPassword",
     "Login",
     "Severity",
@@ -26,10 +40,19 @@ __all__ = [
     "SubcategoryUpdate",
     "SubcategoryShow",
     "SubcategoryId",
+    "SubcategoryNode",
     "Token",
     "TokenData",
+    "RefreshTokenRequest",
+    "LogoutRequest",
     "Ticket",
     "TicketUpdate",
     "TicketShow",
     "TicketId",
+    "TicketChange",
+    "TicketChanges",
+    "TicketListQuery",
+    "TicketCommentShow",
+    "TicketCommentListQuery",
+    "TicketCommentBatch",
 ]
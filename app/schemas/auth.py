@@ -3,6 +3,7 @@ Authentication Schemas
 """
 
 import uuid
+from datetime import datetime
 from typing import List, Optional, Union
 from pydantic import BaseModel
 
@@ -36,10 +37,34 @@ class Token(BaseModel):
     Attributes:
         access_token (str): The access token for authentication.
         token_type (str): The type of the token (e.g., "bearer").
+        refresh_token (Optional[str]): The single-use token to obtain a new access token.
     """
 
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
+
+
+class RefreshTokenRequest(BaseModel):
+    """
+    Model representing a request to refresh the access token.
+
+    Attributes:
+        refresh_token (str): The refresh token returned by the last login or refresh.
+    """
+
+    refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    """
+    Model representing a logout request.
+
+    Attributes:
+        refresh_token (Optional[str]): The refresh token to revoke along with the access token.
+    """
+
+    refresh_token: Optional[str] = None
 
 
 class TokenData(BaseModel):
@@ -51,9 +76,13 @@ class TokenData(BaseModel):
         username (Optional[str]): The username of the user.
         role (Optional[str]): The role of the user.
         scopes (List[str]): The list of scopes/permissions associated with the token.
+        jti (Optional[str]): The unique identifier of the token, used to revoke it.
+        expires_at (Optional[datetime]): The expiration time of the token.
     """
 
     id: Optional[Union[int, uuid.UUID]]
     username: Optional[str]
     role: Optional[str]
     scopes: List[str] = []
+    jti: Optional[str] = None
+    expires_at: Optional[datetime] = None
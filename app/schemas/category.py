@@ -3,7 +3,7 @@
 from typing import Optional, List
 from pydantic import UUID4, BaseModel
 
-from app.schemas.subcategory import SubcategoryShow
+from app.schemas.subcategory import SubcategoryShow, SubcategoryNode
 
 
 class Category(BaseModel):
@@ -30,6 +30,20 @@ class CategoryShow(Category):
         from_attributes = True
 
 
+class CategoryTree(Category):
+    """Category Tree Node Model"""
+
+    id: UUID4
+    subcategories: Optional[List[SubcategoryNode]] = None
+    open_tickets: Optional[int] = None
+    total_tickets: Optional[int] = None
+
+    class Config:
+        """Config"""
+
+        from_attributes = True
+
+
 class CategoryId(BaseModel):
     """Category ID Model"""
 
@@ -46,6 +46,19 @@ class SubcategoryShow(Subcategory):
         from_attributes = True
 
 
+class SubcategoryNode(SubcategoryShow):
+    """
+    Schema for a subcategory in the category tree.
+
+    Attributes:
+        open_tickets (Optional[int]): The number of tickets of the subcategory that are not resolved, if requested.
+        total_tickets (Optional[int]): The number of tickets of the subcategory, if requested.
+    """
+
+    open_tickets: Optional[int] = None
+    total_tickets: Optional[int] = None
+
+
 class SubcategoryId(BaseModel):
     """
     Schema for displaying the UUID of a subcategory.
@@ -2,8 +2,9 @@
 
 from typing import Optional, List
 from datetime import datetime
-from pydantic import UUID4, BaseModel
+from pydantic import UUID4, BaseModel, Field
 from app.core.enums.enums import TicketStatus
+from app.core.identifiers.uuids import UUID4or7
 from app.schemas.category import CategoryShow
 from app.schemas.severity import SeverityShow
 
@@ -32,12 +33,13 @@ class TicketUpdate(BaseModel):
     status: Optional[TicketStatus] = None
     comment: Optional[str] = None
     comment_user: Optional[str] = None
+    version: Optional[int] = None
 
 
 class TicketShow(BaseModel):
     """Ticket Show Model"""
 
-    id: UUID4
+    id: UUID4or7
     title: str
     description: Optional[str] = None
     categories: List[CategoryShow]
@@ -45,8 +47,11 @@ class TicketShow(BaseModel):
     status: TicketStatus
     comment: Optional[str] = None
     comment_user: Optional[str] = None
+    comment_count: int = 0
     created_at: datetime
     updated_at: Optional[datetime] = None
+    version: int = 1
+    archived_at: Optional[datetime] = None
 
     class Config:
         """Config"""
@@ -54,7 +59,64 @@ class TicketShow(BaseModel):
         from_attributes = True
 
 
+class TicketChange(BaseModel):
+    """Ticket Change Model"""
+
+    ticket_id: UUID4or7
+    deleted: bool = False
+    archived: bool = False
+    ticket: Optional[TicketShow] = None
+
+
+class TicketChanges(BaseModel):
+    """Ticket Changes Page Model"""
+
+    changes: List[TicketChange]
+    next: str
+    has_more: bool
+
+
+class TicketListQuery(BaseModel):
+    """Ticket List Query"""
+
+    include_archived: bool = False
+    category_id: Optional[UUID4] = None
+    subcategory_id: Optional[UUID4] = None
+
+
+class TicketCommentShow(BaseModel):
+    """Ticket Comment Show Model"""
+
+    id: UUID4or7
+    ticket_id: UUID4or7
+    body: str
+    author: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        """Config"""
+
+        from_attributes = True
+
+
+class TicketCommentListQuery(BaseModel):
+    """Ticket Comment List Query"""
+
+    limit: int = Field(default=50, ge=1, le=200)
+    after: Optional[str] = None
+
+
+class TicketCommentBatch(BaseModel):
+    """Ticket Comment Batch Model"""
+
+    ticket_ids: Optional[List[UUID4or7]] = Field(default=None, min_length=1, max_length=10000)
+    status: Optional[TicketStatus] = None
+    category_id: Optional[UUID4] = None
+    subcategory_id: Optional[UUID4] = None
+    limit: int = Field(default=1000, ge=1, le=10000)
+
+
 class TicketId(Ticket):
     """Ticket Id Model"""
 
-    id: UUID4
+    id: UUID4or7
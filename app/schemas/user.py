@@ -1,7 +1,8 @@
 """User Schema"""
 
 from typing import Optional
-from pydantic import UUID4, BaseModel
+from datetime import datetime
+from pydantic import UUID4, BaseModel, Field
 
 
 class User(BaseModel):
@@ -21,6 +22,7 @@ class UserUpdate(BaseModel):
     username: Optional[str] = None
     email: Optional[str] = None
     role: Optional[str] = None
+    active: Optional[bool] = None
 
 
 class UserShow(BaseModel):
@@ -32,6 +34,7 @@ class UserShow(BaseModel):
     email: str
     password: str
     role: str
+    active: bool = True
 
     class Config:
         """Config"""
@@ -39,6 +42,33 @@ class UserShow(BaseModel):
         from_attributes = True
 
 
+class UserListItem(BaseModel):
+    """User List Item"""
+
+    id: UUID4
+    name: str
+    username: str
+    email: str
+    role: str
+    active: bool = True
+    created_at: Optional[datetime] = None
+
+    class Config:
+        """Config"""
+
+        from_attributes = True
+
+
+class UserListQuery(BaseModel):
+    """User List Query"""
+
+    limit: int = Field(default=100, ge=1, le=500)
+    after: Optional[str] = None
+    role: Optional[str] = None
+    active: Optional[bool] = None
+    search: Optional[str] = Field(default=None, min_length=1)
+
+
 class UserId(User):
     """User Id"""
 
@@ -0,0 +1,214 @@
+"""
+A script to move resolved tickets out of the live ``tickets`` table into the ``tickets_archive`` table.
+
+Tickets resolved (last updated) more than ``--older-than-days`` days ago are moved in batches, each batch in
+its own transaction, into the monthly partition of their creation date, which is created when missing; rows
+of that month already in the default partition are moved into it. An "archived" event is recorded for each
+ticket, so change-feed and stream consumers drop it from the live set, and the API workers drop their cached
+ticket counts.
+Safe to run concurrently with the API and with itself: rows locked by other transactions are skipped.
+
+Usage:
+    python -m app.scripts.archive.archive_tickets
+    python -m app.scripts.archive.archive_tickets --older-than-days 90 --batch-size 500
+"""
+
+import argparse
+import os
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.api.v1.controllers.category_controller import ticket_counts_cache
+from app.infrastructure.database import engine
+from app.infrastructure.cache import ticket_document_cache
+from app.infrastructure.events import TICKET_EVENTS_CHANNEL
+
+TICKET_ARCHIVE_AFTER_DAYS = int(os.environ.get("TICKET_ARCHIVE_AFTER_DAYS", "180"))
+TICKET_ARCHIVE_BATCH_SIZE = int(os.environ.get("TICKET_ARCHIVE_BATCH_SIZE", "1000"))
+
+ARCHIVABLE = "status = 'RESOLVIDO' AND coalesce(updated_at, created_at) < :cutoff"
+
+DEFAULT_PARTITION = "tickets_archive_default"
+
+PENDING_MONTHS_SQL = text(f"SELECT DISTINCT date_trunc('month', coalesce(created_at, now()) AT TIME ZONE 'UTC') FROM tickets WHERE {ARCHIVABLE}")
+
+ARCHIVE_BATCH_SQL = text(
+    f"""
+    WITH batch AS (
+        SELECT id FROM tickets WHERE {ARCHIVABLE} ORDER BY id LIMIT :batch_size FOR UPDATE SKIP LOCKED
+    ), moved AS (
+        DELETE FROM tickets t USING batch b WHERE t.id = b.id RETURNING t.*
+    ), archived AS (
+        INSERT INTO tickets_archive (
+            id, created_at, title, description, severity_id, status, comment, comment_user, comment_count, updated_at, version, category_ids,
+            subcategory_ids
+        )
+        SELECT
+            m.id, coalesce(m.created_at, now()), m.title, m.description, m.severity_id, m.status, m.comment, m.comment_user, m.comment_count,
+            m.updated_at, m.version, m.category_ids, m.subcategory_ids
+        FROM moved m
+        RETURNING id, version
+    )
+    INSERT INTO ticket_events (ticket_id, event_type, version)
+    SELECT id, 'archived', version FROM archived
+    RETURNING id, ticket_id
+    """
+)
+
+
+class TicketArchiver:
+    """
+    A class to move resolved tickets to the archive in batches.
+    """
+
+    def __init__(self, older_than_days: int, batch_size: int):
+        """
+        Initialize the archiver.
+
+        Args:
+            older_than_days (int): Resolved tickets not updated for this many days are archived.
+            batch_size (int): The number of tickets moved per transaction.
+        """
+        self.cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        self.batch_size = batch_size
+
+    def ensure_partitions(self, session: Session):
+        """
+        Create the monthly archive partitions the pending tickets will be moved to.
+
+        Partition bounds are UTC months, so they do not depend on the session time zone. A partition cannot be
+        created while the default partition holds rows of its month; those are moved into it, see
+        ``split_default_partition``.
+
+        Args:
+            session (Session): The database session.
+        """
+        for month in session.scalars(PENDING_MONTHS_SQL, {"cutoff": self.cutoff}):
+            next_month = (month + timedelta(days=32)).replace(day=1)
+            bounds = {"start": month.replace(tzinfo=timezone.utc), "end": next_month.replace(tzinfo=timezone.utc)}
+            in_default = session.scalar(
+                text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE created_at >= :start AND created_at < :end)"), bounds
+            )
+            if in_default:
+                self.split_default_partition(session, month, next_month)
+            else:
+                session.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {self.partition_name(month)} PARTITION OF tickets_archive {self.partition_bounds(month, next_month)}"
+                    )
+                )
+        session.commit()
+
+    @staticmethod
+    def partition_name(month: datetime) -> str:
+        """
+        Get the name of the archive partition of a month.
+
+        Args:
+            month (datetime): The first day of the month.
+
+        Returns:
+            str: The partition name.
+        """
+        return f"tickets_archive_{month:%Y_%m}"
+
+    @staticmethod
+    def partition_bounds(month: datetime, next_month: datetime) -> str:
+        """
+        Get the ``FOR VALUES`` clause of the archive partition of a month.
+
+        Args:
+            month (datetime): The first day of the month.
+            next_month (datetime): The first day of the following month.
+
+        Returns:
+            str: The partition bound specification.
+        """
+        return f"FOR VALUES FROM ('{month:%Y-%m-%d} 00:00+00') TO ('{next_month:%Y-%m-%d} 00:00+00')"
+
+    def split_default_partition(self, session: Session, month: datetime, next_month: datetime):
+        """
+        Create the archive partition of a month whose rows landed in the default partition, moving them into it.
+
+        The default partition is detached while the partition is created and its rows of the month are moved,
+        then attached again, all in the caller's transaction.
+
+        Args:
+            session (Session): The database session.
+            month (datetime): The first day of the month.
+            next_month (datetime): The first day of the following month.
+        """
+        partition = self.partition_name(month)
+        session.execute(text("LOCK TABLE tickets_archive IN ACCESS EXCLUSIVE MODE"))
+        if session.scalar(text("SELECT to_regclass(:partition)"), {"partition": partition}) is not None:
+            return
+        session.execute(text(f"ALTER TABLE tickets_archive DETACH PARTITION {DEFAULT_PARTITION}"))
+        session.execute(text(f"CREATE TABLE {partition} PARTITION OF tickets_archive {self.partition_bounds(month, next_month)}"))
+        session.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE created_at >= :start AND created_at < :end RETURNING *) "
+                f"INSERT INTO {partition} SELECT * FROM moved"
+            ),
+            {"start": month.replace(tzinfo=timezone.utc), "end": next_month.replace(tzinfo=timezone.utc)},
+        )
+        session.execute(text(f"ALTER TABLE tickets_archive ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
+
+    def archive_batch(self, session: Session) -> int:
+        """
+        Move one batch of tickets to the archive in a single statement and transaction.
+
+        Args:
+            session (Session): The database session.
+
+        Returns:
+            int: The number of tickets archived.
+        """
+        rows = session.execute(ARCHIVE_BATCH_SQL, {"cutoff": self.cutoff, "batch_size": self.batch_size}).all()
+        if rows:
+            event_ids = [row.id for row in rows]
+            session.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": TICKET_EVENTS_CHANNEL, "payload": str(max(event_ids))})
+            ticket_document_cache.notify(session, [row.ticket_id for row in rows])
+        session.commit()
+        if rows:
+            ticket_counts_cache.invalidate()
+        return len(rows)
+
+    def run(self) -> int:
+        """
+        Archive every eligible ticket.
+
+        Returns:
+            int: The total number of tickets archived.
+        """
+        total = 0
+        with Session(engine) as session:
+            self.ensure_partitions(session)
+            while True:
+                archived = self.archive_batch(session)
+                total += archived
+                if archived < self.batch_size:
+                    return total
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--older-than-days", type=int, default=TICKET_ARCHIVE_AFTER_DAYS, help="archive tickets resolved before this many days ago")
+    parser.add_argument("--batch-size", type=int, default=TICKET_ARCHIVE_BATCH_SIZE, help="tickets moved per transaction")
+    return parser.parse_args()
+
+
+def main():
+    """Archive the eligible tickets and print how many were moved."""
+    args = parse_args()
+    archived = TicketArchiver(args.older_than_days, args.batch_size).run()
+    print(f"Archived {archived} tickets resolved before {args.older_than_days} days ago.")
+
+
+if __name__ == "__main__":
+    main()
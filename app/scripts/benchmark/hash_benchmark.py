@@ -0,0 +1,136 @@
+"""
+A script to measure password verification cost for candidate hashing parameters.
+
+Reports the verify latency and the sustainable verifications per second per core for each
+candidate, plus the aggregate throughput across worker processes, to size login capacity.
+
+Usage:
+    python -m app.scripts.benchmark.hash_benchmark --bcrypt-rounds 10 11 12 13
+    python -m app.scripts.benchmark.hash_benchmark --argon2 3:65536:4 2:19456:1 --processes 4
+"""
+
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+from app.core.auth.hashing import build_context
+
+PASSWORD = "correct horse battery staple"
+
+
+class HashBenchmark:
+    """
+    A class to time password verification for one hashing policy.
+    """
+
+    def __init__(self, label: str, **policy):
+        """
+        Initialize the benchmark for a hashing policy.
+
+        Args:
+            label (str): The name printed in the report.
+            **policy: Keyword arguments for ``build_context``.
+        """
+        self.label = label
+        self.policy = policy
+
+    def verify_latencies(self, iterations: int) -> List[float]:
+        """
+        Time sequential verifications of a password hashed with the policy.
+
+        Args:
+            iterations (int): The number of verifications.
+
+        Returns:
+            List[float]: The latency of each verification, in seconds.
+        """
+        context = build_context(**self.policy)
+        hashed = context.hash(PASSWORD)
+        latencies = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            context.verify(PASSWORD, hashed)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    def throughput(self, iterations: int, processes: int) -> float:
+        """
+        Measure the aggregate verifications per second with one process per core.
+
+        Only the verifications are timed, not the process startup or the initial hash.
+
+        Args:
+            iterations (int): The number of verifications per process.
+            processes (int): The number of worker processes.
+
+        Returns:
+            float: Verifications per second across all processes.
+        """
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            elapsed = [sum(latencies) for latencies in executor.map(self.verify_latencies, [iterations] * processes)]
+        return iterations * processes / max(elapsed)
+
+    def run(self, iterations: int, processes: int) -> Tuple[str, float, float, float, float]:
+        """
+        Run the benchmark.
+
+        Args:
+            iterations (int): The number of verifications per measurement.
+            processes (int): The number of worker processes for the throughput measurement.
+
+        Returns:
+            Tuple[str, float, float, float, float]: The label, median and p95 latency in milliseconds,
+            verifications per second per core and aggregate verifications per second.
+        """
+        latencies = sorted(self.verify_latencies(iterations))
+        median = statistics.median(latencies)
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        return self.label, median * 1000, p95 * 1000, 1 / median, self.throughput(iterations, processes)
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bcrypt-rounds", type=int, nargs="*", default=[], help="bcrypt cost factors to measure")
+    parser.add_argument("--argon2", nargs="*", default=[], metavar="TIME:MEMORY_KIB:PARALLELISM", help="argon2id parameters to measure")
+    parser.add_argument("--iterations", type=int, default=20, help="verifications per measurement")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="worker processes for the throughput measurement")
+    args = parser.parse_args()
+    if not args.bcrypt_rounds and not args.argon2:
+        args.bcrypt_rounds = [10, 11, 12]
+        args.argon2 = ["3:65536:4"]
+    return args
+
+
+def main():
+    """Run the benchmark for every candidate and print the report."""
+    args = parse_args()
+
+    benchmarks = [HashBenchmark(f"bcrypt rounds={rounds}", scheme="bcrypt", bcrypt_rounds=rounds) for rounds in args.bcrypt_rounds]
+    for candidate in args.argon2:
+        time_cost, memory_cost, parallelism = (int(value) for value in candidate.split(":"))
+        benchmarks.append(
+            HashBenchmark(
+                f"argon2id t={time_cost} m={memory_cost} p={parallelism}",
+                scheme="argon2",
+                argon2_time_cost=time_cost,
+                argon2_memory_cost=memory_cost,
+                argon2_parallelism=parallelism,
+            )
+        )
+
+    print(f"{'policy':<36} {'p50 ms':>8} {'p95 ms':>8} {'verify/s/core':>14} {f'verify/s x{args.processes}':>14}")
+    for benchmark in benchmarks:
+        label, median, p95, per_core, aggregate = benchmark.run(args.iterations, args.processes)
+        print(f"{label:<36} {median:>8.1f} {p95:>8.1f} {per_core:>14.1f} {aggregate:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
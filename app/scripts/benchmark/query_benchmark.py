@@ -0,0 +1,121 @@
+"""
+A script to compare the per-lookup cost of legacy ``Query`` objects with 2.0-style statements for the hot
+lookups of the API: a ticket by ID, categories by a list of IDs, and a user by username at login.
+
+Each lookup runs in a fresh session state (the identity map is cleared between iterations), as in a request,
+so both variants make the same round trip and the difference is the ORM's Python overhead. The prebuilt
+statements are built once at import time and executed with parameters; the report also shows how many
+executions reused a compiled statement from the engine's cache. A last row shows ``Session.get`` when the
+object is already in the identity map, which needs no SQL at all.
+
+Needs the database configured in ``.env``, seeded with at least one ticket.
+
+Usage:
+    python -m app.scripts.benchmark.query_benchmark
+    python -m app.scripts.benchmark.query_benchmark --iterations 5000
+"""
+
+import argparse
+import statistics
+import time
+from collections import Counter
+from typing import Callable, List, Tuple
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from app.infrastructure import Category, Ticket, User
+from app.infrastructure.database import SessionLocal, engine
+from app.api.v1.controllers.ticket_controller import CATEGORIES_BY_IDS
+from app.api.v1.routers.auth import USER_BY_USERNAME
+
+
+class QueryBenchmark:
+    """
+    A class to time lookups and count the compiled cache hits of their statements.
+    """
+
+    def __init__(self, session: Session, iterations: int):
+        """
+        Initialize the benchmark.
+
+        Args:
+            session (Session): The database session the lookups run in.
+            iterations (int): The number of lookups per case.
+        """
+        self.session = session
+        self.iterations = iterations
+        self.cache_stats: Counter = Counter()
+        self.result = None
+        event.listen(engine, "before_cursor_execute", self._count_cache_hit)
+
+    def _count_cache_hit(self, _conn, _cursor, _statement, _parameters, context, _executemany):
+        self.cache_stats[context.cache_hit.name] += 1
+
+    def run(self, lookup: Callable[[], object], clear_identity_map: bool = True) -> Tuple[float, float, str]:
+        """
+        Time a lookup.
+
+        Args:
+            lookup (Callable[[], object]): The lookup.
+            clear_identity_map (bool): Whether the identity map is cleared before each lookup.
+
+        Returns:
+            Tuple[float, float, str]: The median and p95 latency in microseconds, and the compiled cache statistics.
+        """
+        # The identity map only holds weak references: keep the last result alive between lookups.
+        self.result = lookup()
+        self.cache_stats.clear()
+        latencies: List[float] = []
+        for _ in range(self.iterations):
+            if clear_identity_map:
+                self.session.expunge_all()
+            start = time.perf_counter()
+            self.result = lookup()
+            latencies.append((time.perf_counter() - start) * 1e6)
+        stats = ", ".join(f"{name.lower()}={count}" for name, count in sorted(self.cache_stats.items())) or "no SQL"
+        return statistics.median(latencies), statistics.quantiles(latencies, n=20)[18], stats
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000, help="lookups per case")
+    return parser.parse_args()
+
+
+def main():
+    """Run every case and print the report."""
+    args = parse_args()
+    session = SessionLocal()
+    try:
+        ticket_id = session.scalar(select(Ticket.id).limit(1))
+        category_ids = list(session.scalars(select(Category.id).limit(3)))
+        username = session.scalar(select(User.username).limit(1))
+        if ticket_id is None or not category_ids or username is None:
+            raise RuntimeError("Seed the database with tickets, categories and users before running the benchmark.")
+
+        benchmark = QueryBenchmark(session, args.iterations)
+        cases = [
+            ("ticket by id: Query", lambda: session.query(Ticket).filter(Ticket.id == ticket_id).first(), True),
+            ("ticket by id: Session.get", lambda: session.get(Ticket, ticket_id), True),
+            ("categories in_: Query", lambda: session.query(Category).filter(Category.id.in_(category_ids)).all(), True),
+            ("categories in_: prebuilt select", lambda: session.scalars(CATEGORIES_BY_IDS, {"ids": category_ids}).all(), True),
+            ("login user: Query", lambda: session.query(User).filter(User.username == username).first(), True),
+            ("login user: prebuilt select", lambda: session.scalars(USER_BY_USERNAME, {"username": username}).first(), True),
+            ("ticket by id: Session.get, identity map hit", lambda: session.get(Ticket, ticket_id), False),
+        ]
+
+        print(f"{'lookup':<46} {'p50 us':>8} {'p95 us':>8}  compiled cache")
+        for label, lookup, clear_identity_map in cases:
+            median, p95, stats = benchmark.run(lookup, clear_identity_map)
+            print(f"{label:<46} {median:>8.1f} {p95:>8.1f}  {stats}")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
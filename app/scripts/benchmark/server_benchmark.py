@@ -0,0 +1,199 @@
+"""
+A script to compare the throughput and latency of the API under different launch modes.
+
+Each mode is started as a subprocess on a local port, logged into as the sysadmin user, and sent a fixed
+number of authenticated GET requests from concurrent clients. The server is stopped with SIGTERM between
+modes, so the database must be migrated and reachable with the settings in ``.env``.
+
+Modes:
+    development  the previous container command: a single uvicorn process with ``--reload``
+    uvicorn      a single uvicorn process without the file watcher
+    production   gunicorn with the uvicorn workers configured in ``app.scripts.server.gunicorn_conf``
+
+Usage:
+    python -m app.scripts.benchmark.server_benchmark
+    python -m app.scripts.benchmark.server_benchmark --modes development production --requests 5000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import time
+from typing import List, Tuple
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+LAUNCH_COMMANDS = {
+    "development": ["python", "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", "{port}", "--reload"],
+    "uvicorn": ["python", "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", "{port}"],
+    "production": ["gunicorn", "app.main:app", "-c", "python:app.scripts.server.gunicorn_conf", "--bind", "127.0.0.1:{port}"],
+}
+
+
+class ServerBenchmark:
+    """
+    A class to start the API in one launch mode and load it with concurrent requests.
+    """
+
+    def __init__(self, mode: str, port: int, path: str):
+        """
+        Initialize the benchmark for a launch mode.
+
+        Args:
+            mode (str): A key of ``LAUNCH_COMMANDS``.
+            port (int): The local port the server listens on.
+            path (str): The endpoint requested during the measurement.
+        """
+        self.mode = mode
+        self.port = port
+        self.path = path
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    def start(self, timeout: float = 60) -> subprocess.Popen:
+        """
+        Start the server and wait until it accepts connections.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait.
+
+        Returns:
+            subprocess.Popen: The server process.
+
+        Raises:
+            RuntimeError: If the server exits or does not listen in time.
+        """
+        command = [part.format(port=self.port) for part in LAUNCH_COMMANDS[self.mode]]
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"{self.mode} server exited with code {process.returncode}")
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=1):
+                    return process
+            except OSError:
+                time.sleep(0.2)
+        self.stop(process)
+        raise RuntimeError(f"{self.mode} server did not listen on port {self.port} within {timeout} seconds")
+
+    @staticmethod
+    def stop(process: subprocess.Popen, timeout: float = 60):
+        """
+        Stop the server gracefully, killing it if it does not exit in time.
+
+        Args:
+            process (subprocess.Popen): The server process.
+            timeout (float): The number of seconds to wait after SIGTERM.
+        """
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    async def _login(self, client: httpx.AsyncClient) -> str:
+        response = await client.post(
+            f"{self.base_url}/api/v1/login/",
+            data={"username": os.environ["SYSADMIN_USERNAME"], "password": os.environ["SYSADMIN_PASSWORD"]},
+        )
+        response.raise_for_status()
+        return response.json()["access_token"]
+
+    async def load(self, requests: int, concurrency: int) -> Tuple[List[float], int, float]:
+        """
+        Send the requests from concurrent clients.
+
+        Args:
+            requests (int): The total number of requests.
+            concurrency (int): The number of requests in flight at once.
+
+        Returns:
+            Tuple[List[float], int, float]: The latency of each successful request in seconds, the number of
+            failed requests and the elapsed wall time in seconds.
+        """
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+            headers = {"Authorization": f"Bearer {await self._login(client)}"}
+            remaining = iter(range(requests))
+            latencies: List[float] = []
+            failures = 0
+
+            async def client_loop():
+                nonlocal failures
+                for _ in remaining:
+                    start = time.perf_counter()
+                    try:
+                        response = await client.get(f"{self.base_url}{self.path}", headers=headers)
+                        response.raise_for_status()
+                        latencies.append(time.perf_counter() - start)
+                    except httpx.HTTPError:
+                        failures += 1
+
+            start = time.perf_counter()
+            await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+            return latencies, failures, time.perf_counter() - start
+
+    def run(self, requests: int, concurrency: int, warmup: int) -> Tuple[str, float, float, float, float, int]:
+        """
+        Run the benchmark.
+
+        Args:
+            requests (int): The number of measured requests.
+            concurrency (int): The number of requests in flight at once.
+            warmup (int): The number of unmeasured requests sent first.
+
+        Returns:
+            Tuple[str, float, float, float, float, int]: The mode, requests per second, median, p95 and p99
+            latency in milliseconds, and the number of failed requests.
+        """
+        process = self.start()
+        try:
+            asyncio.run(self.load(warmup, concurrency))
+            latencies, failures, elapsed = asyncio.run(self.load(requests, concurrency))
+        finally:
+            self.stop(process)
+
+        latencies.sort()
+        if not latencies:
+            return self.mode, 0.0, 0.0, 0.0, 0.0, failures
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        return self.mode, len(latencies) / elapsed, statistics.median(latencies) * 1000, p95 * 1000, p99 * 1000, failures
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="*", choices=sorted(LAUNCH_COMMANDS), default=["development", "production"], help="launch modes to measure")
+    parser.add_argument("--path", default="/api/v1/severities/", help="endpoint requested during the measurement")
+    parser.add_argument("--requests", type=int, default=2000, help="measured requests per mode")
+    parser.add_argument("--concurrency", type=int, default=50, help="requests in flight at once")
+    parser.add_argument("--warmup", type=int, default=200, help="unmeasured requests sent before measuring")
+    parser.add_argument("--port", type=int, default=8099, help="local port the servers listen on")
+    return parser.parse_args()
+
+
+def main():
+    """Run the benchmark for every launch mode and print the report."""
+    args = parse_args()
+
+    print(f"{'mode':<12} {'req/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'failed':>7}")
+    for mode in args.modes:
+        label, throughput, median, p95, p99, failures = ServerBenchmark(mode, args.port, args.path).run(args.requests, args.concurrency, args.warmup)
+        print(f"{label:<12} {throughput:>10.1f} {median:>8.1f} {p95:>8.1f} {p99:>8.1f} {failures:>7}")
+
+
+if __name__ == "__main__":
+    main()
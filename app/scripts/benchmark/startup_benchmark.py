@@ -0,0 +1,141 @@
+"""
+A script to measure how long the API takes to import and to serve its first request.
+
+The import time is measured with ``python -X importtime`` in fresh interpreters and checked against the
+budget stored in ``import_budget.json``: the median cumulative import time of the application module must
+stay under ``budget_ms``, and none of the ``deferred_modules`` (heavy dependencies only imported on first
+use) may be imported. The script exits with status 1 when the budget is exceeded, so it can run in CI.
+
+The cold start is measured from spawning a fresh interpreter until the application, created through
+``app.main.create_app`` and started (which seeds the database), has answered its first request. It needs
+the database configured in ``.env``.
+
+Usage:
+    python -m app.scripts.benchmark.startup_benchmark
+    python -m app.scripts.benchmark.startup_benchmark --runs 10 --top 20 --skip-cold-start
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+BUDGET_PATH = os.path.join(os.path.dirname(__file__), "import_budget.json")
+
+COLD_START_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from fastapi.testclient import TestClient
+from app.main import create_app
+application = create_app()
+imported = time.perf_counter()
+with TestClient(application) as client:
+    started = time.perf_counter()
+    status = client.get("/api/v1/health/").status_code
+    answered = time.perf_counter()
+print(json.dumps({"import": imported - start, "startup": started - imported, "first_request": answered - started, "status": status}))
+"""
+
+
+def import_times(module: str) -> Tuple[float, Dict[str, float]]:
+    """
+    Import a module in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        module (str): The module to import.
+
+    Returns:
+        Tuple[float, Dict[str, float]]: The cumulative import time of the module in milliseconds, and the
+        self import time in milliseconds of every module imported.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True)
+    self_times: Dict[str, float] = {}
+    cumulative = 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        name = name.strip()
+        self_times[name] = int(self_us) / 1000
+        if name == module:
+            cumulative = int(cumulative_us) / 1000
+    return cumulative, self_times
+
+
+def cold_start(runs: int) -> List[Dict[str, float]]:
+    """
+    Time the cold start of the application in fresh interpreters.
+
+    Args:
+        runs (int): The number of interpreters started.
+
+    Returns:
+        List[Dict[str, float]]: For each run, the total, import, startup and first request times in seconds.
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", COLD_START_SCRIPT], capture_output=True, text=True, check=True)
+        total = time.perf_counter() - start
+        timing = json.loads(result.stdout.strip().splitlines()[-1])
+        if timing.pop("status") != 204:
+            raise RuntimeError("The first request to the health endpoint failed")
+        timings.append({"total": total, **timing})
+    return timings
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest modules listed")
+    parser.add_argument("--budget", default=BUDGET_PATH, help="path of the import budget file")
+    parser.add_argument("--skip-cold-start", action="store_true", help="only measure the import time")
+    return parser.parse_args()
+
+
+def main():
+    """Run the measurements, print the report and exit with status 1 if the import budget is exceeded."""
+    args = parse_args()
+    with open(args.budget, encoding="utf-8") as budget_file:
+        budget = json.load(budget_file)
+    module = budget["module"]
+
+    runs = [import_times(module) for _ in range(args.runs)]
+    median = statistics.median(cumulative for cumulative, _ in runs)
+    self_times = {name: statistics.median(times.get(name, 0.0) for _, times in runs) for name in runs[-1][1]}
+
+    print(f"import {module}: median {median:.1f} ms over {args.runs} runs (budget {budget['budget_ms']} ms)")
+    print(f"\n{'module':<60} {'self ms':>8}")
+    for name, self_time in sorted(self_times.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"{name:<60} {self_time:>8.1f}")
+
+    failures = []
+    if median > budget["budget_ms"]:
+        failures.append(f"import time {median:.1f} ms exceeds the budget of {budget['budget_ms']} ms")
+    imported = {name.split(".")[0] for name in runs[-1][1]}
+    failures.extend(f"{name} is imported at startup but must be deferred" for name in budget["deferred_modules"] if name in imported)
+
+    if not args.skip_cold_start:
+        timings = cold_start(args.runs)
+        print(f"\n{'cold start':<16} {'median ms':>10} {'max ms':>10}")
+        for phase in ("total", "import", "startup", "first_request"):
+            values = [timing[phase] * 1000 for timing in timings]
+            print(f"{phase:<16} {statistics.median(values):>10.1f} {max(values):>10.1f}")
+
+    for failure in failures:
+        print(f"\nFAILED: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
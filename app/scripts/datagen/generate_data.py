@@ -0,0 +1,393 @@
+"""
+A script to fill the database with synthetic users and tickets for benchmarks.
+
+Rows are streamed with ``COPY`` in batches, each batch generated and loaded in its own transaction by a pool
+of worker processes, so millions of rows load in minutes. The data follows the shape of production traffic:
+
+- creation times spread over ``--days`` days before ``--until``, with the ticket rate growing over time;
+  ticket IDs are UUIDv7 keys of their creation time, so the key order follows creation order;
+- the status depends on the ticket's age: older tickets are mostly resolved, recent ones open or in progress;
+- severities 2, 3 and 4 (level 1 cannot be used for tickets), medium the most common;
+- one category per ticket, sometimes two, with a long-tail popularity, and zero to three of their subcategories;
+- a comment from one of the generated users on a share of the tickets, in ``ticket_comments`` with its snippet
+  and count on the ticket.
+
+Every batch draws from its own generator seeded with ``--seed`` and the batch number, so the same seed generates
+the same rows against the same categories whatever the number of workers. Every user gets the password given
+by ``--password``, hashed once. Usernames embed the seed, so run a second load with another seed.
+
+Usage:
+    python -m app.scripts.datagen.generate_data --tickets 1000000 --users 10000
+    python -m app.scripts.datagen.generate_data --tickets 10000000 --users 100000 --seed 7 --until 2026-01-01
+"""
+
+import argparse
+import io
+import math
+import os
+import random
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Tuple
+from app.core import Hash
+from app.infrastructure.database import engine
+
+STATUS_OPEN, STATUS_IN_PROGRESS, STATUS_RESOLVED = "ABERTO", "EM_PROGRESSO", "RESOLVIDO"
+SEVERITY_WEIGHTS = {2: 15, 3: 50, 4: 35}
+SUBCATEGORY_COUNT_WEIGHTS = (20, 50, 20, 10)
+SECOND_CATEGORY_SHARE = 0.15
+INACTIVE_USER_SHARE = 0.03
+TICKET_COLUMNS = "id, title, description, severity_id, status, comment, comment_user, created_at, updated_at, version, category_ids, subcategory_ids, comment_count"
+
+FIRST_NAMES = ("Ana", "Bruno", "Carla", "Diego", "Elisa", "Felipe", "Gabriela", "Hugo", "Isabela", "João", "Larissa", "Marcos", "Natália", "Otávio")
+LAST_NAMES = ("Silva", "Santos", "Oliveira", "Souza", "Lima", "Pereira", "Costa", "Rodrigues", "Almeida", "Nascimento", "Carvalho", "Ribeiro")
+COMPONENTS = ("checkout", "payments", "search", "login", "catalog", "shipping", "notifications", "reports", "orders", "billing", "inventory")
+PROBLEMS = (
+    "returns 500 errors",
+    "times out under load",
+    "shows stale data",
+    "fails after the last deploy",
+    "is slow for large accounts",
+    "drops requests intermittently",
+    "logs credentials in plain text",
+    "loses messages on restart",
+)
+DETAILS = (
+    "Reported by several users since this morning.",
+    "Only happens in the production environment.",
+    "Started after the database maintenance window.",
+    "The error rate doubles during peak hours.",
+    "Could not reproduce it locally yet.",
+    "Rolling back the release did not help.",
+)
+COMMENTS = (
+    "Looking into it now.",
+    "Confirmed, it reproduces with the steps above.",
+    "A fix is ready for review.",
+    "Deployed the fix, please check again.",
+    "Waiting for more details from the reporter.",
+    "Duplicate of an older ticket, closing soon.",
+)
+
+
+def uuid7_at(timestamp: datetime, rng: random.Random) -> uuid.UUID:
+    """
+    Build a UUIDv7 for a creation time, with random bits drawn from a seeded generator.
+
+    Args:
+        timestamp (datetime): The creation time.
+        rng (random.Random): The random generator.
+
+    Returns:
+        uuid.UUID: The identifier.
+    """
+    timestamp_ms = int(timestamp.timestamp() * 1000)
+    return uuid.UUID(int=(timestamp_ms & 0xFFFFFFFFFFFF) << 80 | 0x7 << 76 | rng.getrandbits(12) << 64 | 0x2 << 62 | rng.getrandbits(62))
+
+
+class DataGenerator:
+    """
+    A class to generate seeded synthetic rows and load them with ``COPY``.
+    """
+
+    def __init__(self, seed: int, until: datetime, days: int, comment_rate: float, batch_size: int):
+        """
+        Initialize the generator.
+
+        Args:
+            seed (int): The seed of the random generators.
+            until (datetime): The creation time of the newest rows.
+            days (int): The number of days the creation times are spread over.
+            comment_rate (float): The share of tickets with a comment.
+            batch_size (int): The number of tickets or users loaded per transaction.
+        """
+        self.seed = seed
+        self.until = until
+        self.span = timedelta(days=days)
+        self.comment_rate = comment_rate
+        self.batch_size = batch_size
+        self.users = 0
+        self.password_hash = ""
+        self.severities: List[str] = []
+        self.severity_weights: List[int] = []
+        self.categories: List[Tuple[str, List[str]]] = []
+        self.category_weights: List[float] = []
+
+    def load_reference_data(self, cursor):
+        """
+        Read the severities and categories tickets are assigned to.
+
+        Categories are ordered by name and then shuffled with the seed to assign their popularity, so the
+        assignment does not depend on their random IDs.
+
+        Args:
+            cursor: A DBAPI cursor.
+
+        Raises:
+            RuntimeError: If the database has not been seeded with severities and categories.
+        """
+        cursor.execute("SELECT id, level FROM severity WHERE level = ANY(%s) ORDER BY level", (list(SEVERITY_WEIGHTS),))
+        severities = cursor.fetchall()
+        cursor.execute(
+            "SELECT c.id, coalesce(array_agg(s.id ORDER BY s.name) FILTER (WHERE s.id IS NOT NULL), '{}') "
+            "FROM categories c LEFT JOIN subcategories s ON s.category_id = c.id GROUP BY c.id, c.name ORDER BY c.name"
+        )
+        categories = [
+            (str(category_id), [str(subcategory_id) for subcategory_id in subcategory_ids]) for category_id, subcategory_ids in cursor.fetchall()
+        ]
+        if not severities or not categories:
+            raise RuntimeError("Seed the database with severities and categories before generating data.")
+
+        self.severities = [str(severity_id) for severity_id, _ in severities]
+        self.severity_weights = [SEVERITY_WEIGHTS[level] for _, level in severities]
+        random.Random(self.seed).shuffle(categories)
+        self.categories = categories
+        self.category_weights = [1 / rank for rank in range(1, len(categories) + 1)]
+
+    def username(self, index: int) -> str:
+        """
+        Get the username of a generated user.
+
+        Args:
+            index (int): The position of the user.
+
+        Returns:
+            str: The username.
+        """
+        return f"load{self.seed}_{index:08d}"
+
+    def created_at(self, rng: random.Random, index: int, total: int) -> datetime:
+        """
+        Get the creation time of the row at a position, the rate of rows growing linearly over time.
+
+        Args:
+            rng (random.Random): The generator of the batch.
+            index (int): The position of the row.
+            total (int): The number of rows.
+
+        Returns:
+            datetime: The creation time, increasing with the position.
+        """
+        return self.until - self.span + self.span * math.sqrt((index + rng.random()) / total)
+
+    def user_rows(self, batch: int, total: int) -> str:
+        """
+        Generate a batch of users in ``COPY`` text format.
+
+        Args:
+            batch (int): The batch number.
+            total (int): The number of users of the whole load.
+
+        Returns:
+            str: The rows.
+        """
+        rng = random.Random(f"{self.seed}:users:{batch}")
+        lines = []
+        for index in range(batch * self.batch_size, min(total, (batch + 1) * self.batch_size)):
+            username = self.username(index)
+            active = "f" if rng.random() < INACTIVE_USER_SHARE else "t"
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            user_id = uuid.UUID(int=rng.getrandbits(128), version=4)
+            created_at = self.created_at(rng, index, total).isoformat()
+            lines.append(f"{user_id}\t{username}\t{name}\t{username}@example.com\t{self.password_hash}\t{active}\tuser\t{created_at}\n")
+        return "".join(lines)
+
+    def ticket_rows(self, batch: int, total: int) -> Tuple[str, str, str, str]:
+        """
+        Generate a batch of tickets, their category and subcategory links and their comments in ``COPY`` text format.
+
+        Args:
+            batch (int): The batch number.
+            total (int): The number of tickets of the whole load.
+
+        Returns:
+            Tuple[str, str, str, str]: The rows of ``tickets``, ``ticket_categories``, ``ticket_subcategories`` and ``ticket_comments``.
+        """
+        rng = random.Random(f"{self.seed}:tickets:{batch}")
+        start = batch * self.batch_size
+        count = min(total, start + self.batch_size) - start
+        severities = rng.choices(self.severities, self.severity_weights, k=count)
+        categories = rng.choices(self.categories, self.category_weights, k=count)
+        tickets, ticket_categories, ticket_subcategories, ticket_comments = [], [], [], []
+
+        for offset in range(count):
+            index = start + offset
+            created_at = self.created_at(rng, index, total)
+            ticket_id = uuid7_at(created_at, rng)
+            status, version, updated_at = self._lifecycle(rng, created_at, (index + 0.5) / total)
+
+            chosen = [categories[offset]]
+            if rng.random() < SECOND_CATEGORY_SHARE:
+                second = rng.choices(self.categories, self.category_weights)[0]
+                if second[0] != chosen[0][0]:
+                    chosen.append(second)
+            subcategory_pool = [subcategory for _, subcategories in chosen for subcategory in subcategories]
+            subcategory_count = min(len(subcategory_pool), rng.choices(range(len(SUBCATEGORY_COUNT_WEIGHTS)), SUBCATEGORY_COUNT_WEIGHTS)[0])
+            category_ids = [category_id for category_id, _ in chosen]
+            subcategory_ids = rng.sample(subcategory_pool, subcategory_count)
+
+            if self.users and rng.random() < self.comment_rate:
+                comment, comment_user, comment_count = rng.choice(COMMENTS), f"{self.username(rng.randrange(self.users))}@example.com", 1
+                commented_at = created_at if updated_at == "\\N" else datetime.fromisoformat(updated_at)
+                ticket_comments.append(f"{uuid7_at(commented_at, rng)}\t{ticket_id}\t{comment}\t{comment_user}\t{commented_at.isoformat()}\n")
+            else:
+                comment, comment_user, comment_count = "\\N", "\\N", 0
+
+            title = f"{rng.choice(COMPONENTS).capitalize()} {rng.choice(PROBLEMS)}"
+            tickets.append(
+                f"{ticket_id}\t{title}\t{rng.choice(DETAILS)} {rng.choice(DETAILS)}\t{severities[offset]}\t{status}\t{comment}\t{comment_user}\t"
+                f"{created_at.isoformat()}\t{updated_at}\t{version}\t{{{','.join(category_ids)}}}\t{{{','.join(subcategory_ids)}}}\t{comment_count}\n"
+            )
+            ticket_categories.extend(f"{ticket_id}\t{category_id}\n" for category_id in category_ids)
+            ticket_subcategories.extend(f"{ticket_id}\t{subcategory_id}\n" for subcategory_id in subcategory_ids)
+
+        return "".join(tickets), "".join(ticket_categories), "".join(ticket_subcategories), "".join(ticket_comments)
+
+    def _lifecycle(self, rng: random.Random, created_at: datetime, age: float) -> Tuple[str, int, str]:
+        """Draw the status, version and last update of a ticket; ``age`` goes from 0 (oldest) to 1 (newest)."""
+        recency = age**8
+        draw = rng.random()
+        if draw < 0.05 + 0.4 * recency:
+            status, version = STATUS_OPEN, 1
+        elif draw < 0.1 + 0.65 * recency:
+            status, version = STATUS_IN_PROGRESS, rng.randint(2, 3)
+        else:
+            status, version = STATUS_RESOLVED, rng.randint(3, 5)
+        if version == 1:
+            return status, version, "\\N"
+        updated_at = min(self.until, created_at + timedelta(hours=rng.expovariate(1 / 48)))
+        return status, version, updated_at.isoformat()
+
+    def load_users(self, batch: int, total: int) -> int:
+        """
+        Generate and load a batch of users in one transaction.
+
+        Args:
+            batch (int): The batch number.
+            total (int): The number of users of the whole load.
+
+        Returns:
+            int: The number of users loaded.
+        """
+        rows = self.user_rows(batch, total)
+        with _transaction() as cursor:
+            copy(cursor, "users", "id, username, name, email, password, active, role, created_at", rows)
+        return rows.count("\n")
+
+    def load_tickets(self, batch: int, total: int) -> int:
+        """
+        Generate and load a batch of tickets with their category and subcategory links and comments in one transaction.
+
+        Args:
+            batch (int): The batch number.
+            total (int): The number of tickets of the whole load.
+
+        Returns:
+            int: The number of tickets loaded.
+        """
+        ticket_rows, category_rows, subcategory_rows, comment_rows = self.ticket_rows(batch, total)
+        with _transaction() as cursor:
+            copy(cursor, "tickets", TICKET_COLUMNS, ticket_rows)
+            copy(cursor, "ticket_categories", "ticket_id, category_id", category_rows)
+            copy(cursor, "ticket_subcategories", "ticket_id, subcategory_id", subcategory_rows)
+            copy(cursor, "ticket_comments", "id, ticket_id, body, author, created_at", comment_rows)
+        return ticket_rows.count("\n")
+
+    def run(self, users: int, tickets: int, password: str, workers: int):
+        """
+        Generate and load the users, then the tickets, reporting the progress.
+
+        Args:
+            users (int): The number of users.
+            tickets (int): The number of tickets.
+            password (str): The password of every user.
+            workers (int): The number of worker processes.
+        """
+        with _transaction() as cursor:
+            self.load_reference_data(cursor)
+        self.users = users
+        self.password_hash = Hash.bcrypt(password)
+        engine.dispose()
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            for label, load, total in (("users", self.load_users, users), ("tickets", self.load_tickets, tickets)):
+                started, done = time.perf_counter(), 0
+                batches = range(math.ceil(total / self.batch_size))
+                for loaded in executor.map(load, batches, [total] * len(batches)):
+                    done += loaded
+                    elapsed = time.perf_counter() - started
+                    print(f"{label}: {done}/{total} ({done / elapsed:,.0f} rows/s)", flush=True)
+
+        with _transaction() as cursor:
+            cursor.execute("ANALYZE users, tickets, ticket_categories, ticket_subcategories, ticket_comments")
+
+
+@contextmanager
+def _transaction() -> Iterator:
+    """Run a block with a cursor of a pooled raw connection, committing at the end or rolling back on error."""
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        yield cursor
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+
+def _init_worker():
+    engine.dispose(close=False)
+
+
+def copy(cursor, table: str, columns: str, rows: str):
+    """
+    Load rows into a table with ``COPY``.
+
+    Args:
+        cursor: A DBAPI cursor.
+        table (str): The table name.
+        columns (str): The comma-separated column names, in the order of the rows' fields.
+        rows (str): The rows in ``COPY`` text format.
+    """
+    if rows:
+        cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN", io.StringIO(rows))
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickets", type=int, default=100_000, help="number of tickets to generate")
+    parser.add_argument("--users", type=int, default=1_000, help="number of users to generate")
+    parser.add_argument("--seed", type=int, default=42, help="seed of the random generators")
+    parser.add_argument("--until", type=datetime.fromisoformat, default=None, help="creation time of the newest rows (default: today, UTC)")
+    parser.add_argument("--days", type=int, default=730, help="days the creation times are spread over")
+    parser.add_argument("--comment-rate", type=float, default=0.3, help="share of tickets with a comment")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="rows generated and loaded per transaction")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes generating and loading batches")
+    parser.add_argument("--password", default="password", help="password of every generated user")
+    return parser.parse_args()
+
+
+def main():
+    """Generate the data described by the command line arguments."""
+    args = parse_args()
+    until = args.until or datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    if until.tzinfo is None:
+        until = until.replace(tzinfo=timezone.utc)
+    started = time.perf_counter()
+    DataGenerator(args.seed, until, args.days, args.comment_rate, args.batch_size).run(args.users, args.tickets, args.password, args.workers)
+    print(f"Generated {args.users} users and {args.tickets} tickets in {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@
 #!/usr/bin/env python3
 
 
+import os
 import socket
 import subprocess
 import time
@@ -13,6 +14,8 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+SERVER_MODE = os.environ.get("SERVER_MODE", "development")
+
 
 def _migrate_database():
     """Run database schema migration using Alembic."""
@@ -36,13 +39,20 @@ def wait_for_db(db_host_arg, db_port_arg, timeout=30):
         time.sleep(1)
 
 
+def server_command(api_port_arg):
+    """Build the command launching the API: a reloading uvicorn by default, or gunicorn with uvicorn workers in production mode."""
+    if SERVER_MODE == "production":
+        return ["gunicorn", "app.main:app", "-c", "python:app.scripts.server.gunicorn_conf", "--bind", f"0.0.0.0:{api_port_arg}"]
+    return ["python", "-m", "uvicorn", "app.main:app", "--host", "0.0.0.0", "--port", str(api_port_arg), "--reload"]
+
+
 if __name__ == "__main__":
     host = sys.argv[1]
     port = int(sys.argv[2])
     api_port = int(sys.argv[3])
     if wait_for_db(host, port):
         print("Database is ready to receive connections!")
-        subprocess.run(["python", "-m", "uvicorn", "app.main:app", "--host", "0.0.0.0", "--port", str(api_port), "--reload"], check=True)
+        subprocess.run(server_command(api_port), check=True)
         sys.exit(0)
     else:
         sys.exit(1)
@@ -4,13 +4,21 @@ External API Interaction Module
 
 import logging
 import random
-import requests
+from typing import List
 from fastapi import HTTPException
+from app.core import traced
 
 JSONPLACEHOLDER_URL = "https://jsonplaceholder.typicode.com"
+JSONPLACEHOLDER_USER_COUNT = 10
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
+
+
+def _http_client():
+    """Import ``requests`` on first use, keeping it and its dependencies out of the API's startup."""
+    import requests  # pylint: disable=import-outside-toplevel
+
+    return requests
 
 
 class External:
@@ -19,6 +27,7 @@ class External:
     """
 
     @staticmethod
+    @traced()
     def fetch_random_comment() -> dict:
         """
         Fetch a random comment from JSONPlaceholder.
@@ -29,6 +38,7 @@ class External:
         Raises:
             HTTPException: If there's an issue fetching comments from the external API.
         """
+        requests = _http_client()
         try:
             response = requests.get(f"{JSONPLACEHOLDER_URL}/comments", timeout=10)
             response.raise_for_status()
@@ -51,6 +61,48 @@ class External:
             raise HTTPException(status_code=500, detail=str(e)) from e
 
     @staticmethod
+    @traced()
+    def fetch_comment_sample(count: int) -> List[dict]:
+        """
+        Fetch the JSONPlaceholder comments once and draw a random sample of them.
+
+        Comments are drawn without replacement; a sample larger than the corpus goes through it in a new
+        random order each time, so no comment is used twice before every other one was used once.
+
+        Args:
+            count (int): The number of comments to draw.
+
+        Returns:
+            List[dict]: The comments, each with the comment body and user email.
+
+        Raises:
+            HTTPException: If there's an issue fetching comments from the external API.
+        """
+        requests = _http_client()
+        try:
+            response = requests.get(f"{JSONPLACEHOLDER_URL}/comments", timeout=10)
+            response.raise_for_status()
+            comments = response.json()
+
+            if not comments:
+                raise HTTPException(status_code=404, detail="No comments found.")
+
+            sample = []
+            while len(sample) < count:
+                sample.extend(random.sample(comments, min(len(comments), count - len(sample))))
+            return [{"comment_text": comment["body"].replace("\n", " "), "comment_user": comment["email"]} for comment in sample]
+
+        except requests.HTTPError as e:
+            logger.error("Error fetching comments from external API: %s", e)
+            raise HTTPException(status_code=response.status_code, detail="Error fetching comments from external API") from e
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("Error fetching comments: %s", e)
+            raise HTTPException(status_code=500, detail=str(e)) from e
+
+    @staticmethod
+    @traced()
     def fetch_random_user() -> dict:
         """
         Fetch a random user from JSONPlaceholder.
@@ -61,6 +113,7 @@ class External:
         Raises:
             HTTPException: If there's an issue fetching users from the external API.
         """
+        requests = _http_client()
         try:
             response = requests.get(f"{JSONPLACEHOLDER_URL}/users", timeout=10)
             response.raise_for_status()
@@ -78,3 +131,35 @@ class External:
         except Exception as e:
             logger.error("Error fetching users: %s", e)
             raise HTTPException(status_code=500, detail=str(e)) from e
+
+    @staticmethod
+    @traced()
+    def fetch_users() -> List[dict]:
+        """
+        Fetch every user from JSONPlaceholder.
+
+        Returns:
+            List[dict]: The users, each with the user name, email, and username.
+
+        Raises:
+            HTTPException: If there's an issue fetching users from the external API.
+        """
+        requests = _http_client()
+        try:
+            response = requests.get(f"{JSONPLACEHOLDER_URL}/users", timeout=10)
+            response.raise_for_status()
+            users = response.json()
+
+            if not users:
+                raise HTTPException(status_code=404, detail="No users found.")
+
+            return [{"name": user["name"], "email": user["email"], "username": user["username"]} for user in users]
+
+        except requests.HTTPError as e:
+            logger.error("Error fetching users from external API: %s", e)
+            raise HTTPException(status_code=e.response.status_code, detail="Error fetching users from external API") from e
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("Error fetching users: %s", e)
+            raise HTTPException(status_code=500, detail=str(e)) from e
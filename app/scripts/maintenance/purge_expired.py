@@ -0,0 +1,45 @@
+"""
+A script to delete expired rows from the tables that only hold them until they expire.
+
+- ``idempotency_keys``: stored responses of requests sent with an Idempotency-Key header, kept for
+  ``IDEMPOTENCY_KEY_TTL_HOURS`` hours.
+- ``refresh_tokens``: refresh tokens, kept for ``REFRESH_TOKEN_EXPIRE_DAYS`` days, used or not.
+
+Run it periodically, e.g. hourly from cron, next to the archival job. Safe to run concurrently with the API.
+
+Usage:
+    python -m app.scripts.maintenance.purge_expired
+"""
+
+from typing import Dict
+from sqlalchemy.orm import Session
+from app.infrastructure.database import engine
+from app.api.v1.controllers.idempotency_controller import IdempotencyController
+from app.api.v1.controllers.refresh_token_controller import RefreshTokenController
+
+
+def purge_expired(session: Session) -> Dict[str, int]:
+    """
+    Delete the expired rows of every table, each table in its own transaction.
+
+    Args:
+        session (Session): The database session.
+
+    Returns:
+        Dict[str, int]: The number of deleted rows per table.
+    """
+    return {
+        "idempotency_keys": IdempotencyController(session).purge_expired(),
+        "refresh_tokens": RefreshTokenController(session).purge_expired(),
+    }
+
+
+def main():
+    """Purge the expired rows and print how many were deleted."""
+    with Session(engine) as session:
+        for table, deleted in purge_expired(session).items():
+            print(f"Deleted {deleted} expired rows from {table}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Gunicorn configuration for running the API in production.
+
+The application is imported once in the master process (``preload_app``), so the workers share the imported
+code pages; each worker seeds the database at startup, serialized by an advisory lock. Each forked worker drops
+the database connections inherited from the master, workers are recycled after ``MAX_REQUESTS`` requests (with
+jitter, so they do not restart together), and on shutdown they drain in-flight requests for up to
+``GRACEFUL_TIMEOUT`` seconds before closing their notification listener and connection pool.
+
+Usage:
+    gunicorn app.main:app -c python:app.scripts.server.gunicorn_conf
+"""
+
+import multiprocessing
+import os
+from app.infrastructure.database import engine
+from app.infrastructure.events import notification_listener
+
+bind = f"0.0.0.0:{os.environ.get('API_PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY") or multiprocessing.cpu_count())
+worker_class = "app.scripts.server.worker.ServerWorker"
+preload_app = True
+
+max_requests = int(os.environ.get("MAX_REQUESTS", "10000"))
+max_requests_jitter = int(os.environ.get("MAX_REQUESTS_JITTER", "1000"))
+timeout = int(os.environ.get("WORKER_TIMEOUT", "60"))
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.environ.get("KEEPALIVE", "5"))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("LOG_LEVEL", "info")
+
+
+def post_fork(_server, _worker):
+    """Discard the pooled connections inherited from the master without closing the master's sockets."""
+    engine.dispose(close=False)
+
+
+def worker_exit(_server, _worker):
+    """Stop the notification listener and close the worker's connection pool once requests are drained."""
+    notification_listener.stop()
+    engine.dispose()
+
+
+def on_exit(_server):
+    """Close the connections the master opened while importing the application."""
+    engine.dispose()
@@ -0,0 +1,21 @@
+"""Uvicorn worker class used by the production gunicorn launcher."""
+
+import os
+from uvicorn.workers import UvicornWorker
+
+GRACEFUL_TIMEOUT_SECONDS = int(os.environ.get("GRACEFUL_TIMEOUT", "30"))
+
+
+class ServerWorker(UvicornWorker):
+    """
+    Uvicorn worker running on uvloop with the httptools parser.
+
+    On shutdown the worker stops accepting connections and waits up to ``GRACEFUL_TIMEOUT`` seconds for
+    in-flight requests to finish before cancelling them, the same budget gunicorn gives it before killing it.
+    """
+
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "timeout_graceful_shutdown": GRACEFUL_TIMEOUT_SECONDS,
+    }
@@ -7,11 +7,21 @@ from uuid import uuid4
 from dotenv import load_dotenv, find_dotenv
 import pytest
 from app.tests import create_client
+from app.infrastructure import seed_database
 
 load_dotenv(find_dotenv(".env"))
 client = create_client()
 
 
+@pytest.fixture(name="seeded_database", scope="session", autouse=True)
+def fixture_seeded_database():
+    """
+    Seeds the database once per session as the application startup does, since the test client
+    does not run the startup events.
+    """
+    seed_database()
+
+
 @pytest.fixture(name="user", scope="session")
 def create_user(access_token):
     """
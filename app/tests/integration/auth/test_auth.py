@@ -3,6 +3,12 @@ Integration tests for the login endpoint in the authentication system.
 """
 
 import os
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
+from app.api.v1.controllers.refresh_token_controller import RefreshTokenController
+from app.infrastructure import RefreshToken
+from app.infrastructure.database import SessionLocal
+from app.scripts.maintenance.purge_expired import purge_expired
 from app.tests import create_client
 
 client = create_client()
@@ -111,3 +117,117 @@ def test_login_without_username(access_token):
         headers={"Authorization": f"Bearer {access_token}"},
     )
     assert response.status_code == 422
+
+
+def _login_sysadmin():
+    response = client.post(
+        url="/api/v1/login/", data={"username": os.environ.get("SYSADMIN_USERNAME"), "password": os.environ.get("SYSADMIN_PASSWORD")}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_refresh_token_rotation():
+    """
+    Test exchanging a refresh token for a new access token.
+
+    Test steps:
+    1. Log in and get a refresh token.
+    2. Send the refresh token to the refresh endpoint.
+    3. Verify the response contains a usable access token and a new refresh token.
+    """
+    login_data = _login_sysadmin()
+    assert login_data["refresh_token"]
+
+    response = client.post("/api/v1/login/refresh", json={"refresh_token": login_data["refresh_token"]})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["token_type"] == "bearer"
+    assert data["refresh_token"] != login_data["refresh_token"]
+    assert data["scopes"] == login_data["scopes"]
+
+    response = client.get("/api/v1/severities/", headers={"Authorization": f"Bearer {data['access_token']}"})
+    assert response.status_code == 200
+
+
+def test_refresh_token_reuse_revokes_family():
+    """
+    Test that reusing a rotated refresh token revokes every token of its login.
+
+    Test steps:
+    1. Log in and rotate the refresh token once.
+    2. Send the original, already used refresh token again.
+    3. Verify the response status code is 401 (Unauthorized).
+    4. Verify the refresh token issued by the rotation is no longer accepted either.
+    """
+    login_data = _login_sysadmin()
+    response = client.post("/api/v1/login/refresh", json={"refresh_token": login_data["refresh_token"]})
+    assert response.status_code == 200
+    rotated_token = response.json()["refresh_token"]
+
+    response = client.post("/api/v1/login/refresh", json={"refresh_token": login_data["refresh_token"]})
+    assert response.status_code == 401
+
+    response = client.post("/api/v1/login/refresh", json={"refresh_token": rotated_token})
+    assert response.status_code == 401
+
+
+def test_refresh_invalid_token():
+    """
+    Test the refresh endpoint with an unknown refresh token.
+
+    Test steps:
+    1. Send a refresh token that was never issued.
+    2. Verify the response status code is 401 (Unauthorized).
+    """
+    response = client.post("/api/v1/login/refresh", json={"refresh_token": "not-a-refresh-token"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid refresh token"
+
+
+def test_logout_revokes_tokens():
+    """
+    Test that logging out revokes the access token and the refresh token.
+
+    Test steps:
+    1. Log in and verify the access token is accepted.
+    2. Log out sending the refresh token.
+    3. Verify the access token and the refresh token are both rejected with 401 (Unauthorized).
+    """
+    login_data = _login_sysadmin()
+    headers = {"Authorization": f"Bearer {login_data['access_token']}"}
+    assert client.get("/api/v1/severities/", headers=headers).status_code == 200
+
+    response = client.post("/api/v1/login/logout", json={"refresh_token": login_data["refresh_token"]}, headers=headers)
+    assert response.status_code == 204
+
+    assert client.get("/api/v1/severities/", headers=headers).status_code == 401
+    response = client.post("/api/v1/login/refresh", json={"refresh_token": login_data["refresh_token"]})
+    assert response.status_code == 401
+
+
+def test_purge_expired_refresh_tokens():
+    """
+    Test that the maintenance script deletes expired refresh tokens and keeps the others.
+
+    Test steps:
+    1. Log in twice and expire the refresh token of the first login.
+    2. Run the purge.
+    3. Verify that only the expired token was deleted and the other one is still accepted.
+    """
+    expired_token = _login_sysadmin()["refresh_token"]
+    valid_token = _login_sysadmin()["refresh_token"]
+
+    db = SessionLocal()
+    try:
+        digest = RefreshTokenController.digest(expired_token)
+        db.scalars(select(RefreshToken).where(RefreshToken.token_hash == digest)).one().expires_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+        db.commit()
+
+        assert purge_expired(db)["refresh_tokens"] >= 1
+        assert db.scalars(select(RefreshToken).where(RefreshToken.token_hash == digest)).first() is None
+    finally:
+        db.close()
+
+    response = client.post("/api/v1/login/refresh", json={"refresh_token": valid_token})
+    assert response.status_code == 200
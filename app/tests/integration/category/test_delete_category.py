@@ -3,6 +3,10 @@ Tests for the API endpoints related to categories,
 specifically focusing on the deletion function.
 """
 
+from uuid import uuid4
+from sqlalchemy import select
+from app.infrastructure import TicketEvent
+from app.infrastructure.database import SessionLocal
 from app.tests import create_client
 
 client = create_client()
@@ -58,3 +62,51 @@ def test_delete_category_unauthorized(category_to_delete):
     """
     response = client.delete(url=f"/api/v1/categories/?category_id={category_to_delete['id']}")
     assert response.status_code == 401
+
+
+def test_delete_category_cascades(access_token, severity, category, subcategory):
+    """
+    Test deleting a category in use and verify its subcategories and ticket associations are removed.
+
+    Args:
+        access_token (str): The access token for authorization.
+        severity (dict): Data of the severity used by the ticket.
+        category (dict): Data of the category to delete.
+        subcategory (dict): Data of a subcategory of the category.
+
+    Test steps:
+    1. Create a ticket linked to the category and its subcategory.
+    2. Delete the category and verify the response status code, expecting 202 (Accepted).
+    3. Verify the subcategory is gone and the ticket no longer lists the category.
+    4. Verify that the ticket version was bumped and an "updated" event was recorded for it.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    ticket_response = client.post(
+        "/api/v1/tickets/",
+        json={
+            "title": f"Cascade Ticket {uuid4()}",
+            "description": "Ticket linked to a deleted category",
+            "severity_id": severity["id"],
+            "category_ids": [category["id"]],
+            "subcategory_ids": [subcategory["id"]],
+            "status": "aberto",
+        },
+        headers=headers,
+    )
+    assert ticket_response.status_code == 201
+
+    response = client.delete(url=f"/api/v1/categories/?category_id={category['id']}", headers=headers)
+    assert response.status_code == 202
+
+    assert client.get(f"/api/v1/subcategories/{subcategory['id']}", headers=headers).status_code == 404
+    ticket = client.get(f"/api/v1/tickets/{ticket_response.json()['id']}", headers=headers).json()
+    assert ticket["categories"] == []
+    assert ticket["version"] == ticket_response.json()["version"] + 1
+
+    db = SessionLocal()
+    try:
+        event = db.scalars(select(TicketEvent).where(TicketEvent.ticket_id == ticket["id"], TicketEvent.event_type == "updated")).one()
+        assert event.version == ticket["version"]
+        assert event.data == {"category_ids": [], "subcategory_ids": []}
+    finally:
+        db.close()
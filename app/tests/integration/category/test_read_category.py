@@ -76,3 +76,73 @@ def test_read_all_categories_unauthorized():
     """
     response = client.get("/api/v1/categories/")
     assert response.status_code == 401
+
+
+def test_read_category_tree_with_counts(access_token, ticket):
+    """
+    Test reading the category tree with ticket counts.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Dictionary containing information about a created ticket.
+
+    Test steps:
+    1. Read the categories with their subcategories and ticket counts.
+    2. Verify every category and subcategory carries open and total counts.
+    3. Resolve the ticket and verify its category has one open ticket less and the same total.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    category_id = ticket["categories"][0]["id"]
+
+    response = client.get("/api/v1/categories/", params={"include": "subcategories,counts"}, headers=headers)
+    assert response.status_code == 200
+    tree = response.json()
+    for category in tree:
+        assert 0 <= category["open_tickets"] <= category["total_tickets"]
+        for subcategory in category["subcategories"]:
+            assert 0 <= subcategory["open_tickets"] <= subcategory["total_tickets"]
+    before = next(category for category in tree if category["id"] == category_id)
+    assert before["open_tickets"] >= 1
+
+    response = client.patch(f"/api/v1/tickets/{ticket['id']}", json={"status": "resolvido"}, headers=headers)
+    assert response.status_code == 200
+
+    response = client.get("/api/v1/categories/", params={"include": "counts"}, headers=headers)
+    assert response.status_code == 200
+    after = next(category for category in response.json() if category["id"] == category_id)
+    assert "subcategories" not in after
+    assert after["open_tickets"] == before["open_tickets"] - 1
+    assert after["total_tickets"] == before["total_tickets"]
+
+
+def test_read_categories_default_include(access_token):
+    """
+    Test that categories include their subcategories and no counts by default.
+
+    Args:
+        access_token (str): The access token for authorization.
+
+    Test steps:
+    1. Send a request to retrieve all categories without the include parameter.
+    2. Verify every category has a subcategories list and no ticket counts.
+    """
+    response = client.get("/api/v1/categories/", headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == 200
+    for category in response.json():
+        assert isinstance(category["subcategories"], list)
+        assert "total_tickets" not in category
+
+
+def test_read_categories_unknown_include(access_token):
+    """
+    Test reading categories with an unknown include.
+
+    Args:
+        access_token (str): The access token for authorization.
+
+    Test steps:
+    1. Send a request with an include value that is not supported.
+    2. Verify the response status code, expecting 400 (Bad Request).
+    """
+    response = client.get("/api/v1/categories/", params={"include": "tickets"}, headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == 400
@@ -0,0 +1,110 @@
+"""
+Tests for the API endpoints related to debugging,
+specifically focusing on the recent traces and slow queries.
+"""
+
+from sqlalchemy import text
+from app.infrastructure.database import SessionLocal
+from app.infrastructure.database.slow_queries import slow_query_log
+from app.tests import create_client
+
+client = create_client()
+
+
+def test_read_trace_of_ticket_request(access_token, ticket):
+    """
+    Test that a ticket request is traced down to its controller method and SQL statements.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Dictionary containing information about the created ticket.
+
+    Test steps:
+    1. Send a request to fetch the ticket by ID and read its trace ID from the traceparent header.
+    2. Send a request to retrieve the recent traces.
+    3. Verify that the trace of the ticket request holds the route, controller and database spans.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    response = client.get(f"/api/v1/tickets/{ticket['id']}", headers=headers)
+    assert response.status_code == 200
+    trace_id = response.headers["traceparent"].split("-")[1]
+
+    response = client.get("/api/v1/debug/traces", params={"limit": 500}, headers=headers)
+    assert response.status_code == 200
+    trace = next(trace for trace in response.json() if trace["traceId"] == trace_id)
+    names = [span["name"] for span in trace["spans"]]
+    assert trace["name"] == "GET /api/v1/tickets/{ticket_id}"
+    assert "TicketController.show" in names
+    assert any(name.startswith("db ") for name in names)
+
+
+def test_read_slow_queries_with_plans(access_token, ticket):
+    """
+    Test that slow statements are listed with their call site and a sampled plan.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Dictionary containing information about the created ticket.
+
+    Test steps:
+    1. Record every statement as slow and explain every SELECT.
+    2. Send a request to fetch the ticket by ID.
+    3. Send a request to retrieve the slow statements and verify the ticket lookup is listed with its plan.
+    4. Send a request to clear the slow statements and verify none are left.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    threshold_ms, sample_rate = slow_query_log.threshold_ms, slow_query_log.explain_sample_rate
+    slow_query_log.threshold_ms, slow_query_log.explain_sample_rate = 0, 1
+    try:
+        response = client.get(f"/api/v1/tickets/{ticket['id']}", headers=headers)
+        assert response.status_code == 200
+    finally:
+        slow_query_log.threshold_ms, slow_query_log.explain_sample_rate = threshold_ms, sample_rate
+
+    response = client.get("/api/v1/debug/slow-queries", params={"limit": 500, "order_by": "count"}, headers=headers)
+    assert response.status_code == 200
+    entries = [entry for entry in response.json() if "FROM tickets" in entry["fingerprint"] and entry["plan"]]
+    assert entries
+    assert any("ticket_controller.py" in site for entry in entries for site in entry["call_sites"])
+    assert entries[0]["plan"][0]["Plan"]["Node Type"]
+
+    response = client.delete("/api/v1/debug/slow-queries", headers=headers)
+    assert response.status_code == 204
+    assert client.get("/api/v1/debug/slow-queries", headers=headers).json() == []
+
+
+def test_explained_statements_have_no_lasting_effects():
+    """
+    Test that running slow statements again to capture their plan does not repeat their effects.
+
+    Test steps:
+    1. Record every statement as slow and explain every SELECT.
+    2. Take and release a session advisory lock, and append to a setting from a SELECT.
+    3. Verify that no advisory lock is left and that the setting was appended to once.
+    """
+    threshold_ms, sample_rate = slow_query_log.threshold_ms, slow_query_log.explain_sample_rate
+    slow_query_log.threshold_ms, slow_query_log.explain_sample_rate = 0, 1
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT pg_advisory_lock(4045)"))
+        db.execute(text("SELECT pg_advisory_unlock(4045)"))
+        db.execute(text("SELECT set_config('slow_query.test', coalesce(current_setting('slow_query.test', true), '') || 'x', false)"))
+
+        assert db.scalar(text("SELECT count(*) FROM pg_locks WHERE locktype = 'advisory' AND objid = 4045 AND pid = pg_backend_pid()")) == 0
+        assert db.scalar(text("SELECT current_setting('slow_query.test')")) == "x"
+    finally:
+        db.rollback()
+        db.close()
+        slow_query_log.threshold_ms, slow_query_log.explain_sample_rate = threshold_ms, sample_rate
+
+
+def test_read_traces_without_permission():
+    """
+    Test that the recent traces cannot be read without a token.
+
+    Test steps:
+    1. Send a request to retrieve the recent traces without a token.
+    2. Verify the response status code.
+    """
+    response = client.get("/api/v1/debug/traces")
+    assert response.status_code == 401
@@ -3,6 +3,7 @@ Tests for the API endpoints related to severity,
 specifically focusing on the read/search functionality.
 """
 
+from uuid import uuid4
 from app.tests import create_client
 
 client = create_client()
@@ -71,3 +72,35 @@ def test_read_all_severities_unauthorized():
     """
     response = client.get("/api/v1/severities/")
     assert response.status_code == 401
+
+
+def test_read_all_severities_cached(access_token, severity):
+    """
+    Test that the severity list is served compressed from the cache and refreshed after an update.
+
+    Args:
+        access_token (str): The access token for authorization.
+        severity (dict): Data of the created severity level.
+
+    Test steps:
+    1. Retrieve all severity levels accepting gzip and verify the coding and ETag.
+    2. Send the ETag back in If-None-Match and verify the 304 response.
+    3. Update a severity level and verify the list reflects it with a new ETag.
+    """
+    headers = {"Authorization": f"Bearer {access_token}", "Accept-Encoding": "gzip"}
+    response = client.get("/api/v1/severities/", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/v1/severities/", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    description = f"Cached severity {uuid4()}"
+    response = client.patch(f"/api/v1/severities/{severity['id']}", json={"description": description}, headers=headers)
+    assert response.status_code == 200
+
+    response = client.get("/api/v1/severities/", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert description in [item["description"] for item in response.json()]
@@ -3,6 +3,10 @@ Tests for the API endpoints related to subcategories,
 specifically focusing on the deletion function.
 """
 
+from uuid import uuid4
+from sqlalchemy import select
+from app.infrastructure import TicketEvent
+from app.infrastructure.database import SessionLocal
 from app.tests import create_client
 
 client = create_client()
@@ -58,3 +62,51 @@ def test_delete_subcategory_unauthorized(subcategory_to_delete):
     """
     response = client.delete(url=f"/api/v1/subcategories/{subcategory_to_delete['id']}")
     assert response.status_code == 401
+
+
+def test_delete_subcategory_updates_tickets(access_token, severity, category, subcategory, subcategory_to_delete):
+    """
+    Test deleting a subcategory in use and verify it is removed from the tickets as an update of each ticket.
+
+    Args:
+        access_token (str): The access token for authorization.
+        severity (dict): Data of the severity used by the ticket.
+        category (dict): Data of the category of the subcategories.
+        subcategory (dict): Data of a subcategory the ticket keeps.
+        subcategory_to_delete (dict): Data of the subcategory to delete.
+
+    Test steps:
+    1. Create a ticket linked to both subcategories.
+    2. Delete one subcategory and verify the response status code, expecting 204 (No Content).
+    3. Verify that the ticket keeps the other subcategory and its version was bumped.
+    4. Verify that an "updated" event with the remaining arrays was recorded for the ticket.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    ticket_response = client.post(
+        "/api/v1/tickets/",
+        json={
+            "title": f"Subcategory Ticket {uuid4()}",
+            "description": "Ticket linked to a deleted subcategory",
+            "severity_id": severity["id"],
+            "category_ids": [category["id"]],
+            "subcategory_ids": [subcategory["id"], subcategory_to_delete["id"]],
+            "status": "aberto",
+        },
+        headers=headers,
+    )
+    assert ticket_response.status_code == 201
+
+    response = client.delete(url=f"/api/v1/subcategories/{subcategory_to_delete['id']}", headers=headers)
+    assert response.status_code == 204
+
+    ticket = client.get(f"/api/v1/tickets/{ticket_response.json()['id']}", headers=headers).json()
+    assert [sub["id"] for cat in ticket["categories"] for sub in cat["subcategories"]] == [subcategory["id"]]
+    assert ticket["version"] == ticket_response.json()["version"] + 1
+
+    db = SessionLocal()
+    try:
+        event = db.scalars(select(TicketEvent).where(TicketEvent.ticket_id == ticket["id"], TicketEvent.event_type == "updated")).one()
+        assert event.version == ticket["version"]
+        assert event.data == {"category_ids": [category["id"]], "subcategory_ids": [subcategory["id"]]}
+    finally:
+        db.close()
@@ -0,0 +1,121 @@
+"""
+Tests for the archival of resolved tickets and reading them back from the archive.
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+from sqlalchemy import text
+from app.infrastructure.database import SessionLocal
+from app.tests import create_client
+from app.scripts.archive.archive_tickets import TicketArchiver
+
+client = create_client()
+
+
+def test_archived_ticket_is_opt_in(access_token, ticket):
+    """
+    Test that an archived ticket leaves the live endpoints and is returned with include_archived.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Data of the created ticket.
+
+    Test steps:
+    1. Resolve the ticket and run the archival job with a cutoff in the future.
+    2. Verify the ticket is no longer returned by default, expecting 404 (Not Found).
+    3. Verify it is returned with include_archived, with its categories and the archival timestamp.
+    4. Verify the ticket list includes it only with include_archived.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    response = client.patch(f"/api/v1/tickets/{ticket['id']}", json={"status": "resolvido"}, headers=headers)
+    assert response.status_code == 200
+
+    assert TicketArchiver(older_than_days=-1, batch_size=2).run() >= 1
+
+    assert client.get(f"/api/v1/tickets/{ticket['id']}", headers=headers).status_code == 404
+
+    response = client.get(f"/api/v1/tickets/{ticket['id']}", params={"include_archived": True}, headers=headers)
+    assert response.status_code == 200
+    archived = response.json()
+    assert archived["archived_at"] is not None
+    assert archived["status"] == "resolvido"
+    assert [category["id"] for category in archived["categories"]] == [category["id"] for category in ticket["categories"]]
+
+    live_ids = {item["id"] for item in client.get("/api/v1/tickets/", headers=headers).json()}
+    all_ids = {item["id"] for item in client.get("/api/v1/tickets/", params={"include_archived": True}, headers=headers).json()}
+    assert ticket["id"] not in live_ids
+    assert ticket["id"] in all_ids
+
+
+def test_archive_moves_rows_out_of_the_default_partition(access_token, ticket):
+    """
+    Test archiving into a month whose rows already landed in the default partition.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Data of the created ticket.
+
+    Test steps:
+    1. Insert an archived ticket of a month without partition, so it lands in the default partition.
+    2. Resolve the ticket, move its creation date to that month and run the archival job.
+    3. Verify both tickets are in the month's partition and the default partition no longer holds them.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    month = {"start": datetime(2001, 1, 1, tzinfo=timezone.utc), "end": datetime(2001, 2, 1, tzinfo=timezone.utc)}
+    stray_id = uuid4()
+
+    db = SessionLocal()
+    try:
+        db.execute(
+            text(
+                "INSERT INTO tickets_archive (id, created_at, title, severity_id, status, version) "
+                "VALUES (:id, :created_at, 'Stray archived ticket', :severity_id, 'RESOLVIDO', 1)"
+            ),
+            {"id": stray_id, "created_at": month["start"] + timedelta(days=3), "severity_id": ticket["severity"]["id"]},
+        )
+        db.commit()
+
+        response = client.patch(f"/api/v1/tickets/{ticket['id']}", json={"status": "resolvido"}, headers=headers)
+        assert response.status_code == 200
+        db.execute(
+            text("UPDATE tickets SET created_at = :created_at WHERE id = :id"), {"created_at": month["start"] + timedelta(days=5), "id": ticket["id"]}
+        )
+        db.commit()
+
+        assert TicketArchiver(older_than_days=-1, batch_size=100).run() >= 1
+
+        in_partition = set(db.scalars(text("SELECT id FROM tickets_archive_2001_01")))
+        assert {stray_id, UUID(ticket["id"])} <= in_partition
+        assert not db.scalar(text("SELECT count(*) FROM tickets_archive_default WHERE created_at >= :start AND created_at < :end"), month)
+    finally:
+        db.close()
+
+
+def test_archived_ticket_change_is_not_a_deletion(access_token, ticket):
+    """
+    Test that the change feed reports an archived ticket as archived rather than deleted.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Data of the created ticket.
+
+    Test steps:
+    1. Read the current watermark of the change feed.
+    2. Resolve the ticket and run the archival job.
+    3. Verify the change feed returns the ticket as an archived tombstone, not a deleted one.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    page = {"next": None, "has_more": True}
+    while page["has_more"]:
+        page = client.get("/api/v1/tickets/changes", params={"since": page["next"], "limit": 1000}, headers=headers).json()
+    watermark = page["next"]
+    response = client.patch(f"/api/v1/tickets/{ticket['id']}", json={"status": "resolvido"}, headers=headers)
+    assert response.status_code == 200
+
+    assert TicketArchiver(older_than_days=-1, batch_size=100).run() >= 1
+
+    changes = client.get("/api/v1/tickets/changes", params={"since": watermark, "limit": 1000}, headers=headers).json()["changes"]
+    change = next(change for change in changes if change["ticket_id"] == ticket["id"])
+    assert change["archived"] is True
+    assert change["deleted"] is False
+    assert change["ticket"] is None
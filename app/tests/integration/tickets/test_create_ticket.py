@@ -2,6 +2,14 @@
 Tests for creating tickets via API endpoints.
 """
 
+import hashlib
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+from sqlalchemy import select
+from app.infrastructure import IdempotencyKey
+from app.infrastructure.database import SessionLocal
+from app.schemas import Ticket as SchemaTicket
+from app.scripts.maintenance.purge_expired import purge_expired
 from app.tests import create_client
 
 client = create_client()
@@ -97,3 +105,125 @@ def test_create_ticket_with_invalid_data(access_token):
         headers={"Authorization": f"Bearer {access_token}"},
     )
     assert response.status_code == 422
+
+
+def test_create_ticket_idempotent_retry(access_token, ticket):
+    """
+    Test retrying a ticket creation with the same Idempotency-Key and verify no duplicate is created.
+
+    Args:
+        access_token (str): Access token for authorization.
+        ticket (Ticket): A Ticket object fixture used to pick a valid severity and category.
+
+    Test steps:
+    1. Create a ticket sending an Idempotency-Key header.
+    2. Retry the same request with the same key.
+    3. Verify both responses are 201 (Created) and describe the same ticket.
+    """
+    ticket_data = {
+        "title": f"Idempotent Ticket {uuid4()}",
+        "description": "This is an idempotent test ticket.",
+        "severity_id": ticket["severity"]["id"],
+        "category_ids": [category["id"] for category in ticket["categories"]],
+        "status": "aberto",
+    }
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": str(uuid4())}
+
+    first_response = client.post("/api/v1/tickets/", json=ticket_data, headers=headers)
+    retry_response = client.post("/api/v1/tickets/", json=ticket_data, headers=headers)
+
+    assert first_response.status_code == 201
+    assert retry_response.status_code == 201
+    assert retry_response.json()["id"] == first_response.json()["id"]
+
+
+def test_create_ticket_idempotency_key_reused_with_other_payload(access_token, ticket):
+    """
+    Test reusing an Idempotency-Key with a different payload and verify the response.
+
+    Args:
+        access_token (str): Access token for authorization.
+        ticket (Ticket): A Ticket object fixture used to pick a valid severity and category.
+
+    Test steps:
+    1. Create a ticket sending an Idempotency-Key header.
+    2. Send a different ticket with the same key.
+    3. Verify the response status code, expecting 422 (Unprocessable Entity).
+    """
+    ticket_data = {
+        "title": f"Idempotent Ticket {uuid4()}",
+        "severity_id": ticket["severity"]["id"],
+        "category_ids": [category["id"] for category in ticket["categories"]],
+    }
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": str(uuid4())}
+
+    first_response = client.post("/api/v1/tickets/", json=ticket_data, headers=headers)
+    other_response = client.post("/api/v1/tickets/", json={**ticket_data, "title": f"Other Ticket {uuid4()}"}, headers=headers)
+
+    assert first_response.status_code == 201
+    assert other_response.status_code == 422
+
+
+def test_create_ticket_idempotency_key_scoped_to_caller(access_token, user, ticket):
+    """
+    Test that an Idempotency-Key sent by one user does not replay the response stored for another user.
+
+    Args:
+        access_token (str): Access token for authorization.
+        user (dict): Data of a second user.
+        ticket (Ticket): A Ticket object fixture used to pick a valid severity and category.
+
+    Test steps:
+    1. Create a ticket sending an Idempotency-Key header.
+    2. Send the same request with the same key as another user.
+    3. Verify that the second request is not replayed but rejected as a duplicate title, 409 (Conflict).
+    """
+    other_token = client.post("/api/v1/login/", data={"username": user["username"], "password": "password"}).json()["access_token"]
+    ticket_data = {
+        "title": f"Idempotent Ticket {uuid4()}",
+        "severity_id": ticket["severity"]["id"],
+        "category_ids": [category["id"] for category in ticket["categories"]],
+    }
+    key = str(uuid4())
+
+    first_response = client.post("/api/v1/tickets/", json=ticket_data, headers={"Authorization": f"Bearer {access_token}", "Idempotency-Key": key})
+    other_response = client.post("/api/v1/tickets/", json=ticket_data, headers={"Authorization": f"Bearer {other_token}", "Idempotency-Key": key})
+
+    assert first_response.status_code == 201
+    assert other_response.status_code == 409
+
+
+def test_purge_expired_idempotency_keys(access_token, ticket):
+    """
+    Test that the maintenance script deletes expired idempotency keys and that payloads are not stored as plain digests.
+
+    Args:
+        access_token (str): Access token for authorization.
+        ticket (Ticket): A Ticket object fixture used to pick a valid severity and category.
+
+    Test steps:
+    1. Create a ticket sending an Idempotency-Key header.
+    2. Verify that the stored fingerprint is not the unkeyed SHA-256 of the payload.
+    3. Expire the key and run the purge.
+    4. Verify that the key was deleted.
+    """
+    key = str(uuid4())
+    response = client.post(
+        "/api/v1/tickets/",
+        json={"title": f"Purged Ticket {uuid4()}", "severity_id": ticket["severity"]["id"], "category_ids": [ticket["categories"][0]["id"]]},
+        headers={"Authorization": f"Bearer {access_token}", "Idempotency-Key": key},
+    )
+    assert response.status_code == 201
+
+    db = SessionLocal()
+    try:
+        record = db.scalars(select(IdempotencyKey).where(IdempotencyKey.key == key)).one()
+        payload = SchemaTicket.model_validate_json(response.request.content).model_dump_json()
+        assert record.request_hash != hashlib.sha256(payload.encode()).hexdigest()
+        record.expires_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+        db.commit()
+
+        assert purge_expired(db)["idempotency_keys"] >= 1
+        assert db.scalars(select(IdempotencyKey).where(IdempotencyKey.key == key)).first() is None
+    finally:
+        db.close()
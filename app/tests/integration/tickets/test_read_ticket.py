@@ -2,6 +2,7 @@
 Tests for the API endpoints related to tickets.
 """
 
+from uuid import uuid4
 from app.tests import create_client
 
 client = create_client()
@@ -83,3 +84,73 @@ def test_read_all_tickets(access_token):
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
+
+
+def test_filter_tickets_by_category(access_token, severity, category, subcategory):
+    """
+    Test filtering the ticket list by category and subcategory.
+
+    Args:
+        access_token (str): The access token for authorization.
+        severity (dict): Data of the severity used by the ticket.
+        category (dict): Data of the category of the ticket.
+        subcategory (dict): Data of the subcategory of the ticket.
+
+    Test steps:
+    1. Create a ticket in a new category and subcategory.
+    2. Verify filtering by the category and by the subcategory returns only that ticket.
+    3. Delete the subcategory and verify the subcategory filter no longer matches the ticket.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    response = client.post(
+        "/api/v1/tickets/",
+        json={
+            "title": f"Filtered Ticket {uuid4()}",
+            "severity_id": severity["id"],
+            "category_ids": [category["id"]],
+            "subcategory_ids": [subcategory["id"]],
+        },
+        headers=headers,
+    )
+    assert response.status_code == 201
+    ticket_id = response.json()["id"]
+
+    for params in ({"category_id": category["id"]}, {"subcategory_id": subcategory["id"]}):
+        response = client.get("/api/v1/tickets/", params=params, headers=headers)
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()] == [ticket_id]
+
+    assert client.delete(f"/api/v1/subcategories/{subcategory['id']}", headers=headers).status_code == 204
+    response = client.get("/api/v1/tickets/", params={"subcategory_id": subcategory["id"]}, headers=headers)
+    assert response.status_code == 200
+    assert response.json() == []
+    assert client.get(f"/api/v1/tickets/{ticket_id}", headers=headers).json()["categories"][0]["subcategories"] == []
+
+
+def test_read_ticket_after_update(access_token, ticket):
+    """
+    Test that a cached ticket document is refreshed when the ticket is updated.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Data of the created ticket.
+
+    Test steps:
+    1. Read the ticket twice and verify the same ETag is returned.
+    2. Update the ticket's title.
+    3. Read the ticket again and verify the new title and ETag.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    first = client.get(f"/api/v1/tickets/{ticket['id']}", headers=headers)
+    second = client.get(f"/api/v1/tickets/{ticket['id']}", headers=headers)
+    assert first.status_code == second.status_code == 200
+    assert first.headers["ETag"] == second.headers["ETag"]
+
+    updated_title = f"Cached Ticket {uuid4()}"
+    response = client.patch(f"/api/v1/tickets/{ticket['id']}", json={"title": updated_title}, headers=headers)
+    assert response.status_code == 200
+
+    response = client.get(f"/api/v1/tickets/{ticket['id']}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["title"] == updated_title
+    assert response.headers["ETag"] != first.headers["ETag"]
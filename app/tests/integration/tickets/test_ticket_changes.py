@@ -0,0 +1,86 @@
+"""
+Tests for the incremental ticket sync endpoint.
+"""
+
+from app.tests import create_client
+
+client = create_client()
+
+
+def _latest_watermark(access_token):
+    since = None
+    while True:
+        params = {"limit": 1000, **({"since": since} if since else {})}
+        response = client.get("api/v1/tickets/changes", params=params, headers={"Authorization": f"Bearer {access_token}"})
+        assert response.status_code == 200
+        page = response.json()
+        since = page["next"]
+        if not page["has_more"]:
+            return since
+
+
+def test_ticket_changes_since_watermark(access_token, ticket, ticket_to_delete):
+    """
+    Test that only the tickets changed after a watermark are returned, with tombstones for deletions.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Dictionary containing information about the ticket to update.
+        ticket_to_delete (dict): Dictionary containing information about the ticket to delete.
+
+    Test steps:
+    1. Read the changes until the latest watermark.
+    2. Update one ticket twice and delete another.
+    3. Read the changes since the watermark.
+    4. Verify the updated ticket is returned once with its current state and the deleted one as a tombstone.
+    5. Verify polling again with the new watermark returns no changes.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    since = _latest_watermark(access_token)
+
+    for title in ["Synced Ticket", "Synced Ticket Renamed"]:
+        response = client.patch(f"api/v1/tickets/{ticket['id']}", json={"title": f"{title} {ticket['id']}"}, headers=headers)
+        assert response.status_code == 200
+    response = client.delete(f"api/v1/tickets/?ticket_id={ticket_to_delete['id']}", headers=headers)
+    assert response.status_code == 202
+
+    response = client.get("api/v1/tickets/changes", params={"since": since}, headers=headers)
+    assert response.status_code == 200
+    page = response.json()
+    changes = {change["ticket_id"]: change for change in page["changes"]}
+    assert len(page["changes"]) == 2
+    assert changes[ticket["id"]]["deleted"] is False
+    assert changes[ticket["id"]]["ticket"]["title"] == f"Synced Ticket Renamed {ticket['id']}"
+    assert changes[ticket_to_delete["id"]]["deleted"] is True
+    assert changes[ticket_to_delete["id"]]["ticket"] is None
+
+    response = client.get("api/v1/tickets/changes", params={"since": page["next"]}, headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"changes": [], "next": page["next"], "has_more": False}
+
+
+def test_ticket_changes_invalid_watermark(access_token):
+    """
+    Test reading changes with a malformed watermark.
+
+    Args:
+        access_token (str): The access token for authorization.
+
+    Test steps:
+    1. Send a request with a watermark that is not a change sequence position.
+    2. Verify the response status code, expecting 400 (Bad Request).
+    """
+    response = client.get("api/v1/tickets/changes", params={"since": "yesterday"}, headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == 400
+
+
+def test_ticket_changes_unauthorized():
+    """
+    Test reading changes without authorization.
+
+    Test steps:
+    1. Send a request without providing an access token.
+    2. Verify the response status code, expecting 401 (Unauthorized).
+    """
+    response = client.get("api/v1/tickets/changes")
+    assert response.status_code == 401
@@ -0,0 +1,207 @@
+"""
+Tests for the API endpoints related to ticket comments.
+"""
+
+import requests_mock
+from app.tests import create_client
+
+client = create_client()
+
+
+def test_comments_are_kept_and_paginated(access_token, ticket):
+    """
+    Test that every comment added to a ticket is kept and listed page by page, oldest first.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Data of the created ticket.
+
+    Test steps:
+    1. Add three comments to the ticket, the last one longer than the snippet.
+    2. Verify that the ticket only embeds the comment count and a snippet of the latest comment.
+    3. Read the comments two at a time, following the X-Next-Cursor header.
+    4. Verify that all three comments are returned in order and the last page has no cursor.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    bodies = ["First comment", "Second comment", "A long comment " * 20]
+    for body in bodies:
+        response = client.patch(f"/api/v1/tickets/{ticket['id']}", json={"comment": body, "comment_user": "agent@example.com"}, headers=headers)
+        assert response.status_code == 200
+
+    shown = response.json()
+    assert shown["comment_count"] == 3
+    assert shown["comment_user"] == "agent@example.com"
+    assert shown["comment"].endswith("...") and len(shown["comment"]) < len(bodies[2])
+
+    first_page = client.get(f"/api/v1/tickets/{ticket['id']}/comments", params={"limit": 2}, headers=headers)
+    assert first_page.status_code == 200
+    assert [comment["body"] for comment in first_page.json()] == bodies[:2]
+
+    second_page = client.get(
+        f"/api/v1/tickets/{ticket['id']}/comments", params={"limit": 2, "after": first_page.headers["X-Next-Cursor"]}, headers=headers
+    )
+    assert second_page.status_code == 200
+    assert [comment["body"] for comment in second_page.json()] == bodies[2:]
+    assert "X-Next-Cursor" not in second_page.headers
+
+
+def test_comments_of_ticket_without_comments(access_token, ticket):
+    """
+    Test listing the comments of a ticket that has none.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Data of the created ticket.
+
+    Test steps:
+    1. Send a request to list the comments of the ticket.
+    2. Verify the response status code, expecting 200 (OK), and an empty list.
+    """
+    response = client.get(f"/api/v1/tickets/{ticket['id']}/comments", headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_comments_of_non_existing_ticket(access_token):
+    """
+    Test listing the comments of a non-existent ticket.
+
+    Args:
+        access_token (str): The access token for authorization.
+
+    Test steps:
+    1. Send a request to list the comments of a non-existent ticket.
+    2. Verify the response status code, expecting 404 (Not Found).
+    """
+    response = client.get("/api/v1/tickets/01900000-0000-7000-8000-000000000000/comments", headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == 404
+
+
+def test_comments_with_invalid_cursor(access_token, ticket):
+    """
+    Test listing comments with a malformed cursor.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Data of the created ticket.
+
+    Test steps:
+    1. Send a request to list the comments of the ticket with a malformed cursor.
+    2. Verify the response status code, expecting 400 (Bad Request).
+    """
+    response = client.get(
+        f"/api/v1/tickets/{ticket['id']}/comments", params={"after": "not-a-cursor"}, headers={"Authorization": f"Bearer {access_token}"}
+    )
+    assert response.status_code == 400
+
+
+def test_add_comments_to_many_tickets(access_token, ticket, ticket_to_delete):
+    """
+    Test adding comments to several tickets with one request and one fetch of the comment corpus.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Data of the created ticket.
+        ticket_to_delete (dict): Data of another created ticket.
+
+    Test steps:
+    1. Mock the JSONPlaceholder comments with a corpus of two comments.
+    2. Send a request to comment on both tickets and on a non-existent ticket.
+    3. Verify that the corpus was fetched once and only the existing tickets were commented on.
+    4. Verify that the tickets got different comments and that the comments are listed.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    ticket_ids = [ticket["id"], ticket_to_delete["id"]]
+    corpus = [
+        {"postId": 1, "id": 1, "name": "First", "email": "first@example.com", "body": "First\ncomment"},
+        {"postId": 1, "id": 2, "name": "Second", "email": "second@example.com", "body": "Second comment"},
+    ]
+    with requests_mock.Mocker() as mock_request:
+        mock_request.get("https://jsonplaceholder.typicode.com/comments", json=corpus)
+        response = client.post("/api/v1/tickets/add", json={"ticket_ids": ticket_ids + ["01900000-0000-7000-8000-000000000000"]}, headers=headers)
+        assert mock_request.call_count == 1
+
+    assert response.status_code == 200
+    assert response.json()["commented"] == 2
+    assert sorted(response.json()["ticket_ids"]) == sorted(ticket_ids)
+
+    shown = [client.get(f"/api/v1/tickets/{ticket_id}", headers=headers).json() for ticket_id in ticket_ids]
+    assert all(ticket_data["comment_count"] == 1 and ticket_data["version"] == 2 for ticket_data in shown)
+    assert sorted(ticket_data["comment"] for ticket_data in shown) == ["First comment", "Second comment"]
+
+    comments = client.get(f"/api/v1/tickets/{ticket['id']}/comments", headers=headers).json()
+    assert [comment["author"] for comment in comments] == [shown[0]["comment_user"]]
+
+
+def test_add_comments_without_tickets_or_filters(access_token):
+    """
+    Test the batch comment endpoint without ticket IDs or filters.
+
+    Args:
+        access_token (str): The access token for authorization.
+
+    Test steps:
+    1. Send a request with neither ticket IDs nor filters.
+    2. Verify the response status code, expecting 400 (Bad Request).
+    """
+    response = client.post("/api/v1/tickets/add", json={"limit": 10}, headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == 400
+
+
+def test_comment_author_defaults_to_current_user(access_token, ticket):
+    """
+    Test that a comment sent without comment_user is attributed to the current user.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Data of the created ticket.
+
+    Test steps:
+    1. Send a request to comment on the ticket without comment_user.
+    2. Verify that the ticket and its comment name the current user as the author.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    response = client.patch(f"/api/v1/tickets/{ticket['id']}", json={"comment": "Anonymous comment"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["comment_user"] == "sysadmin"
+
+    comments = client.get(f"/api/v1/tickets/{ticket['id']}/comments", headers=headers).json()
+    assert [comment["author"] for comment in comments] == ["sysadmin"]
+
+
+def test_comment_user_without_comment(access_token, ticket):
+    """
+    Test that comment_user is rejected when no comment is sent.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Data of the created ticket.
+
+    Test steps:
+    1. Send a request to update the ticket with comment_user only.
+    2. Verify the response status code, expecting 400 (Bad Request), and that the ticket is unchanged.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    response = client.patch(f"/api/v1/tickets/{ticket['id']}", json={"comment_user": "agent@example.com"}, headers=headers)
+    assert response.status_code == 400
+    assert client.get(f"/api/v1/tickets/{ticket['id']}", headers=headers).json()["version"] == ticket["version"]
+
+
+def test_add_comment_to_non_existing_ticket(access_token):
+    """
+    Test adding a JSONPlaceholder comment to a non-existent ticket.
+
+    Args:
+        access_token (str): The access token for authorization.
+
+    Test steps:
+    1. Mock the JSONPlaceholder comments.
+    2. Send a request to comment on a non-existent ticket.
+    3. Verify the response status code, expecting 404 (Not Found), and that no comment was fetched.
+    """
+    with requests_mock.Mocker() as mock_request:
+        mock_request.get("https://jsonplaceholder.typicode.com/comments", json=[{"email": "a@example.com", "body": "A comment"}])
+        response = client.post("/api/v1/tickets/add/01900000-0000-7000-8000-000000000000", headers={"Authorization": f"Bearer {access_token}"})
+        assert mock_request.call_count == 0
+
+    assert response.status_code == 404
@@ -0,0 +1,38 @@
+"""
+Tests for the prebuilt statements of the hot ticket lookups,
+specifically focusing on the reuse of their compiled form.
+"""
+
+from sqlalchemy import event, select
+from app.api.v1.controllers.ticket_controller import CATEGORIES_BY_IDS
+from app.infrastructure import Category
+from app.infrastructure.database import SessionLocal, engine
+
+
+def test_in_lookup_reuses_compiled_statement():
+    """
+    Test that category lookups by lists of different lengths share one compiled statement.
+
+    Test steps:
+    1. Look up categories by one, two and three IDs, recording the compiled cache status of each execution.
+    2. Verify that every lookup after the first one reused the compiled statement.
+    3. Verify that each lookup returned the requested categories.
+    """
+    cache_hits = []
+
+    def record_cache_hit(_conn, _cursor, _statement, _parameters, context, _executemany):
+        cache_hits.append(context.cache_hit.name)
+
+    db = SessionLocal()
+    try:
+        category_ids = list(db.scalars(select(Category.id).order_by(Category.name).limit(3)))
+        event.listen(engine, "before_cursor_execute", record_cache_hit)
+        try:
+            found = [{category.id for category in db.scalars(CATEGORIES_BY_IDS, {"ids": category_ids[:count]})} for count in (1, 2, 3)]
+        finally:
+            event.remove(engine, "before_cursor_execute", record_cache_hit)
+    finally:
+        db.close()
+
+    assert cache_hits[1:] == ["CACHE_HIT", "CACHE_HIT"]
+    assert found == [set(category_ids[:count]) for count in (1, 2, 3)]
@@ -101,3 +101,55 @@ def test_update_ticket_categories_and_subcategories(access_token, ticket, catego
     updated_ticket_data = response.json()
     assert updated_ticket_data["categories"][0]["id"] == category["id"]
     assert updated_ticket_data["categories"][0]["subcategories"][0]["id"] == subcategory["id"]
+
+
+def test_update_ticket_with_stale_version(access_token, ticket):
+    """
+    Test updating a ticket with an outdated If-Match version and verify the response.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Data of the created ticket.
+
+    Test steps:
+    1. Update the ticket sending the ETag of its current version.
+    2. Verify the response status code, expecting 200 (OK), and that the version was bumped.
+    3. Send another update with the original, now stale, ETag.
+    4. Verify the response status code, expecting 412 (Precondition Failed).
+    """
+    stale_etag = f'"{ticket["version"]}"'
+    response = client.patch(
+        f"/api/v1/tickets/{ticket['id']}",
+        json={"description": "First writer wins"},
+        headers={"Authorization": f"Bearer {access_token}", "If-Match": stale_etag},
+    )
+    assert response.status_code == 200
+    assert response.json()["version"] == ticket["version"] + 1
+    assert response.headers["ETag"] == f'"{ticket["version"] + 1}"'
+
+    stale_response = client.patch(
+        f"/api/v1/tickets/{ticket['id']}",
+        json={"description": "Second writer loses"},
+        headers={"Authorization": f"Bearer {access_token}", "If-Match": stale_etag},
+    )
+    assert stale_response.status_code == 412
+
+
+def test_update_ticket_with_stale_version_field(access_token, ticket):
+    """
+    Test updating a ticket with an outdated version field in the body and verify the response.
+
+    Args:
+        access_token (str): The access token for authorization.
+        ticket (dict): Data of the created ticket.
+
+    Test steps:
+    1. Send an update whose version field is older than the ticket's version.
+    2. Verify the response status code, expecting 412 (Precondition Failed).
+    """
+    response = client.patch(
+        f"/api/v1/tickets/{ticket['id']}",
+        json={"description": "Stale body version", "version": ticket["version"] - 1},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 412
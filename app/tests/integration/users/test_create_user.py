@@ -3,6 +3,11 @@ Tests for the API endpoints related to users,
 specifically focusing on the sign up function.
 """
 
+from uuid import uuid4
+import requests_mock
+from sqlalchemy import select
+from app.infrastructure import IdempotencyKey
+from app.infrastructure.database import SessionLocal
 from app.tests import create_client
 
 client = create_client()
@@ -74,3 +79,92 @@ def test_signup_unauthorized():
         },
     )
     assert response.status_code == 401
+
+
+def test_signup_idempotent_retry(access_token):
+    """
+    Test retrying a user creation with the same Idempotency-Key and verify no duplicate is created.
+
+    Args:
+        access_token (str): The access token for authorization.
+
+    Test steps:
+    1. Send a request to sign up a user with an Idempotency-Key header.
+    2. Retry the same request with the same key.
+    3. Verify both responses are 201 (Created) and describe the same user.
+    4. Verify that neither the responses nor the stored response contain the password hash.
+    """
+    user_data = {
+        "name": "Idempotent User",
+        "username": "idempotentuser",
+        "email": "idempotent@example.com",
+        "password": "password",
+        "role": "user",
+    }
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": "idempotent-user-signup"}
+
+    first_response = client.post("/api/v1/users/", json=user_data, headers=headers)
+    retry_response = client.post("/api/v1/users/", json=user_data, headers=headers)
+
+    assert first_response.status_code == 201
+    assert retry_response.status_code == 201
+    assert retry_response.json()["id"] == first_response.json()["id"]
+    assert "password" not in first_response.json() and "password" not in retry_response.json()
+
+    db = SessionLocal()
+    try:
+        record = db.scalars(select(IdempotencyKey).where(IdempotencyKey.key == "idempotent-user-signup")).one()
+        assert "password" not in record.response
+    finally:
+        db.close()
+
+
+def test_create_random_users(access_token):
+    """
+    Test creating random users in batches from one fetch of the external users each.
+
+    Args:
+        access_token (str): The access token for authorization.
+
+    Test steps:
+    1. Mock the JSONPlaceholder users with three users.
+    2. Send a request to create two random users and verify that two users were created with one fetch.
+    3. Send a request to create five random users and verify that only the remaining user was created.
+    4. Send another request and verify the response status code, expecting 409 (Conflict).
+    """
+    suffix = uuid4().hex[:8]
+    corpus = [
+        {"id": index, "name": f"Random {index}", "username": f"random{index}_{suffix}", "email": f"random{index}_{suffix}@example.com"}
+        for index in range(3)
+    ]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    with requests_mock.Mocker() as mock_request:
+        mock_request.get("https://jsonplaceholder.typicode.com/users", json=corpus)
+        first_response = client.post("/api/v1/users/create_random_users", params={"count": 2}, headers=headers)
+        assert mock_request.call_count == 1
+        second_response = client.post("/api/v1/users/create_random_users", params={"count": 5}, headers=headers)
+        third_response = client.post("/api/v1/users/create_random_users", params={"count": 5}, headers=headers)
+
+    assert first_response.status_code == 201
+    assert second_response.status_code == 201
+    created = first_response.json() + second_response.json()
+    assert len(first_response.json()) == 2
+    assert sorted(user["username"] for user in created) == sorted(user["username"] for user in corpus)
+    assert all("password" not in user for user in created)
+    assert third_response.status_code == 409
+
+
+def test_create_random_users_count_bounded_by_external_users(access_token):
+    """
+    Test requesting more random users than the external API has.
+
+    Args:
+        access_token (str): The access token for authorization.
+
+    Test steps:
+    1. Send a request to create more random users than JSONPlaceholder has.
+    2. Verify the response status code, expecting 422 (Unprocessable Entity).
+    """
+    response = client.post("/api/v1/users/create_random_users", params={"count": 11}, headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == 422
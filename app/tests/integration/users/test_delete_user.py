@@ -3,6 +3,7 @@ Tests for the API endpoints related to users,
 specifically focusing on the deletion function.
 """
 
+from uuid import uuid4
 from app.tests import create_client
 
 client = create_client()
@@ -49,3 +50,33 @@ def test_delete_user_unauthorized():
     """
     response = client.delete(url="/api/v1/users/?user_id=uuid")
     assert response.status_code == 401
+
+
+def test_delete_user_revokes_tokens(access_token):
+    """
+    Test that deleting a user rejects the tokens already issued to them.
+
+    Args:
+        access_token (str): The access token for authorization.
+
+    Test steps:
+    1. Create a user and log in as that user.
+    2. Delete the user.
+    3. Verify the user's token is rejected with 401 (Unauthorized).
+    """
+    username = f"deleted_{uuid4().hex[:8]}"
+    response = client.post(
+        "/api/v1/users/",
+        json={"name": "Deleted User", "username": username, "email": f"{username}@example.com", "password": "password", "role": "user"},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+
+    response = client.post("/api/v1/login/", data={"username": username, "password": "password"})
+    assert response.status_code == 200
+    user_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = client.delete(f"/api/v1/users/?user_id={user_id}", headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == 202
+    assert client.get("/api/v1/severities/", headers=user_headers).status_code == 401
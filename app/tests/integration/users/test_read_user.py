@@ -3,6 +3,7 @@ Tests for API endpoints related to users,
 specifically focusing on the read/search functionality.
 """
 
+from uuid import uuid4
 from app.tests import create_client
 
 client = create_client()
@@ -74,3 +75,83 @@ def test_read_all_users_unauthorized():
     """
     response = client.get("/api/v1/users/")
     assert response.status_code == 401
+
+
+def test_read_users_paginated(access_token):
+    """
+    Test reading users page by page with a search filter.
+
+    Args:
+        access_token (str): The access token for authorization.
+
+    Test steps:
+    1. Create three users sharing a unique username prefix.
+    2. Read the users matching the prefix two at a time, following the X-Next-Cursor header.
+    3. Verify every user is returned once, in username order, without the password.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    prefix = f"page_{uuid4().hex[:8]}"
+    for index in range(3):
+        response = client.post(
+            "/api/v1/users/",
+            json={
+                "name": "Paged User",
+                "username": f"{prefix}_{index}",
+                "email": f"{prefix}_{index}@example.com",
+                "password": "password",
+                "role": "user",
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    response = client.get("/api/v1/users/", params={"search": prefix.upper(), "limit": 2}, headers=headers)
+    assert response.status_code == 200
+    first_page = response.json()
+    assert [user["username"] for user in first_page] == [f"{prefix}_0", f"{prefix}_1"]
+    assert all("password" not in user for user in first_page)
+
+    next_cursor = response.headers["X-Next-Cursor"]
+    response = client.get("/api/v1/users/", params={"search": prefix, "limit": 2, "after": next_cursor}, headers=headers)
+    assert response.status_code == 200
+    assert [user["username"] for user in response.json()] == [f"{prefix}_2"]
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_read_users_filtered(access_token, user):
+    """
+    Test filtering users by role and active status.
+
+    Args:
+        access_token (str): The access token for authorization.
+        user (dict): Dictionary containing information about the created user.
+
+    Test steps:
+    1. Send a request for active users with the role of the created user, searching by its username.
+    2. Verify the user is returned.
+    3. Send the same request for inactive users and verify no user is returned.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    params = {"role": user["role"], "active": True, "search": user["username"]}
+    response = client.get("/api/v1/users/", params=params, headers=headers)
+    assert response.status_code == 200
+    assert user["id"] in [listed["id"] for listed in response.json()]
+
+    response = client.get("/api/v1/users/", params={**params, "active": False}, headers=headers)
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_read_users_invalid_cursor(access_token):
+    """
+    Test reading users with a malformed cursor.
+
+    Args:
+        access_token (str): The access token for authorization.
+
+    Test steps:
+    1. Send a request with a cursor that was not returned by the API.
+    2. Verify the response status code, expecting 400 (Bad Request).
+    """
+    response = client.get("/api/v1/users/", params={"after": "not-a-cursor"}, headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == 400
@@ -3,6 +3,7 @@ Tests for the API endpoints related to users,
 specifically focusing on the update function.
 """
 
+from uuid import uuid4
 from app.tests import create_client
 
 client = create_client()
@@ -88,3 +89,62 @@ def test_update_user_unauthorized(user):
         json={"name": updated_name, "username": user["username"], "email": user["email"]},
     )
     assert response.status_code == 401
+
+
+def test_deactivate_user_revokes_tokens(access_token):
+    """
+    Test that deactivating a user rejects the tokens already issued to them, and reactivating accepts them again.
+
+    Args:
+        access_token (str): The access token for authorization.
+
+    Test steps:
+    1. Create a user, log in as that user and verify the token is accepted.
+    2. Deactivate the user and verify the token is rejected with 401 (Unauthorized) and login is refused.
+    3. Reactivate the user and verify the token is accepted again.
+    """
+    username = f"deactivated_{uuid4().hex[:8]}"
+    response = client.post(
+        "/api/v1/users/",
+        json={"name": "Deactivated User", "username": username, "email": f"{username}@example.com", "password": "password", "role": "user"},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+
+    response = client.post("/api/v1/login/", data={"username": username, "password": "password"})
+    assert response.status_code == 200
+    user_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    assert client.get("/api/v1/severities/", headers=user_headers).status_code == 200
+
+    response = client.patch(f"/api/v1/users/{user_id}", json={"active": False}, headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == 200
+    assert response.json()["active"] is False
+    response = client.get("/api/v1/severities/", headers=user_headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+    response = client.post("/api/v1/login/", data={"username": username, "password": "password"})
+    assert response.status_code == 401
+
+    response = client.patch(f"/api/v1/users/{user_id}", json={"active": True}, headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == 200
+    assert client.get("/api/v1/severities/", headers=user_headers).status_code == 200
+
+
+def test_update_user_active_null(access_token, user):
+    """
+    Test that a null ``active`` is rejected rather than stored, as it would not deactivate the user.
+
+    Args:
+        access_token (str): The access token for authorization.
+        user (dict): Dictionary containing information about the created user.
+
+    Test steps:
+    1. Send a request to update the user with ``active`` set to null.
+    2. Verify the response status code, expecting 400 (Bad Request).
+    3. Verify the user is still active.
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    response = client.patch(f"/api/v1/users/{user['id']}", json={"active": None}, headers=headers)
+    assert response.status_code == 400
+    assert client.get(f"/api/v1/users/{user['id']}", headers=headers).json()["active"] is True
@@ -0,0 +1,51 @@
+"""Unit tests for the cached ticket counts of the category tree."""
+
+import unittest
+from unittest.mock import Mock
+from app.api.v1.controllers.category_controller import TicketCountsCache
+from app.infrastructure.events import TICKET_EVENTS_CHANNEL
+
+
+class TestTicketCountsCache(unittest.TestCase):
+    """Unit tests for TicketCountsCache with a mocked database session and notification listener."""
+
+    def setUp(self):
+        """Set up a cache with a long TTL, a mocked listener and a session returning no counts."""
+        self.listener = Mock()
+        self.cache = TicketCountsCache(ttl=3600, listener=self.listener)
+        self.db = Mock()
+        self.db.execute.return_value = []
+
+    def test_counts_are_reused(self):
+        """Test that the counts are queried once and that the listener is subscribed to the ticket events channel."""
+        self.cache.get(self.db)
+        self.cache.get(self.db)
+
+        self.db.execute.assert_called_once()
+        self.listener.subscribe.assert_called_once()
+        self.assertEqual(self.listener.subscribe.call_args.args[0], TICKET_EVENTS_CHANNEL)
+
+    def test_notification_invalidates(self):
+        """Test that a ticket event notification, or a listener reconnect, makes the next request query the counts again."""
+        self.cache.get(self.db)
+        on_notification = self.listener.subscribe.call_args.args[1]
+
+        on_notification("42")
+        self.cache.get(self.db)
+        on_notification(None)
+        self.cache.get(self.db)
+
+        self.assertEqual(self.db.execute.call_count, 3)
+
+    def test_counts_read_during_invalidation_are_not_stored(self):
+        """Test that counts queried while an invalidation arrives are returned but not reused."""
+
+        def execute(_statement):
+            self.cache.invalidate()
+            return []
+
+        self.db.execute.side_effect = execute
+        self.assertEqual(self.cache.get(self.db), {})
+        self.cache.get(self.db)
+
+        self.assertEqual(self.db.execute.call_count, 2)
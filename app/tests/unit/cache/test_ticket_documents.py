@@ -0,0 +1,77 @@
+"""Unit tests for the rendered ticket document cache."""
+
+import unittest
+from unittest.mock import Mock
+from uuid import uuid4
+from app.infrastructure.cache import LRUBackend, TicketDocumentCache, TICKET_CACHE_CHANNEL
+
+
+class TestTicketDocumentCache(unittest.TestCase):
+    """Unit tests for TicketDocumentCache backed by the in-process LRU backend."""
+
+    def setUp(self):
+        """Set up a small cache with a mocked notification listener."""
+        self.listener = Mock()
+        self.cache = TicketDocumentCache(LRUBackend(max_size=2), self.listener, tracked_invalidations=2)
+        self.ticket_id = uuid4()
+
+    def test_put_and_get(self):
+        """Test that a stored document is returned with its version and that the listener is subscribed once."""
+        self.assertIsNone(self.cache.get(self.ticket_id))
+        self.cache.put(self.ticket_id, 3, b'{"title": "a b"}', self.cache.token())
+
+        self.assertEqual(self.cache.get(self.ticket_id), (3, b'{"title": "a b"}'))
+        self.listener.subscribe.assert_called_once()
+        self.assertEqual(self.listener.subscribe.call_args.args[0], TICKET_CACHE_CHANNEL)
+
+    def test_stale_document_is_not_stored(self):
+        """Test that a document read before an invalidation of its ticket is discarded."""
+        token = self.cache.token()
+        self.cache.invalidate([self.ticket_id])
+        self.cache.put(self.ticket_id, 1, b"{}", token)
+
+        self.assertIsNone(self.cache.get(self.ticket_id))
+
+    def test_other_ticket_invalidation_keeps_document(self):
+        """Test that invalidating another ticket does not discard the document."""
+        token = self.cache.token()
+        self.cache.invalidate([uuid4()])
+        self.cache.put(self.ticket_id, 1, b"{}", token)
+
+        self.assertEqual(self.cache.get(self.ticket_id), (1, b"{}"))
+
+    def test_forgotten_invalidation_discards_older_reads(self):
+        """Test that once a per-ticket invalidation is no longer tracked, documents read before it are discarded."""
+        token = self.cache.token()
+        self.cache.invalidate([self.ticket_id])
+        self.cache.invalidate([uuid4(), uuid4()])
+        self.cache.put(self.ticket_id, 1, b"{}", token)
+
+        self.assertIsNone(self.cache.get(self.ticket_id))
+
+    def test_notification_invalidates(self):
+        """Test that notifications drop the listed tickets, and reconnects drop every ticket."""
+        other_id = uuid4()
+        self.cache.put(self.ticket_id, 1, b"{}", self.cache.token())
+        self.cache.put(other_id, 1, b"{}", self.cache.token())
+        self.assertIsNotNone(self.cache.get(self.ticket_id))
+        on_notification = self.listener.subscribe.call_args.args[1]
+
+        on_notification(str(self.ticket_id))
+        self.assertIsNone(self.cache.get(self.ticket_id))
+        self.assertIsNotNone(self.cache.get(other_id))
+
+        on_notification(None)
+        self.assertIsNone(self.cache.get(other_id))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used document is evicted first."""
+        first, second, third = uuid4(), uuid4(), uuid4()
+        for ticket_id in (first, second):
+            self.cache.put(ticket_id, 1, b"{}", self.cache.token())
+        self.cache.get(first)
+        self.cache.put(third, 1, b"{}", self.cache.token())
+
+        self.assertIsNotNone(self.cache.get(first))
+        self.assertIsNone(self.cache.get(second))
+        self.assertIsNotNone(self.cache.get(third))
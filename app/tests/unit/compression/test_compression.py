@@ -0,0 +1,113 @@
+"""Unit tests for content-coding negotiation and the compression middleware."""
+
+import gzip
+import unittest
+import zlib
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+from app.api.compression import CompressionMiddleware
+from app.core.compression.encodings import StreamCompressor, negotiate_encoding
+
+
+class TestNegotiateEncoding(unittest.TestCase):
+    """Unit tests for negotiate_encoding."""
+
+    def test_missing_header(self):
+        """Test that no header means no compression."""
+        self.assertEqual(negotiate_encoding(None), "identity")
+        self.assertEqual(negotiate_encoding(""), "identity")
+
+    def test_gzip(self):
+        """Test that gzip is chosen when it is the only supported coding accepted."""
+        self.assertEqual(negotiate_encoding("deflate, gzip"), "gzip")
+        self.assertEqual(negotiate_encoding("GZIP;q=0.5"), "gzip")
+
+    def test_refused_codings(self):
+        """Test that codings with q=0, or not listed when * is refused, are never chosen."""
+        self.assertEqual(negotiate_encoding("gzip;q=0"), "identity")
+        self.assertEqual(negotiate_encoding("*;q=0"), "identity")
+        self.assertEqual(negotiate_encoding("deflate"), "identity")
+
+    def test_wildcard(self):
+        """Test that a wildcard accepts the supported codings."""
+        self.assertNotEqual(negotiate_encoding("*"), "identity")
+
+
+class TestStreamCompressor(unittest.TestCase):
+    """Unit tests for StreamCompressor."""
+
+    def test_chunks_are_decodable_as_they_arrive(self):
+        """Test that every flushed chunk decodes on its own and the stream ends as valid gzip."""
+        compressor = StreamCompressor("gzip")
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        first = compressor.compress(b'{"id": 1}\n')
+        self.assertEqual(decoder.decompress(first), b'{"id": 1}\n')
+
+        stream = first + compressor.compress(b'{"id": 2}\n') + compressor.finish()
+        self.assertEqual(gzip.decompress(stream), b'{"id": 1}\n{"id": 2}\n')
+
+
+class TestCompressionMiddleware(unittest.TestCase):
+    """Unit tests for CompressionMiddleware."""
+
+    def setUp(self):
+        """Set up an application with small, large, streamed and precompressed responses."""
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+        @app.get("/small")
+        def small():
+            return PlainTextResponse("x" * 10)
+
+        @app.get("/large")
+        def large():
+            return PlainTextResponse("x" * 1000, headers={"ETag": '"1"'})
+
+        @app.get("/stream")
+        def stream():
+            return StreamingResponse(iter([b"a" * 10, b"b" * 10]), media_type="text/plain")
+
+        @app.get("/encoded")
+        def encoded():
+            return Response(gzip.compress(b"y" * 1000), media_type="text/plain", headers={"Content-Encoding": "gzip"})
+
+        @app.get("/binary")
+        def binary():
+            return Response(b"z" * 1000, media_type="application/octet-stream")
+
+        self.client = TestClient(app)
+        self.headers = {"Accept-Encoding": "gzip"}
+
+    def test_small_body_is_not_compressed(self):
+        """Test that bodies under the threshold are sent as they are."""
+        response = self.client.get("/small", headers=self.headers)
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(response.text, "x" * 10)
+
+    def test_large_body_is_compressed(self):
+        """Test that large bodies are compressed with a weak ETag and a Vary header."""
+        response = self.client.get("/large", headers=self.headers)
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.headers["etag"], 'W/"1"')
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+        self.assertLess(int(response.headers["content-length"]), 1000)
+        self.assertEqual(response.text, "x" * 1000)
+
+    def test_identity_is_not_compressed(self):
+        """Test that clients not accepting a supported coding get the body as it is."""
+        response = self.client.get("/large", headers={"Accept-Encoding": "identity"})
+        self.assertNotIn("content-encoding", response.headers)
+
+    def test_stream_is_compressed(self):
+        """Test that streamed bodies are compressed whatever their size."""
+        response = self.client.get("/stream", headers=self.headers)
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.text, "a" * 10 + "b" * 10)
+
+    def test_encoded_and_binary_bodies_pass_through(self):
+        """Test that already encoded and non-textual responses are not compressed again."""
+        response = self.client.get("/encoded", headers=self.headers)
+        self.assertEqual(response.text, "y" * 1000)
+        response = self.client.get("/binary", headers=self.headers)
+        self.assertNotIn("content-encoding", response.headers)
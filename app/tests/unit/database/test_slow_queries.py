@@ -0,0 +1,77 @@
+"""Unit tests for the slow query log."""
+
+import unittest
+from app.infrastructure.database.slow_queries import SlowQueryLog, call_site, fingerprint, is_explainable
+
+
+class TestFingerprint(unittest.TestCase):
+    """Unit tests for fingerprint and call_site."""
+
+    def test_parameters_and_literals_are_replaced(self):
+        """Test that executions with different parameters share one fingerprint."""
+        statement = "SELECT tickets.id FROM tickets\n WHERE tickets.title = %(title_1)s AND tickets.status = 'open' LIMIT 10"
+
+        self.assertEqual(fingerprint(statement), "SELECT tickets.id FROM tickets WHERE tickets.title = ? AND tickets.status = ? LIMIT ?")
+
+    def test_expanded_in_lists_are_collapsed(self):
+        """Test that IN lists of any length share one fingerprint, while identifiers keep their digits."""
+        short = "SELECT categories_1.id FROM categories AS categories_1 WHERE categories_1.id IN (%(id_1_1)s)"
+        long = "SELECT categories_1.id FROM categories AS categories_1 WHERE categories_1.id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)"
+
+        self.assertEqual(fingerprint(short), fingerprint(long))
+        self.assertIn("categories_1.id IN (?)", fingerprint(long))
+
+    def test_only_statements_without_side_effects_are_explainable(self):
+        """Test that locking and side-effecting SELECT statements are never run again under EXPLAIN ANALYZE."""
+        self.assertTrue(is_explainable("SELECT tickets.id FROM tickets WHERE tickets.title = 'for update'"))
+        for statement in (
+            "UPDATE tickets SET version = version + 1",
+            "SELECT tickets.id FROM tickets WHERE tickets.id = %(id)s FOR UPDATE SKIP LOCKED",
+            "SELECT id FROM tickets FOR NO KEY UPDATE",
+            "SELECT id FROM tickets for share",
+            "SELECT pg_advisory_lock(%(key)s)",
+            "SELECT pg_try_advisory_xact_lock(1)",
+            "SELECT pg_notify(%(pg_notify_1)s, %(pg_notify_2)s) AS pg_notify_1",
+            "SELECT nextval('tickets_id_seq')",
+        ):
+            self.assertFalse(is_explainable(statement), statement)
+
+    def test_call_site_is_the_calling_application_code(self):
+        """Test that the call site is the innermost application frame."""
+        self.assertIn("test_slow_queries.py:test_call_site_is_the_calling_application_code:", call_site())
+
+
+class TestSlowQueryLog(unittest.TestCase):
+    """Unit tests for SlowQueryLog."""
+
+    def test_top_fingerprints(self):
+        """Test that executions are aggregated per fingerprint and sorted by the requested statistic."""
+        log = SlowQueryLog(threshold_ms=100)
+        with self.assertLogs("app.infrastructure.database.slow_queries", level="WARNING"):
+            log.record(
+                "SELECT * FROM tickets WHERE title = %(title_1)s", 300, "controllers/ticket_controller.py:create:95", "TicketController.create"
+            )
+            log.record(
+                "SELECT * FROM tickets WHERE title = %(title_2)s", 100, "controllers/ticket_controller.py:create:95", "TicketController.create"
+            )
+            log.record("SELECT * FROM users", 250, None, "UserController.get_all", plan=[{"Plan": {}}])
+
+        by_total = log.top()
+        self.assertEqual([entry["count"] for entry in by_total], [2, 1])
+        self.assertEqual(by_total[0]["total_ms"], 400)
+        self.assertEqual(by_total[0]["mean_ms"], 200)
+        self.assertEqual(by_total[0]["call_sites"], {"controllers/ticket_controller.py:create:95": 2})
+        self.assertEqual(by_total[1]["call_sites"], {"UserController.get_all": 1})
+        self.assertEqual(by_total[1]["plan"], [{"Plan": {}}])
+        self.assertEqual(log.top(order_by="mean_ms")[0]["fingerprint"], "SELECT * FROM users")
+        self.assertEqual(len(log.top(limit=1)), 1)
+
+    def test_least_total_fingerprint_is_dropped(self):
+        """Test that the fingerprint with the least total time is dropped beyond the limit."""
+        log = SlowQueryLog(threshold_ms=100, max_fingerprints=2)
+        with self.assertLogs("app.infrastructure.database.slow_queries", level="WARNING"):
+            log.record("SELECT * FROM tickets", 500)
+            log.record("SELECT * FROM users", 150)
+            log.record("SELECT * FROM categories", 200)
+
+        self.assertEqual([entry["fingerprint"] for entry in log.top()], ["SELECT * FROM tickets", "SELECT * FROM categories"])
@@ -0,0 +1,65 @@
+"""Unit tests for the synthetic data generator."""
+
+import unittest
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from app.scripts.datagen.generate_data import DataGenerator, SEVERITY_WEIGHTS
+
+UNTIL = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _generator(seed: int = 7) -> DataGenerator:
+    generator = DataGenerator(seed, UNTIL, days=365, comment_rate=0.3, batch_size=1000)
+    generator.users = 50
+    generator.severities = [f"severity-{level}" for level in SEVERITY_WEIGHTS]
+    generator.severity_weights = list(SEVERITY_WEIGHTS.values())
+    generator.categories = [(f"category-{index}", [f"subcategory-{index}-{sub}" for sub in range(3)]) for index in range(5)]
+    generator.category_weights = [1 / rank for rank in range(1, 6)]
+    return generator
+
+
+class TestDataGenerator(unittest.TestCase):
+    """Unit tests for DataGenerator."""
+
+    def test_batches_are_reproducible(self):
+        """Test that a batch only depends on the seed and its number."""
+        self.assertEqual(_generator().ticket_rows(1, 3000), _generator().ticket_rows(1, 3000))
+        self.assertNotEqual(_generator().ticket_rows(1, 3000), _generator(seed=8).ticket_rows(1, 3000))
+        self.assertEqual(_generator().user_rows(0, 10), _generator().user_rows(0, 10))
+
+    def test_ticket_rows(self):
+        """Test that ticket rows have time-ordered UUIDv7 keys, valid links, comments and the expected distributions."""
+        tickets, categories, subcategories, comments = _generator().ticket_rows(0, 1000)
+        rows = [line.split("\t") for line in tickets.splitlines()]
+
+        self.assertEqual(len(rows), 1000)
+        ids = [uuid.UUID(row[0]) for row in rows]
+        self.assertTrue(all(ticket_id.version == 7 for ticket_id in ids))
+        created = [datetime.fromisoformat(row[7]) for row in rows]
+        self.assertTrue(UNTIL - timedelta(days=365) <= min(created) and max(created) <= UNTIL)
+        self.assertEqual([int(ticket_id.int >> 80) for ticket_id in ids], [int(timestamp.timestamp() * 1000) for timestamp in created])
+
+        statuses = Counter(row[4] for row in rows)
+        self.assertGreater(statuses["RESOLVIDO"], statuses["ABERTO"] + statuses["EM_PROGRESSO"])
+        severities = Counter(row[3] for row in rows)
+        self.assertEqual(severities.most_common(1)[0][0], "severity-3")
+        self.assertTrue(all(row[6] == "\\N" or row[6].endswith("@example.com") for row in rows))
+        commented = {line.split("\t")[1]: line.split("\t")[3] for line in comments.splitlines()}
+        self.assertEqual(commented, {row[0]: row[6] for row in rows if row[12] == "1"})
+        self.assertTrue(all(row[12] == "0" for row in rows if row[6] == "\\N"))
+
+        linked = {line.split("\t")[0] for line in categories.splitlines()}
+        self.assertEqual(linked, {row[0] for row in rows})
+        for line in subcategories.splitlines():
+            ticket_id, subcategory_id = line.split("\t")
+            self.assertIn(subcategory_id, next(row[11] for row in rows if row[0] == ticket_id))
+
+    def test_user_rows(self):
+        """Test that user rows have unique usernames embedding the seed and share the password hash."""
+        generator = _generator()
+        generator.password_hash = "$2b$12$hash"
+        rows = [line.split("\t") for line in generator.user_rows(0, 10).splitlines()]
+
+        self.assertEqual([row[1] for row in rows], [f"load7_{index:08d}" for index in range(10)])
+        self.assertTrue(all(row[4] == "$2b$12$hash" and row[6] == "user" for row in rows))
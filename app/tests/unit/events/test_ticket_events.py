@@ -0,0 +1,80 @@
+"""Unit tests for the ticket event stream helpers."""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import Mock, patch
+from app.api.v1.routers.tickets import stream_ticket_events
+from app.infrastructure.events import TicketEventBroker, format_sse, parse_cursor
+
+
+class TestParseCursor(unittest.TestCase):
+    """Unit tests for parse_cursor, which reads the Last-Event-ID sent by streaming clients."""
+
+    def test_parse_valid_cursor(self):
+        """Test that a cursor is split into its transaction id and event id."""
+        self.assertEqual(parse_cursor("1234-56"), (1234, 56))
+
+    def test_parse_invalid_cursor(self):
+        """Test that malformed cursors raise a ValueError."""
+        for value in ["", "1234", "abc-1", "1-2-3", "-1-2"]:
+            with self.assertRaises(ValueError):
+                parse_cursor(value)
+
+    def test_cursor_ordering(self):
+        """Test that cursors order by transaction before event id."""
+        self.assertLess(parse_cursor("9-100"), parse_cursor("10-1"))
+
+
+class TestTicketEventSubscription(unittest.TestCase):
+    """Unit tests for the SSE formatting and delivery of ticket events."""
+
+    def setUp(self):
+        """Set up a broker with a mocked notification listener."""
+        self.listener = Mock()
+        self.broker = TicketEventBroker(self.listener)
+
+    @staticmethod
+    def _event(cursor: str, event_type: str = "updated") -> dict:
+        return {"cursor": cursor, "type": event_type, "ticket_id": "b4d0c2e4-5a8e-4f2b-9d3a-1c7e6f0a2b11", "version": 2, "data": {}}
+
+    def test_format_sse(self):
+        """Test that events are serialized with their cursor as the SSE id."""
+        message = format_sse(self._event("10-3", "created"))
+        lines = message.split("\n")
+        self.assertEqual(lines[0], "id: 10-3")
+        self.assertEqual(lines[1], "event: ticket.created")
+        self.assertEqual(json.loads(lines[2][len("data: ") :])["cursor"], "10-3")
+        self.assertTrue(message.endswith("\n\n"))
+
+    def test_stream_skips_replayed_events(self):
+        """Test that live events already sent in the backlog are not sent twice, and None ends the stream."""
+
+        async def collect():
+            subscription = self.broker.subscribe((0, 0))
+            subscription.after = (10, 2)
+            for cursor in ["10-1", "10-2", "11-3"]:
+                subscription.offer(self._event(cursor))
+            subscription.offer(None)
+            return [message async for message in subscription.stream([self._event("10-1"), self._event("10-2")])]
+
+        messages = asyncio.run(collect())
+        self.assertEqual([message.split("\n")[0] for message in messages], ["id: 10-1", "id: 10-2", "id: 11-3"])
+        self.listener.subscribe.assert_called_once()
+
+    def test_stream_response_unsubscribes_when_never_iterated(self):
+        """Test that the subscription of a stream response is removed even if its body was never iterated."""
+        controller = Mock()
+        controller.get_event_backlog.return_value = ([], (0, 0), False)
+
+        async def respond_without_streaming():
+            with patch("app.api.v1.routers.tickets.ticket_event_broker", self.broker), patch.object(
+                self.broker, "unsubscribe", wraps=self.broker.unsubscribe
+            ) as unsubscribe:
+                response = await stream_ticket_events(controller=controller, current_user=Mock(), last_event_id=None)
+                unsubscribe.assert_not_called()
+                await response.background()
+                return unsubscribe
+
+        unsubscribe = asyncio.run(respond_without_streaming())
+        unsubscribe.assert_called_once()
@@ -64,3 +64,22 @@ class TestExternalComment(unittest.TestCase):
             self.assertTrue(isinstance(result["comment_user"], str))
         except HTTPException as e:
             self.fail(f"HTTPException raised unexpectedly: {e.detail}")
+
+    @requests_mock.Mocker()
+    def test_fetch_comment_sample_without_replacement(self, mock_request):
+        """
+        Test that fetch_comment_sample fetches the comments once and uses every comment before reusing one.
+        """
+        mock_data = [
+            {"postId": 1, "id": index, "name": "Name", "email": f"user{index}@example.com", "body": f"Comment {index}"} for index in range(3)
+        ]
+        mock_request.get(self.comment_url, json=mock_data)
+
+        result = External.fetch_comment_sample(7)
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(len(result), 7)
+        for start in (0, 3):
+            self.assertEqual(
+                sorted(comment["comment_user"] for comment in result[start : start + 3]), [f"user{index}@example.com" for index in range(3)]
+            )
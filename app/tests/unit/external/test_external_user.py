@@ -67,3 +67,32 @@ class TestExternalUser(unittest.TestCase):
             self.assertTrue(isinstance(result["username"], str))
         except HTTPException as e:
             self.fail(f"HTTPException raised unexpectedly: {e.detail}")
+
+    @requests_mock.Mocker()
+    def test_fetch_users_success(self, mock_request):
+        """
+        Test fetch_users for successful response.
+        """
+        mock_data = [
+            {"id": 1, "name": "John Doe", "username": "johndoe", "email": "john@example.com", "phone": "1-770-736-8031"},
+            {"id": 2, "name": "Jane Doe", "username": "janedoe", "email": "jane@example.com", "phone": "010-692-6593"},
+        ]
+
+        mock_request.get(self.user_url, json=mock_data)
+
+        result = External.fetch_users()
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(result, [{key: user[key] for key in ("name", "email", "username")} for user in mock_data])
+
+    @requests_mock.Mocker()
+    def test_fetch_users_empty(self, mock_request):
+        """
+        Test fetch_users when the external API returns no users.
+        """
+        mock_request.get(self.user_url, json=[])
+
+        with self.assertRaises(HTTPException) as context:
+            External.fetch_users()
+
+        self.assertEqual(context.exception.status_code, 404)
@@ -1,7 +1,9 @@
 """Unit tests for the Hash class using bcrypt encryption."""
 
 import unittest
+from passlib.hash import bcrypt as passlib_bcrypt
 from app.core import Hash
+from app.core.auth.hashing import build_context
 
 
 class TestHash(unittest.TestCase):
@@ -41,3 +43,37 @@ class TestHash(unittest.TestCase):
         """Test the verify method with an empty password to ensure it returns False."""
         result = Hash.verify("", self.hashed_password)
         self.assertFalse(result)
+
+    def test_needs_update_current_policy(self):
+        """Test that hashes made with the configured policy do not need an update."""
+        self.assertFalse(Hash.needs_update(self.hashed_password))
+
+    def test_verify_and_update_outdated_hash(self):
+        """Test that a hash made with other parameters is verified and replaced by a hash of the current policy."""
+        outdated = passlib_bcrypt.using(rounds=4).hash(self.password)
+        self.assertTrue(Hash.needs_update(outdated))
+
+        verified, new_hash = Hash.verify_and_update(self.password, outdated)
+        self.assertTrue(verified)
+        self.assertFalse(Hash.needs_update(new_hash))
+        self.assertTrue(Hash.verify(self.password, new_hash))
+
+    def test_verify_and_update_wrong_password(self):
+        """Test that an outdated hash is not replaced when the password does not match."""
+        outdated = passlib_bcrypt.using(rounds=4).hash(self.password)
+        self.assertEqual(Hash.verify_and_update(self.wrong_password, outdated), (False, None))
+
+    def test_migrate_to_argon2id(self):
+        """Test that switching the policy to argon2id keeps bcrypt hashes valid and flags them for rehashing."""
+        context = build_context(scheme="argon2", argon2_time_cost=1, argon2_memory_cost=8192, argon2_parallelism=1)
+        self.assertTrue(context.verify(self.password, self.hashed_password))
+        self.assertTrue(context.needs_update(self.hashed_password))
+
+        new_hash = context.hash(self.password)
+        self.assertTrue(new_hash.startswith("$argon2id$"))
+        self.assertFalse(context.needs_update(new_hash))
+
+    def test_unsupported_scheme(self):
+        """Test that an unknown scheme is rejected."""
+        with self.assertRaises(ValueError):
+            build_context(scheme="md5_crypt")
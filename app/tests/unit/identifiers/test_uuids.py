@@ -0,0 +1,48 @@
+"""Unit tests for UUIDv7 generation and ticket identifier validation."""
+
+import time
+import unittest
+import uuid
+from pydantic import TypeAdapter, ValidationError
+from app.core import uuid7, UUID4or7
+
+
+class TestUUID7(unittest.TestCase):
+    """Unit tests for the uuid7 generator."""
+
+    def test_version_and_variant(self):
+        """Test that generated identifiers are RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_timestamp(self):
+        """Test that the leading 48 bits hold the current Unix time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        self.assertTrue(before <= value.int >> 80 <= after + 1)
+
+    def test_monotonic(self):
+        """Test that identifiers generated in a burst are unique and strictly increasing."""
+        values = [uuid7() for _ in range(10000)]
+        self.assertEqual(values, sorted(set(values)))
+
+
+class TestUUID4or7(unittest.TestCase):
+    """Unit tests for the UUID4or7 validation type."""
+
+    def setUp(self):
+        """Set up the validator."""
+        self.adapter = TypeAdapter(UUID4or7)
+
+    def test_accepts_v4_and_v7(self):
+        """Test that random and time-ordered identifiers are accepted."""
+        for value in (uuid.uuid4(), uuid7()):
+            self.assertEqual(self.adapter.validate_python(str(value)), value)
+
+    def test_rejects_other_versions(self):
+        """Test that the nil UUID and other versions are rejected."""
+        for value in ("00000000-0000-0000-0000-000000000000", str(uuid.uuid1())):
+            with self.assertRaises(ValidationError):
+                self.adapter.validate_python(value)
@@ -0,0 +1,102 @@
+"""Unit tests for the structured logging pipeline."""
+
+import json
+import logging
+import sys
+import unittest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.api.request_id import RequestIdMiddleware
+from app.core import request_id_var
+from app.core.logs.logging_setup import JSONFormatter, RateLimitFilter, RequestIdFilter, StructuredQueueHandler
+
+
+def _record(msg: str = "Error updating ticket %s: %s", level: int = logging.ERROR, args=("t1", "boom")) -> logging.LogRecord:
+    return logging.LogRecord("app.test", level, __file__, 1, msg, args, None)
+
+
+class TestJSONFormatter(unittest.TestCase):
+    """Unit tests for JSONFormatter and RequestIdFilter."""
+
+    def test_record_with_request_id_and_extra(self):
+        """Test that a record is rendered as JSON with its request ID and extra fields."""
+        token = request_id_var.set("req-1")
+        try:
+            record = _record()
+            RequestIdFilter().filter(record)
+        finally:
+            request_id_var.reset(token)
+        record.ticket_id = "t1"
+
+        document = json.loads(JSONFormatter().format(record))
+
+        self.assertEqual(document["message"], "Error updating ticket t1: boom")
+        self.assertEqual(document["level"], "ERROR")
+        self.assertEqual(document["logger"], "app.test")
+        self.assertEqual(document["request_id"], "req-1")
+        self.assertEqual(document["ticket_id"], "t1")
+
+    def test_exception_survives_the_queue(self):
+        """Test that the traceback is rendered before the record is queued."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord("app.test", logging.ERROR, __file__, 1, "failed", None, sys.exc_info())
+
+        prepared = StructuredQueueHandler(None).prepare(record)
+        document = json.loads(JSONFormatter().format(prepared))
+
+        self.assertIsNone(prepared.exc_info)
+        self.assertIn("ValueError: boom", document["exception"])
+
+
+class TestRateLimitFilter(unittest.TestCase):
+    """Unit tests for RateLimitFilter."""
+
+    def test_repeated_errors_are_suppressed_and_counted(self):
+        """Test that a burst passes, repeats are dropped and the next record reports them."""
+        rate_limit = RateLimitFilter(logging.WARNING, burst=2, per_minute=0)
+        results = [rate_limit.filter(_record()) for _ in range(5)]
+        self.assertEqual(results, [True, True, False, False, False])
+
+        rate_limit.rate = 1e9
+        record = _record()
+        self.assertTrue(rate_limit.filter(record))
+        self.assertEqual(record.suppressed, 3)
+
+    def test_groups_and_levels(self):
+        """Test that other messages and records below the limited level are not affected."""
+        rate_limit = RateLimitFilter(logging.WARNING, burst=1, per_minute=0)
+        self.assertTrue(rate_limit.filter(_record()))
+        self.assertFalse(rate_limit.filter(_record()))
+        self.assertTrue(rate_limit.filter(_record("Error deleting ticket %s: %s")))
+        self.assertTrue(rate_limit.filter(_record(level=logging.INFO)))
+
+
+class TestRequestIdMiddleware(unittest.TestCase):
+    """Unit tests for RequestIdMiddleware."""
+
+    def setUp(self):
+        """Set up an application returning the request ID seen by the endpoint."""
+        app = FastAPI()
+        app.add_middleware(RequestIdMiddleware)
+
+        @app.get("/")
+        async def endpoint():
+            return {"request_id": request_id_var.get()}
+
+        self.client = TestClient(app)
+
+    def test_request_id_is_generated(self):
+        """Test that a request without an ID gets a new one, in the context and the response header."""
+        response = self.client.get("/")
+        self.assertEqual(response.json()["request_id"], response.headers["X-Request-ID"])
+        self.assertEqual(len(response.headers["X-Request-ID"]), 32)
+
+    def test_request_id_is_propagated(self):
+        """Test that a well-formed incoming ID is kept and a malformed one replaced."""
+        response = self.client.get("/", headers={"X-Request-ID": "edge-123"})
+        self.assertEqual(response.headers["X-Request-ID"], "edge-123")
+
+        response = self.client.get("/", headers={"X-Request-ID": "bad id\n"})
+        self.assertNotEqual(response.headers["X-Request-ID"], "bad id\n")
@@ -0,0 +1,23 @@
+"""Unit tests checking that heavy dependencies stay out of the API's startup imports."""
+
+import json
+import subprocess
+import sys
+import unittest
+from app.scripts.benchmark.startup_benchmark import BUDGET_PATH
+
+
+class TestDeferredImports(unittest.TestCase):
+    """Unit tests for the deferred modules listed in the import budget."""
+
+    def test_app_import_defers_heavy_modules(self):
+        """Test that importing the application in a fresh interpreter imports none of the deferred modules."""
+        with open(BUDGET_PATH, encoding="utf-8") as budget_file:
+            budget = json.load(budget_file)
+
+        script = f"import sys, {budget['module']}; print(' '.join(sorted(name for name in sys.modules if '.' not in name)))"
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+        imported = set(result.stdout.split())
+
+        for module in budget["deferred_modules"]:
+            self.assertNotIn(module, imported)
@@ -0,0 +1,121 @@
+"""Unit tests for request tracing."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.api.tracing import TRACEPARENT_HEADER, TracingMiddleware, parse_traceparent
+from app.core import tracer, traced, traced_methods
+from app.core.tracing.tracer import STATUS_ERROR, InMemoryTraceExporter, Tracer
+
+
+@traced_methods
+class _Controller:
+    def show(self, value):
+        return helper(value)
+
+    def fail(self):
+        raise ValueError("boom")
+
+    @staticmethod
+    def label():
+        return "untraced"
+
+
+@traced("helper")
+def helper(value):
+    return value * 2
+
+
+class TestTracer(unittest.TestCase):
+    """Unit tests for Tracer and InMemoryTraceExporter."""
+
+    def setUp(self):
+        tracer.exporter.clear()
+
+    def test_nested_spans_form_one_trace(self):
+        """Test that spans opened within a span share its trace and are exported when the root ends."""
+        with tracer.start_as_current_span("GET /tickets/{ticket_id}") as root:
+            self.assertEqual(_Controller().show(2), 4)
+            self.assertEqual(tracer.exporter.traces(), [])
+
+        traces = tracer.exporter.traces()
+        self.assertEqual(len(traces), 1)
+        spans = {span["name"]: span for span in traces[0]["spans"]}
+        self.assertEqual(set(spans), {"GET /tickets/{ticket_id}", "_Controller.show", "helper"})
+        self.assertEqual(spans["_Controller.show"]["parentSpanId"], root.span_id)
+        self.assertEqual(spans["helper"]["parentSpanId"], spans["_Controller.show"]["spanId"])
+        self.assertTrue(all(span["traceId"] == root.trace_id for span in spans.values()))
+        self.assertEqual(len(root.trace_id), 32)
+        self.assertEqual(len(root.span_id), 16)
+
+    def test_traced_outside_of_a_trace(self):
+        """Test that decorated functions called outside of a trace do not create traces."""
+        self.assertEqual(_Controller().show(3), 6)
+        self.assertEqual(_Controller.label(), "untraced")
+        self.assertEqual(tracer.exporter.traces(), [])
+
+    def test_exception_is_recorded(self):
+        """Test that an exception marks the span as failed and is re-raised."""
+        with self.assertRaises(ValueError):
+            with tracer.start_as_current_span("request"):
+                _Controller().fail()
+
+        spans = {span["name"]: span for span in tracer.exporter.traces()[0]["spans"]}
+        self.assertEqual(spans["_Controller.fail"]["status"]["code"], STATUS_ERROR)
+        self.assertEqual(spans["_Controller.fail"]["attributes"]["exception.type"], "ValueError")
+
+    def test_slowest_traces_first_and_file_export(self):
+        """Test that traces are returned slowest first, filtered by duration, and appended to the file."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "traces.jsonl")
+            local_tracer = Tracer(InMemoryTraceExporter(max_traces=2, path=path))
+            for name, duration_ns in (("fast", 1_000_000), ("slow", 50_000_000), ("medium", 10_000_000)):
+                with patch("app.core.tracing.tracer.time.perf_counter_ns", side_effect=[0, duration_ns]):
+                    local_tracer.end_span(local_tracer.start_span(name))
+
+            self.assertEqual([trace["name"] for trace in local_tracer.exporter.traces()], ["slow", "medium"])
+            self.assertEqual([trace["name"] for trace in local_tracer.exporter.traces(min_duration_ms=20)], ["slow"])
+            with open(path, encoding="utf-8") as trace_file:
+                self.assertEqual([json.loads(line)["name"] for line in trace_file], ["fast", "slow", "medium"])
+
+
+class TestTracingMiddleware(unittest.TestCase):
+    """Unit tests for TracingMiddleware and parse_traceparent."""
+
+    def setUp(self):
+        tracer.exporter.clear()
+        application = FastAPI()
+        application.add_middleware(TracingMiddleware)
+
+        @application.get("/items/{item_id}")
+        def read_item(item_id: int):
+            return {"item": helper(item_id)}
+
+        self.client = TestClient(application)
+
+    def test_root_span_named_after_the_route(self):
+        """Test that the request span is named after the route template and continues the client's trace."""
+        trace_id, parent_id = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+
+        response = self.client.get("/items/21", headers={TRACEPARENT_HEADER: f"00-{trace_id}-{parent_id}-01"})
+
+        self.assertEqual(response.json(), {"item": 42})
+        trace = tracer.exporter.traces()[0]
+        root = trace["spans"][0]
+        self.assertEqual(trace["traceId"], trace_id)
+        self.assertEqual(root["name"], "GET /items/{item_id}")
+        self.assertEqual(root["parentSpanId"], parent_id)
+        self.assertEqual(root["attributes"]["http.status_code"], 200)
+        self.assertEqual(response.headers[TRACEPARENT_HEADER], f"00-{trace_id}-{root['spanId']}-01")
+        self.assertEqual([span["name"] for span in trace["spans"]], ["GET /items/{item_id}", "helper"])
+
+    def test_parse_traceparent(self):
+        """Test that malformed or all-zero traceparent headers are ignored."""
+        self.assertEqual(parse_traceparent(None), (None, None))
+        self.assertEqual(parse_traceparent("00-abc-def-01"), (None, None))
+        self.assertEqual(parse_traceparent(f"00-{'0' * 32}-00f067aa0ba902b7-01"), (None, None))
+        self.assertEqual(parse_traceparent(f"00-{'a' * 32}-{'b' * 16}-00"), ("a" * 32, "b" * 16))
@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from "react";
-import { fetchCategories, fetchSubcategoriesByCategory } from "../services/api";
+import { fetchCategories } from "../services/api";
 import { Category, Subcategory } from "../types/generalTypes";
 
 interface SelectCategoryModalProps {
@@ -32,21 +32,9 @@ const SelectCategoryModal: React.FC<SelectCategoryModalProps> = ({
   }, []);
 
   useEffect(() => {
-    const loadSubcategories = async () => {
-      if (selectedCategory) {
-        try {
-          const subcategoryData = await fetchSubcategoriesByCategory(
-            selectedCategory
-          );
-          setSubcategories(subcategoryData);
-        } catch (error) {
-          console.error("Erro ao buscar subcategorias:", error);
-        }
-      }
-    };
-
-    loadSubcategories();
-  }, [selectedCategory]);
+    const category = categories.find((cat) => cat.id === selectedCategory);
+    setSubcategories(category ? category.subcategories : []);
+  }, [categories, selectedCategory]);
 
   const handleAddCategory = () => {
     const category = categories.find((cat) => cat.id === selectedCategory);
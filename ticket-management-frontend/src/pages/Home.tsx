@@ -1,6 +1,11 @@
 import React, { useState, useEffect, useRef } from "react";
 import { useNavigate } from "react-router-dom";
-import { fetchTickets, deleteTicket, generateComment } from "../services/api";
+import {
+  fetchTickets,
+  deleteTicket,
+  generateComment,
+  fetchTicketComments,
+} from "../services/api";
 import CreateTicketModal from "../components/CreateTicketModal";
 import EditTicketModal from "../components/EditTicketModal";
 import { capitalizeWords } from "../utils/utils";
@@ -32,10 +37,19 @@ export interface Ticket {
   status: string;
   comment: string;
   comment_user: string;
+  comment_count: number;
   created_at: string;
   updated_at: string;
 }
 
+interface TicketComment {
+  id: string;
+  ticket_id: string;
+  body: string;
+  author: string | null;
+  created_at: string;
+}
+
 const severityColors: { [key: number]: string } = {
   4: "#248c3c",
   3: "#a67e07",
@@ -45,6 +59,8 @@ const severityColors: { [key: number]: string } = {
 const Home: React.FC = () => {
   const [tickets, setTickets] = useState<Ticket[]>([]);
   const [selectedTicket, setSelectedTicket] = useState<Ticket | null>(null);
+  const [comments, setComments] = useState<TicketComment[]>([]);
+  const [commentsCursor, setCommentsCursor] = useState<string | undefined>();
   const [isCreateModalOpen, setIsCreateModalOpen] = useState(false);
   const [isEditModalOpen, setIsEditModalOpen] = useState(false);
   const [isMenuOpen, setIsMenuOpen] = useState(false);
@@ -102,6 +118,29 @@ const Home: React.FC = () => {
     };
   }, []);
 
+  const selectedTicketId = selectedTicket?.id;
+
+  // The ticket only embeds a snippet of its latest comment: read the full history page by page.
+  const loadComments = async (ticketId: string, after?: string) => {
+    try {
+      const page = await fetchTicketComments(ticketId, after);
+      setComments((prevComments) =>
+        after ? [...prevComments, ...page!.comments] : page!.comments
+      );
+      setCommentsCursor(page!.nextCursor);
+    } catch (error) {
+      console.error("Erro ao buscar comentários:", error);
+    }
+  };
+
+  useEffect(() => {
+    setComments([]);
+    setCommentsCursor(undefined);
+    if (selectedTicketId) {
+      loadComments(selectedTicketId);
+    }
+  }, [selectedTicketId]);
+
   const handleCardClick = (ticket: Ticket) => {
     setSelectedTicket(ticket);
   };
@@ -140,8 +179,10 @@ const Home: React.FC = () => {
         ...selectedTicket!,
         comment,
         comment_user,
+        comment_count: selectedTicket!.comment_count + 1,
       };
       setSelectedTicket(updatedTicket);
+      loadComments(id);
 
       setTickets((prevTickets) =>
         prevTickets.map((ticket) =>
@@ -591,15 +632,27 @@ const Home: React.FC = () => {
             <p>
               <strong>Status:</strong> {capitalizeWords(selectedTicket.status)}
             </p>
-            {selectedTicket.comment && (
+            {selectedTicket.comment_count > 0 && (
               <>
-                <p>
-                  <strong>Comentário:</strong> {selectedTicket.comment}
-                </p>
-                <p>
-                  <strong>Usuário do Comentário:</strong>{" "}
-                  {selectedTicket.comment_user}
-                </p>
+                <h3 style={{ color: "#333" }}>
+                  Comentários ({selectedTicket.comment_count}):
+                </h3>
+                {comments.map((comment) => (
+                  <p key={comment.id}>
+                    <strong>{comment.author ?? "Anônimo"}</strong>{" "}
+                    ({new Date(comment.created_at).toLocaleString()}):{" "}
+                    {comment.body}
+                  </p>
+                ))}
+                {commentsCursor && (
+                  <button
+                    onClick={() =>
+                      loadComments(selectedTicket.id, commentsCursor)
+                    }
+                  >
+                    Carregar mais comentários
+                  </button>
+                )}
               </>
             )}
             <p>
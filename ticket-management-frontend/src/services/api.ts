@@ -74,10 +74,17 @@ export const login = async (username: string, password: string) => {
 };
 
 // Users
+// The listing is paginated: follow the X-Next-Cursor header until the last page.
 export const fetchUsers = async () => {
   try {
-    const response = await api.get('/api/v1/users');
-    return response.data;
+    const users: any[] = [];
+    let after: string | undefined;
+    do {
+      const response = await api.get('/api/v1/users', { params: { limit: 500, after } });
+      users.push(...response.data);
+      after = response.headers['x-next-cursor'];
+    } while (after);
+    return users;
   } catch (error) {
     handleApiError(error, 'Erro ao buscar usuários');
   }
@@ -174,6 +181,16 @@ export const generateComment = async (id: string) => {
   }
 };
 
+// The comments are paginated: pass the X-Next-Cursor header of a page to read the next one.
+export const fetchTicketComments = async (id: string, after?: string) => {
+  try {
+    const response = await api.get(`/api/v1/tickets/${id}/comments`, { params: { after } });
+    return { comments: response.data, nextCursor: response.headers['x-next-cursor'] as string | undefined };
+  } catch (error) {
+    handleApiError(error, 'Erro ao buscar comentários');
+  }
+};
+
 // Categories
 export const fetchCategories = async () => {
   try {
@@ -26,6 +26,7 @@ export interface Ticket {
   status: string;
   comment: string;
   comment_user: string;
+  comment_count: number;
   created_at: string;
   updated_at: string;
 }